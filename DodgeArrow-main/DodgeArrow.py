@@ -1,17 +1,14 @@
 import pygame
 import random
 import math
+import os
 import sys
 
-# =========================
-#  기본 초기화
-# =========================
-pygame.init()
-try:
-    pygame.font.init()
-except:
-    pass
+# 상위 폴더의 공용 변환 캐시 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from engine.sprite_cache import sprites
 
+# 창 / 에셋은 import할 때가 아니라 main()의 setup()에서 준비함
 # =========================
 #  화면 / 전투 구역 설정
 # =========================
@@ -19,9 +16,8 @@ F_W, F_H = 1200, 700          # 전체 창 크기
 FIGHT_H = 350                 # 위쪽 전투 구역 높이
 PLAY_H = F_H - FIGHT_H        # 아래쪽 플레이 구역 높이
 
-screen = pygame.display.set_mode((F_W, F_H), pygame.RESIZABLE)
-pygame.display.set_caption("DodgeArrow")
-clock = pygame.time.Clock()
+screen = None
+clock = None
 FPS = 60
 
 WIN_SCORE_THRESHOLD = 50      # 합산 점수 이 이상이면 승리
@@ -44,11 +40,6 @@ INVINCIBLE_1P = False         # True로 두면 1P는 머리에 맞아도 안 죽
 def load_image(path: str):
     return pygame.image.load(path).convert_alpha()
 
-def scale_image(img: pygame.Surface, scale: float):
-    w = int(img.get_width() * scale)
-    h = int(img.get_height() * scale)
-    return pygame.transform.scale(img, (w, h))
-
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))
 
@@ -63,53 +54,23 @@ def vec_normalize(x, y):
 # =========================
 
 # --- 배경 ---
-backgroundOriginal = load_image("./assets/background.png")  # 원본 유지
+BACKGROUND_PATH = "./assets/background.png"  # 원본은 상주시키지 않고 리사이즈 때만 읽음
 backgroundImage = None  # 실제로 그릴 때 쓰는 배경 (리사이즈 후)
 
 # --- 캐릭터 ---
 # 가정: player/1 = 활, player/2 = 검
 # 1P = 검, 2P = 활
-p1_idle_raw = load_image("./assets/player/2/idle.png")                    # 검
-p1_attack_raw = [load_image(f"./assets/player/2/attack{i}.png") for i in range(2)]
-
-p2_idle_raw = load_image("./assets/player/1/idle.png")                    # 활
-p2_attack_raw = [load_image(f"./assets/player/1/attack{i}.png") for i in range(2)]
 
 # ★ 방향 바꾸고 싶으면 여기만 수정하면 됨 ★
 FLIP_P1 = True   # 1P 좌우 반전 여부 (True면 좌우 반전)
 FLIP_P2 = True   # 2P 좌우 반전 여부
 
-# 스케일 먼저
-p1_idle_scaled = scale_image(p1_idle_raw, CHAR_SCALE)
-p1_attack_scaled = [scale_image(img, CHAR_SCALE) for img in p1_attack_raw]
-
-p2_idle_scaled = scale_image(p2_idle_raw, CHAR_SCALE)
-p2_attack_scaled = [scale_image(img, CHAR_SCALE) for img in p2_attack_raw]
-
-# 플래그에 따라 방향 적용
-if FLIP_P1:
-    char1Idle = pygame.transform.flip(p1_idle_scaled, True, False)
-    char1Attack = [pygame.transform.flip(img, True, False) for img in p1_attack_scaled]
-else:
-    char1Idle = p1_idle_scaled
-    char1Attack = p1_attack_scaled
-
-if FLIP_P2:
-    char2Idle = pygame.transform.flip(p2_idle_scaled, True, False)
-    char2Attack = [pygame.transform.flip(img, True, False) for img in p2_attack_scaled]
-else:
-    char2Idle = p2_idle_scaled
-    char2Attack = p2_attack_scaled
+# setup()에서 채움: 1P = 검(player/2), 2P = 활(player/1)
+char1Idle = char1Attack = None
+char2Idle = char2Attack = None
 
 # --- 보스 ---
-boss_idle_raw = load_image("./assets/boss/idle.png")
-boss_idle_scaled = scale_image(boss_idle_raw, BOSS_SCALE)
-
-boss_attack_raw = [load_image(f"./assets/boss/attack{i}.png") for i in range(3)]
-boss_attack_scaled = [scale_image(img, BOSS_SCALE) for img in boss_attack_raw]
-
-bossIdle = boss_idle_scaled
-bossHit = boss_attack_scaled
+bossIdle = bossHit = None
 
 # =========================
 #  전투 구역(위쪽) 애니메이션 상태
@@ -144,10 +105,11 @@ def setCharacterPosition(current_F_W, current_FIGHT_H):
     """
     global backgroundImage, char1Pos, bossPos, char2Pos
 
-    # 배경 스케일 (항상 원본에서)
-    backgroundImage = pygame.transform.scale(
-        backgroundOriginal, (current_F_W, current_FIGHT_H)
-    )
+    # 배경 스케일 (크기가 바뀔 때만 원본을 읽음. 배경은 불투명이라 알파 없이 보관)
+    if backgroundImage is None or backgroundImage.get_size() != (current_F_W, current_FIGHT_H):
+        backgroundImage = pygame.transform.scale(
+            pygame.image.load(BACKGROUND_PATH).convert(), (current_F_W, current_FIGHT_H)
+        )
 
     # 지면 y 위치 (발 닿는 곳)
     ground_y = current_FIGHT_H - FIGHT_GROUND_OFFSET
@@ -174,8 +136,6 @@ def setCharacterPosition(current_F_W, current_FIGHT_H):
     bossPos  = (boss_x  - b_w  // 2, boss_y)
     char2Pos = (char2_x - c2_w // 2, char2_y)
 
-# 처음 한 번 위치 세팅
-setCharacterPosition(F_W, FIGHT_H)
 
 def draw_fight_scene(surf):
     """위쪽 전투 구역 그리기"""
@@ -281,18 +241,9 @@ COLOR_FEATHER = (170, 205, 255)
 COLOR_FEATHER = (170, 205, 255)
 
 # ===== Devil Arrow Sprite =====
-# 파일 이름이 'boss_arrow.png.png'면 아래 그대로 두고,
-# 'boss_arrow.png'로 이름을 바꿨다면 이 경로도 같이 바꿔 주세요.
-DEVIL_ARROW_IMG = pygame.image.load("assets/boss_arrow.png").convert_alpha()
-
-# 게임 화면에 맞게 크기 조절 (원본이 너무 크면 숫자를 줄이세요)
-DEVIL_ARROW_IMG = pygame.transform.smoothscale(DEVIL_ARROW_IMG, (110, 110))
-
-# 원본이 대각선(왼쪽 아래 -> 오른쪽 위) 방향이라
-# 기준 방향을 "오른쪽"으로 맞춰두고, 실제 각도에 맞게 다시 회전해서 씁니다.
-# 화살 이미지 기본 회전값을 오른쪽 방향 기준으로 맞춘 버전
-
-DEVIL_ARROW_BASE = pygame.transform.rotate(DEVIL_ARROW_IMG, -45)
+DEVIL_ARROW_PATH = "assets/boss_arrow.png"
+DEVIL_ARROW_SIZE = (110, 110)  # 게임 화면에 맞게 크기 조절 (원본이 너무 크면 숫자를 줄이세요)
+DEVIL_ARROW_BASE = None        # setup()에서 채움 (오른쪽 방향 기준으로 돌려 둔 화살 이미지)
 
 
 
@@ -802,12 +753,53 @@ def draw_play_scene(surf, play_state):
              score_2p, skill_2p, small_active, remain_ms_2p,
              shield_active)
 
+# =========================
+#  초기화 (창 / 에셋)
+# =========================
+def setup():
+    """창을 열고 에셋을 읽음. import할 때가 아니라 main()에서 한 번 부름"""
+    global screen, clock, char1Idle, char1Attack, char2Idle, char2Attack, bossIdle, bossHit, DEVIL_ARROW_BASE
+
+    pygame.init()
+    try:
+        pygame.font.init()
+    except:
+        pass
+
+    screen = pygame.display.set_mode((F_W, F_H), pygame.RESIZABLE)
+    pygame.display.set_caption("DodgeArrow")
+    clock = pygame.time.Clock()
+
+    # 스케일 + 반전은 캐시가 (경로, 배율, 반전) 별로 한 번만 만듦
+    char1Idle = sprites.get("./assets/player/2/idle.png", CHAR_SCALE, FLIP_P1)           # 검
+    char1Attack = [sprites.get(f"./assets/player/2/attack{i}.png", CHAR_SCALE, FLIP_P1) for i in range(2)]
+
+    char2Idle = sprites.get("./assets/player/1/idle.png", CHAR_SCALE, FLIP_P2)           # 활
+    char2Attack = [sprites.get(f"./assets/player/1/attack{i}.png", CHAR_SCALE, FLIP_P2) for i in range(2)]
+
+    bossIdle = sprites.get("./assets/boss/idle.png", BOSS_SCALE)
+    bossHit = [sprites.get(f"./assets/boss/attack{i}.png", BOSS_SCALE) for i in range(3)]
+
+    # 최종 변형을 다 만들었으니 변형 재료로만 쓴 원본은 놓아줌
+    sprites.release_sources()
+
+    # 원본이 대각선(왼쪽 아래 -> 오른쪽 위) 방향이라 기준 방향을 "오른쪽"으로 맞춰두고,
+    # 실제 각도에 맞게 다시 회전해서 씀
+    devil = pygame.image.load(DEVIL_ARROW_PATH).convert_alpha()
+    devil = pygame.transform.smoothscale(devil, DEVIL_ARROW_SIZE)
+    DEVIL_ARROW_BASE = pygame.transform.rotate(devil, -45)
+
+    # 처음 한 번 위치 세팅
+    setCharacterPosition(F_W, FIGHT_H)
+
 # =========================
 #  메인 루프
 # =========================
 def main():
     global SHOW_HITBOX, last_attack_score_1p, last_attack_score_2p
 
+    setup()
+
     running_global = True
 
     while running_global:
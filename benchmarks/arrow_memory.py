@@ -0,0 +1,63 @@
+"""화살 메모리 벤치마크: 살아 있는 화살 하나당 바이트와 1k / 10k 개일 때 전체 RSS
+
+사용법: python benchmarks/arrow_memory.py [화살 수 ...]   (기본 1000 10000)
+"""
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine.config import F_H, F_W, HUD_H
+from engine.entities import Arrow
+from engine.shapes import arrow_shapes
+from engine.state import Layout
+
+LAYOUT = Layout.for_window(F_W, F_H)
+
+
+def rss_bytes():
+    """현재 RSS. /proc이 없으면 최대 RSS로 대신함"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def make_arrows(n, rng):
+    arrows = []
+    for _ in range(n):
+        origin = (rng.uniform(0, LAYOUT.w), rng.uniform(HUD_H, LAYOUT.h))
+        velocity = (rng.uniform(-1, 1), rng.uniform(-1, 1))
+        arrows.append(Arrow(origin, velocity))
+    return arrows
+
+
+def measure(n, seed=0):
+    rng = random.Random(seed)
+    # 모양은 공유 데이터라 한 번 채워 두고 화살 자체 비용만 잼
+    make_arrows(360, rng)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    arrows = make_arrows(n, rng)
+    gc.collect()
+    per_arrow = (tracemalloc.get_traced_memory()[0] - before) / n
+    tracemalloc.stop()
+    shapes = sum(shape.nbytes() for shape in arrow_shapes.values())
+    return per_arrow, rss_bytes(), len(arrow_shapes), shapes, arrows
+
+
+if __name__ == "__main__":
+    counts = [int(a) for a in sys.argv[1:]] or [1000, 10000]
+    print(f"{'arrows':>8} {'bytes/arrow':>12} {'RSS MB':>9} {'shapes':>7} {'shape KB':>9}")
+    for n in counts:
+        per_arrow, rss, n_shapes, shape_bytes, arrows = measure(n)
+        print(f"{n:>8} {per_arrow:>12.0f} {rss / 2**20:>9.1f} {n_shapes:>7} {shape_bytes / 1024:>9.1f}")
+        del arrows
@@ -0,0 +1,76 @@
+"""프레임 맞추기 비교: 방식마다 같은 장면을 정해진 시간 동안 돌려서 프레임 간격 히스토그램과 CPU 사용률을 보여줌
+
+장면은 기본 모드 한 판 (각본 입력, 죽으면 바로 살림). 프레임 간격은 FramePacer.tick()이 돌아오는 간격.
+CPU는 프로세스 CPU 시간 / 경과 시간 (100%면 한 코어를 다 씀).
+vsync는 창을 vsync로 열어 보고, 드라이버가 지원 안 하면 hybrid로 바뀐 것까지 보여줌 (더미 드라이버는 지원 안 함).
+
+사용법: python benchmarks/frame_pacing.py [방식당 초] [방식 ...]   (기본 10, sleep busy hybrid vsync)
+"""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)   # 에셋 경로가 ./assets 기준
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine import render, rules
+from engine.config import F_H, F_W, FPS, FRAME_COLOR, PACE_HYBRID, PACE_VSYNC
+from engine.game import open_window
+from engine.pacing import PACING_MODES, FramePacer, format_histogram
+from engine.state import Layout, PlayState
+
+
+def run(mode, seconds, seed=0):
+    pygame.init()
+    layout = Layout.for_window(F_W, F_H)
+    screen, vsync_on = open_window(layout, resizable=False, vsync=mode == PACE_VSYNC)
+    fight = render.FightScene()
+    fight.set_layout(layout.f_w, layout.fight_h)
+    state = PlayState(layout, 0, seed=seed)
+    pacer = FramePacer(FPS, mode)
+    if mode == PACE_VSYNC and not vsync_on:
+        pacer.mode, pacer.fallback = PACE_HYBRID, "vsync window failed"
+    rng = random.Random(seed)
+    held = [(0, 0, False)] * layout.lanes
+    now = 0
+    pacer.tick()
+    pacer.stats()   # 창을 열고 에셋을 읽는 동안은 빼고 잼
+    for _ in range(int(seconds * FPS)):
+        now += pacer.tick()
+        pygame.event.pump()
+        for who in range(layout.lanes):
+            if rng.random() < 0.1:
+                held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), False)
+        rules.step(state, held, now)
+        fight.draw(screen.subsurface(pygame.Rect(0, 0, layout.f_w, layout.fight_h)))
+        pygame.draw.line(screen, FRAME_COLOR, (0, layout.fight_h), (layout.f_w, layout.fight_h), 5)
+        play_surf = screen.subsurface(pygame.Rect(0, layout.fight_h, layout.f_w, layout.play_h))
+        render.draw_play_scene(play_surf, layout, state, [], now, "HIGH")
+        pacer.before_present()
+        pygame.display.flip()
+        if state.game_over:
+            state.dead = [False] * layout.lanes
+    stats = pacer.stats()
+    pygame.quit()
+    render.clear_fonts()
+    return stats, pacer.fallback
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    modes = sys.argv[2:] or list(PACING_MODES)
+    results = []
+    for mode in modes:
+        stats, fallback = run(mode, seconds)
+        results.append((mode, stats))
+        print(f"== {mode}" + (f" (-> {stats['mode']}: {fallback})" if fallback else ""))
+        print("\n".join(format_histogram(stats["hist"])))
+    print(f"\ntarget {1000 / FPS:.2f} ms")
+    print(f"{'mode':<8} {'p50':>6} {'p95':>6} {'p99':>6} {'max':>6} {'jitter':>7} {'cpu %':>6}")
+    for mode, s in results:
+        print(f"{mode:<8} {s['p50']:>6.2f} {s['p95']:>6.2f} {s['p99']:>6.2f} {s['max']:>6.2f} {s['jitter']:>7.2f} "
+              f"{s['cpu_pct']:>6.1f}")
@@ -0,0 +1,110 @@
+"""지옥 모드 성능 기준: 각본대로 2분(7200프레임)을 돌려서 한 프레임 예산(16.7ms) 안에 끝난 프레임 비율로 통과/실패
+
+게임 루프와 같은 순서로 한 프레임을 계산함 (이벤트, rules.step, 이펙트, 전투 장면, 피하기 구역 그리기, flip).
+clock.tick 대기는 빼고 작업 시간만 잼. 품질 단계는 가장 높은 단계로 고정 (품질을 낮춰서 통과하지 않도록).
+GC는 게임과 같이 GC_BETWEEN_ROUNDS를 따름.
+입력은 seed로 정해진 각본이고, 화살이 계속 쌓이도록 죽은 플레이어는 바로 살림.
+창은 SDL 더미 드라이버 (CPU만 씀). 실패하면 종료 코드 1.
+--hitbox를 주면 히트박스 외곽선(H키)을 켜고 잼 (QA 스트레스 중 켜 둬도 예산 안인지).
+
+사용법: python benchmarks/hell_gate.py [초] [통과 기준 %] [--hitbox]   (기본 120, 95)
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)   # 에셋 경로가 ./assets 기준
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine import render, rules
+from engine.config import F_H, F_W, FPS, FRAME_COLOR, GC_BETWEEN_ROUNDS, MODE_HELL
+from engine.entities import SlashEffect
+from engine.event_log import EV_PROXIMITY, EV_SCRAPE
+from engine.quality import QualityGovernor
+from engine.state import Layout, PlayState
+
+BUDGET_MS = 1000 / 60
+PASS_PCT = 95.0
+SEED = 0
+
+
+def percentile(sorted_ms, q):
+    return sorted_ms[min(len(sorted_ms) - 1, int(len(sorted_ms) * q))]
+
+
+def run(frames, seed=SEED, show_hitbox=False):
+    """프레임마다 (전체 ms, step ms, 그리기 ms, 화살 수)"""
+    pygame.init()
+    layout = Layout.for_window(F_W, F_H)
+    screen = pygame.display.set_mode((layout.f_w, layout.f_h))
+    fight = render.FightScene()
+    fight.set_layout(layout.f_w, layout.fight_h)
+    # record()를 부르지 않으므로 가장 높은 단계에 머묾
+    quality = QualityGovernor(BUDGET_MS)
+    state = PlayState(layout, 0, seed=seed, mode=MODE_HELL)
+    if GC_BETWEEN_ROUNDS:
+        gc.freeze()
+        gc.disable()
+    rng = random.Random(seed)
+    held = [(0, 0, False)] * layout.lanes
+    effects = []
+    dt = 1000 // FPS
+    samples = []
+    for frame in range(1, frames + 1):
+        for who in range(layout.lanes):
+            if rng.random() < 0.1:
+                held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.02)
+
+        start = time.perf_counter()
+        pygame.event.pump()
+        happened = rules.step(state, held, frame * dt, feathers=quality.tier.arrow_feathers)
+        stepped = time.perf_counter()
+        for ef in effects:
+            ef.update()
+        effects = [e for e in effects if e.alive]
+        for kind, who, x, y, vx, vy, value in happened:
+            if kind == EV_SCRAPE and quality.allow_effect(len(effects)):
+                effects.append(SlashEffect((int(x), int(y))))
+            elif kind == EV_PROXIMITY and quality.allow_effect(len(effects)):
+                player = state.players[who]
+                effects.append(SlashEffect((player.x, player.y)))
+        fight.try_attack(state.team_scores())
+        fight.tick(dt)
+        drawn = time.perf_counter()
+        fight.draw(screen.subsurface(pygame.Rect(0, 0, layout.f_w, layout.fight_h)))
+        pygame.draw.line(screen, FRAME_COLOR, (0, layout.fight_h), (layout.f_w, layout.fight_h), 5)
+        play_surf = screen.subsurface(pygame.Rect(0, layout.fight_h, layout.f_w, layout.play_h))
+        render.draw_play_scene(play_surf, layout, state, effects, frame * dt, quality.tier.name, show_hitbox)
+        pygame.display.flip()
+        end = time.perf_counter()
+
+        samples.append(((end - start) * 1000, (stepped - start) * 1000, (end - drawn) * 1000, len(state.arrows)))
+        if state.game_over:
+            state.dead = [False] * layout.lanes
+    gc.enable()
+    pygame.quit()
+    return samples
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    seconds = float(args[0]) if len(args) > 0 else 120
+    pass_pct = float(args[1]) if len(args) > 1 else PASS_PCT
+    samples = run(int(seconds * FPS), show_hitbox="--hitbox" in sys.argv)
+    total = sorted(s[0] for s in samples)
+    under = sum(ms <= BUDGET_MS for ms in total) * 100 / len(total)
+    arrows = [s[3] for s in samples]
+    print(f"frames {len(samples)}, arrows avg {sum(arrows) / len(arrows):.0f} max {max(arrows)}")
+    for name, col in (("frame", 0), ("step", 1), ("draw", 2)):
+        ms = sorted(s[col] for s in samples)
+        print(f"{name:>6} ms: p50 {percentile(ms, 0.5):.2f}  p95 {percentile(ms, 0.95):.2f}  "
+              f"p99 {percentile(ms, 0.99):.2f}  max {ms[-1]:.2f}")
+    passed = under >= pass_pct
+    print(f"{under:.1f}% of frames under {BUDGET_MS:.1f} ms (need {pass_pct:.1f}%): {'PASS' if passed else 'FAIL'}")
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,105 @@
+"""입력 지연 프로파일: 지옥 모드를 실제 게임처럼 clock.tick(FPS)로 돌리면서 키 입력부터 화면에 보일 때까지 잼
+
+별도 스레드가 아무 때나 이동 키 KEYDOWN/KEYUP을 큐에 넣고, 넣은 시각을 이벤트에 같이 실어 보냄.
+- pump: 게임이 재는 값 (이벤트를 꺼낸 시각 -> 그 틱을 처음 보여준 flip, engine.latency)
+- press: 실제로 누른 시각부터 (clock.tick이 자는 동안 큐에서 기다린 시간 포함)
+화살 수 구간별로도 나눠서 보여줌 (화살이 많을 때 조작이 굼뜬지).
+창은 SDL 더미 드라이버 (CPU만 씀).
+
+사용법: python benchmarks/input_latency.py [초] [초당 입력 수]   (기본 60, 8)
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)   # 에셋 경로가 ./assets 기준
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine import render, rules
+from engine.config import F_H, F_W, FPS, FRAME_COLOR, MODE_HELL
+from engine.game import LocalControls
+from engine.latency import InputLatency, percentiles
+from engine.state import Layout, PlayState
+
+# (이름, 화살 수 하한, 상한)
+BANDS = (("< 500", 0, 500), ("500-2000", 500, 2000), (">= 2000", 2000, 10 ** 9))
+
+
+def press_keys(rate, stop, seed=0):
+    """초당 rate번쯤 d키를 눌렀다 뗌 (KEYDOWN, KEYUP 번갈아). sent = 누른 시각"""
+    rng = random.Random(seed)
+    down = False
+    while not stop.wait(rng.expovariate(rate)):
+        down = not down
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN if down else pygame.KEYUP, key=pygame.K_d,
+                                             sent=time.perf_counter()))
+
+
+def run(seconds, rate, seed=0):
+    pygame.init()
+    layout = Layout.for_window(F_W, F_H)
+    screen = pygame.display.set_mode((layout.f_w, layout.f_h))
+    fight = render.FightScene()
+    fight.set_layout(layout.f_w, layout.fight_h)
+    state = PlayState(layout, 0, seed=seed, mode=MODE_HELL)
+    controls = LocalControls(("wasd", "arrows"))
+    pump = InputLatency()
+    press = InputLatency()
+    by_band = {name: ([], []) for name, _, _ in BANDS}
+    clock = pygame.time.Clock()
+    stop = threading.Event()
+    injector = threading.Thread(target=press_keys, args=(rate, stop, seed), daemon=True)
+    injector.start()
+    dt = 1000 // FPS
+    for tick in range(int(seconds * FPS)):
+        clock.tick(FPS)
+        events = pygame.event.get()
+        inputs = [e for e in events if controls.is_input(e)]
+        pump.pumped(len(inputs))
+        for e in inputs:
+            press.pumped(1, e.sent)
+        # 이벤트는 키 상태(get_pressed)를 바꾸지 않으므로 입력은 비워 두고 지연만 잼
+        rules.step(state, ((0, 0, False),) * layout.lanes, tick * dt)
+        for tracker in (pump, press):
+            tracker.applied(tick)
+            tracker.stepped(tick + 1)
+        fight.draw(screen.subsurface(pygame.Rect(0, 0, layout.f_w, layout.fight_h)))
+        pygame.draw.line(screen, FRAME_COLOR, (0, layout.fight_h), (layout.f_w, layout.fight_h), 5)
+        play_surf = screen.subsurface(pygame.Rect(0, layout.fight_h, layout.f_w, layout.play_h))
+        render.draw_play_scene(play_surf, layout, state, [], tick * dt, "HIGH")
+        pygame.display.flip()
+        shown_at = time.perf_counter()
+        band = next(name for name, low, high in BANDS if low <= len(state.arrows) < high)
+        by_band[band][0].extend(pump.shown(shown_at))
+        by_band[band][1].extend(press.shown(shown_at))
+        if state.game_over:
+            state.dead = [False] * layout.lanes
+    stop.set()
+    injector.join()
+    pygame.quit()
+    return pump.summary(), press.summary(), by_band
+
+
+def row(name, stats):
+    if not stats:
+        return f"{name:<20} {'-':>6}"
+    return (f"{name:<20} {stats['n']:>6} {stats['p50']:>7.2f} {stats['p95']:>7.2f} {stats['p99']:>7.2f} "
+            f"{stats['max']:>7.2f}")
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 60
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 8
+    pump_all, press_all, by_band = run(seconds, rate)
+    print(f"{'ms':<20} {'n':>6} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7}")
+    print(row("pump -> flip", pump_all))
+    print(row("press -> flip", press_all))
+    for name, (pump_ms, press_ms) in by_band.items():
+        print(row(f"  {name} pump", percentiles(pump_ms)))
+        print(row(f"  {name} press", percentiles(press_ms)))
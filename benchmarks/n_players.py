@@ -0,0 +1,56 @@
+"""여러 명 벤치마크: 플레이어 수별 rules.step 한 틱 시간 (격자로 주변 화살만 판정 vs 전부 판정)
+
+화살이 많이 쌓이도록 생성 간격을 줄이고, 죽은 플레이어는 바로 살려서 라운드가 끝나지 않게 함.
+같은 seed/입력으로 두 방식을 돌려서 점수와 화살이 같은지도 확인함.
+전부 판정은 칸 하나가 판 전체를 덮는 격자로 흉내냄 (후보 = 모든 화살).
+
+사용법: python benchmarks/n_players.py [틱 수] [생성 간격 ms]   (기본 1200, 20)
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import rules
+from engine.config import F_H, F_W, FPS, RULE_DODGE, RULE_SCRAPE
+from engine.spatial import SpatialHash
+from engine.state import Layout, PlayState
+
+
+def run(players, ticks, interval, brute, seed=0):
+    layout = Layout.for_window(max(F_W, 240 * players), F_H, players)
+    player_rules = tuple(RULE_SCRAPE if i % 2 == 0 else RULE_DODGE for i in range(players))
+    state = PlayState(layout, 0, seed=seed, rules=player_rules)
+    if brute:
+        state.grid = SpatialHash(10 ** 9)
+    schedule = state.spawner.schedule
+    schedule.interval = schedule.interval_min = interval
+    rng = random.Random(seed)
+    held = [(0, 0, False)] * players
+    arrows = 0
+    elapsed = 0.0
+    for t in range(1, ticks + 1):
+        for who in range(players):
+            if rng.random() < 0.1:
+                held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), False)
+        start = time.perf_counter()
+        rules.step(state, held, t * 1000 // FPS)
+        elapsed += time.perf_counter() - start
+        state.dead = [False] * players
+        arrows += len(state.arrows)
+    check = (tuple(state.scores), [(a.x, a.y) for a in state.arrows])
+    return elapsed / ticks * 1e6, arrows / ticks, check
+
+
+if __name__ == "__main__":
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    interval = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print(f"{'players':>7} {'avg arrows':>11} {'grid us/tick':>13} {'all us/tick':>12} {'speedup':>8} {'same':>5}")
+    for players in (2, 4, 8):
+        grid_us, arrows, grid_check = run(players, ticks, interval, brute=False)
+        all_us, _, all_check = run(players, ticks, interval, brute=True)
+        print(f"{players:>7} {arrows:>11.0f} {grid_us:>13.0f} {all_us:>12.0f} {all_us / grid_us:>7.1f}x "
+              f"{str(grid_check == all_check):>5}")
@@ -0,0 +1,126 @@
+"""그리기 백엔드 비교: 같은 각본(seed, 입력)을 Surface 경로와 텍스처 경로로 그려서 프레임당 그리기 시간을 나란히 보여줌
+
+시뮬레이션은 그리기와 따로 미리 돌려서 두 경로가 같은 상태를 그림 (화살 수도 같음).
+시간은 그리기 + 화면에 올리기(flip / present)까지. 텍스처 경로는 화살을 그릴 때 돌리는 방식과 각도 구간별 텍스처를 둘 다 잼.
+창은 SDL 더미 드라이버, 렌더러는 config.RENDER_DRIVER (기본 software, CPU만 씀).
+마지막 프레임을 captures/render_<경로>.png 로 저장하므로 눈으로도 비교할 수 있음.
+
+사용법: python benchmarks/render_backends.py [프레임 수] [normal|hell]   (기본 600, hell)
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)   # 에셋 경로가 ./assets 기준
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from engine import render, rules
+from engine.config import F_H, F_W, FPS, FRAME_COLOR, MODE_HELL, MODE_NORMAL, RENDER_DRIVER
+from engine.entities import SlashEffect
+from engine.event_log import EV_PROXIMITY, EV_SCRAPE
+from engine.replay import pack_state
+from engine.state import Layout, PlayState
+
+OUT_DIR = "./captures"
+
+
+def percentile(sorted_ms, q):
+    return sorted_ms[min(len(sorted_ms) - 1, int(len(sorted_ms) * q))]
+
+
+def play(frames, mode, seed=0):
+    """각본대로 frames 틱을 진행하면서 프레임마다 상태와 이펙트를 제자리에서 바꾸는 제너레이터"""
+    layout = Layout.for_window(F_W, F_H)
+    state = PlayState(layout, 0, seed=seed, mode=mode)
+    rng = random.Random(seed)
+    held = [(0, 0, False)] * layout.lanes
+    effects = []
+    dt = 1000 // FPS
+    for frame in range(1, frames + 1):
+        for who in range(layout.lanes):
+            if rng.random() < 0.1:
+                held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.02)
+        happened = rules.step(state, held, frame * dt)
+        for ef in effects:
+            ef.update()
+        effects = [e for e in effects if e.alive]
+        for kind, who, x, y, vx, vy, value in happened:
+            if kind == EV_SCRAPE:
+                effects.append(SlashEffect((int(x), int(y))))
+            elif kind == EV_PROXIMITY:
+                effects.append(SlashEffect((state.players[who].x, state.players[who].y)))
+        if state.game_over:
+            state.dead = [False] * layout.lanes
+        yield layout, state, effects, frame * dt
+
+
+def run_surface(frames, mode):
+    pygame.init()
+    layout = Layout.for_window(F_W, F_H)
+    screen = pygame.display.set_mode((layout.f_w, layout.f_h))
+    fight = render.FightScene()
+    fight.set_layout(layout.f_w, layout.fight_h)
+    random.seed(1)   # 이펙트 각도
+    times = []
+    for layout, state, effects, now in play(frames, mode):
+        start = time.perf_counter()
+        fight.draw(screen.subsurface(pygame.Rect(0, 0, layout.f_w, layout.fight_h)))
+        pygame.draw.line(screen, FRAME_COLOR, (0, layout.fight_h), (layout.f_w, layout.fight_h), 5)
+        play_surf = screen.subsurface(pygame.Rect(0, layout.fight_h, layout.f_w, layout.play_h))
+        render.draw_play_scene(play_surf, layout, state, effects, now, "HIGH")
+        pygame.display.flip()
+        times.append(((time.perf_counter() - start) * 1000, len(state.arrows)))
+    pygame.image.save(screen, os.path.join(OUT_DIR, "render_surface.png"))
+    check = pack_state(state)
+    pygame.quit()
+    render.clear_fonts()
+    return times, check
+
+
+def run_texture(frames, mode, rotate):
+    from engine.texture_render import TextureBackend
+    pygame.init()
+    layout = Layout.for_window(F_W, F_H)
+    backend = TextureBackend(layout, rotate_arrows=rotate)
+    fight = render.FightScene()
+    fight.set_layout(layout.f_w, layout.fight_h)
+    random.seed(1)
+    times = []
+    for layout, state, effects, now in play(frames, mode):
+        start = time.perf_counter()
+        backend.draw_frame(layout, fight, state, effects, now, "HIGH")
+        backend.present()
+        times.append(((time.perf_counter() - start) * 1000, len(state.arrows)))
+    # present 뒤에는 화면이 비므로 한 번 더 그려서 읽음
+    backend.draw_frame(layout, fight, state, effects, now, "HIGH")
+    pygame.image.save(backend.to_surface(), os.path.join(OUT_DIR, f"render_texture_{'rotate' if rotate else 'bucket'}.png"))
+    check = pack_state(state)
+    driver = backend.driver
+    backend.close()
+    pygame.quit()
+    render.clear_fonts()
+    return times, check, driver
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    mode = sys.argv[2] if len(sys.argv) > 2 else MODE_HELL
+    assert mode in (MODE_NORMAL, MODE_HELL), mode
+    os.makedirs(OUT_DIR, exist_ok=True)
+    results = [("surface", *run_surface(frames, mode))]
+    for rotate in (True, False):
+        times, check, driver = run_texture(frames, mode, rotate)
+        results.append((f"texture/{driver} {'rotate' if rotate else 'bucket'}", times, check))
+    arrows = [n for _, n in results[0][1]]
+    print(f"mode {mode}, frames {frames}, arrows avg {sum(arrows) / len(arrows):.0f} max {max(arrows)}, "
+          f"driver {RENDER_DRIVER}")
+    print(f"{'path':<26} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'max ms':>7} {'same state':>11}")
+    for name, times, check in results:
+        ms = sorted(t for t, _ in times)
+        print(f"{name:<26} {percentile(ms, 0.5):>7.2f} {percentile(ms, 0.95):>7.2f} {percentile(ms, 0.99):>7.2f} "
+              f"{ms[-1]:>7.2f} {str(check == results[0][2]):>11}")
@@ -0,0 +1,88 @@
+"""리플레이 찾아가기 벤치마크: 30분(108000틱) 세션을 기록하고 아무 틱으로나 찾아가는 시간
+
+화면 없이 rules.step만 돌려서 기록함 (전투 장면 애니메이션은 빼고). 라운드가 끝나면 새 seed로 다음 라운드.
+찾아간 상태가 처음부터 그대로 돌린 상태와 같은지도 몇 군데 비교함.
+
+사용법: python benchmarks/replay_seek.py [틱 수] [찾아가기 횟수]   (기본 108000, 200)
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import rules
+from engine.config import F_H, F_W, FPS
+from engine.replay import Replay, ReplayWriter, pack_state
+from engine.state import Layout, PlayState
+
+LAYOUT = Layout.for_window(F_W, F_H)
+
+
+def random_inputs(rng, held):
+    for who in range(2):
+        if rng.random() < 0.1:
+            held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.02)
+    return tuple(held)
+
+
+def record(directory, ticks, checkpoints, seed=0):
+    """ticks 틱을 기록. checkpoints에 든 틱의 (계산 직전) 상태를 pack_state 바이트로 돌려줌"""
+    writer = ReplayWriter(directory)
+    rng = random.Random(seed)
+    held = [(0, 0, False), (0, 0, False)]
+    round_no = 0
+    state = PlayState(LAYOUT, 0, seed=seed)
+    round_tick = 0
+    expected = {}
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if state.game_over or state.game_won:
+            round_no += 1
+            state = PlayState(LAYOUT, 0, seed=seed + round_no)
+            round_tick = 0
+        round_tick += 1
+        now = round_tick * 1000 // FPS
+        inputs = random_inputs(rng, held)
+        if tick in checkpoints:
+            expected[tick] = pack_state(state)
+        writer.record(tick, round_no, LAYOUT, state, None, now, 1000 // FPS, inputs)
+        rules.step(state, inputs, now)
+    writer.close()
+    return writer.path, expected, round_no + 1, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 108000
+    seeks = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(1)
+    checkpoints = set(rng.randrange(ticks) for _ in range(20))
+    with tempfile.TemporaryDirectory() as directory:
+        path, expected, rounds, record_s = record(directory, ticks, checkpoints)
+        size = os.path.getsize(path)
+        print(f"recorded {ticks} ticks ({ticks / FPS / 60:.1f} min, {rounds} rounds) in {record_s:.1f} s, "
+              f"file {size / 1024:.0f} KB ({size / ticks:.1f} B/tick)")
+
+        start = time.perf_counter()
+        replay = Replay(path)
+        open_ms = (time.perf_counter() - start) * 1000
+        print(f"open + index: {open_ms:.2f} ms, {len(replay.blocks)} keyframes")
+
+        mismatched = 0
+        for tick, packed in expected.items():
+            _, _, _, state = replay.seek(tick)
+            mismatched += pack_state(state) != packed
+        print(f"seek vs straight run: {len(expected) - mismatched}/{len(expected)} identical")
+
+        times = []
+        for _ in range(seeks):
+            tick = rng.randrange(replay.first_tick, replay.last_tick)
+            start = time.perf_counter()
+            replay.seek(tick)
+            times.append((time.perf_counter() - start) * 1000)
+        times.sort()
+        print(f"seek ms: p50 {times[len(times) // 2]:.2f}  p95 {times[int(len(times) * 0.95)]:.2f}  max {times[-1]:.2f}")
+        replay.close()
@@ -0,0 +1,73 @@
+"""상태 사본 벤치마크: 화살 수별 snapshot / restore / reset 시간 (한 프레임 16.7ms와 비교)
+
+reset은 같은 배치로 새 라운드를 시작하는 시간. 새 PlayState를 만드는 시간과 나란히 보여줌.
+restore 뒤 상태가 사본을 찍을 때와 같은지도 확인함.
+
+사용법: python benchmarks/snapshot_restore.py [화살 수 ...]   (기본 50 200 1000)
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import rules
+from engine.config import F_H, F_W, FPS, HUD_H
+from engine.entities import Arrow
+from engine.replay import pack_state
+from engine.state import Layout, PlayState
+
+LAYOUT = Layout.for_window(F_W, F_H)
+REPEAT = 200
+
+
+def fill(state, n, rng):
+    state.arrows = [Arrow((rng.uniform(0, LAYOUT.w), rng.uniform(HUD_H, LAYOUT.h)),
+                          (rng.uniform(-1, 1), rng.uniform(-1, 1)), rng=rng) for _ in range(n)]
+
+
+def timed_us(fn):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - start) / REPEAT * 1e6
+
+
+def run(n, seed=0):
+    rng = random.Random(seed)
+    state = PlayState(LAYOUT, 0, seed=seed)
+    fill(state, n, rng)
+    snap = state.snapshot()
+    before = pack_state(state)
+    for t in range(1, 31):
+        rules.step(state, ((1, 0, False), (-1, 1, False)), t * 1000 // FPS)
+    state.restore(snap)
+    same = pack_state(state) == before
+
+    snapshot_us = timed_us(state.snapshot)
+    restore_us = timed_us(lambda: state.restore(snap))
+
+    fill(state, n, rng)
+    arrows = state.arrows
+
+    def restart():
+        state.arrows = list(arrows)
+        state.reset(0, seed)
+        state.arrow_pool.clear()
+    reset_us = timed_us(restart)
+    state.arrows = list(arrows)
+    state.reset(0, seed)
+    pool = len(state.arrow_pool)
+    new_us = timed_us(lambda: PlayState(LAYOUT, 0, seed=seed))
+    return snapshot_us, restore_us, reset_us, new_us, pool, same
+
+
+if __name__ == "__main__":
+    counts = [int(a) for a in sys.argv[1:]] or [50, 200, 1000]
+    print(f"{'arrows':>7} {'snapshot us':>12} {'restore us':>11} {'reset us':>9} {'new PlayState us':>17} "
+          f"{'pool':>6} {'restore ok':>11}")
+    for n in counts:
+        snap, restore, reset, new, pool, same = run(n)
+        print(f"{n:>7} {snap:>12.1f} {restore:>11.1f} {reset:>9.1f} {new:>17.1f} {pool:>6} {str(same):>11}")
@@ -0,0 +1,96 @@
+"""관전 fan-out 벤치마크: 관전자 수별 관전자 하나당 대역폭 / 틱당 CPU, 읽지 않는 관전자가 있을 때 publish 최대 시간
+
+관전자는 같은 프로세스의 로컬 소켓. 마지막 관전자 하나는 일부러 읽지 않음(느린 관전자).
+짧은 실행에서도 밀림이 생기도록 관전자 버퍼 한도를 8KB로, 느린 관전자의 소켓 버퍼를 4KB로 줄여서 잼.
+첫 관전자는 받은 메시지로 상태를 다시 만들어 실제 화살 위치와의 최대 오차도 잼.
+
+사용법: python benchmarks/spectator_fanout.py [틱 수] [관전자 수 ...]   (기본 1800, 1 4 16)
+"""
+import os
+import random
+import socket
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import rules
+from engine.config import F_H, F_W, FPS
+from engine.spectate import MirrorState, SpectatorClient, SpectatorPublisher
+from engine.state import Layout, PlayState
+
+LAYOUT = Layout.for_window(F_W, F_H)
+
+
+def random_inputs(rng, held):
+    for who in range(2):
+        if rng.random() < 0.1:
+            held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.02)
+    return tuple(held)
+
+
+def run(ticks, viewers, seed=0):
+    pub = SpectatorPublisher("127.0.0.1", 0, max_buffer=8 * 1024)
+    clients = [SpectatorClient(("127.0.0.1", pub.port)) for _ in range(viewers)]
+    slow = socket.create_connection(("127.0.0.1", pub.port))
+    slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    mirror = MirrorState()
+    pub.publish(PlayState(LAYOUT), LAYOUT, None, 0, 0)   # 접속 받기
+    pub.subs[-1].sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+    pub.new_round()
+
+    rng = random.Random(seed)
+    held = [(0, 0, False), (0, 0, False)]
+    round_no = 0
+    state = PlayState(LAYOUT, 0, seed=seed)
+    round_tick = 0
+    publish_ms = []
+    max_err = 0.0
+    for _ in range(ticks):
+        if state.game_over or state.game_won:
+            round_no += 1
+            state = PlayState(LAYOUT, 0, seed=seed + round_no)
+            round_tick = 0
+            pub.new_round()
+        round_tick += 1
+        now = round_tick * 1000 // FPS
+        rules.step(state, random_inputs(rng, held), now)
+
+        start = time.perf_counter()
+        pub.publish(state, LAYOUT, None, round_tick, now)
+        publish_ms.append((time.perf_counter() - start) * 1000)
+
+        for i, client in enumerate(clients):
+            for msg in client.poll():
+                if i == 0:
+                    mirror.apply(msg)
+        if mirror.state is not None and mirror.tick == round_tick:
+            for net_id, arrow in pub.encoder.known.values():
+                copy = mirror.arrows.get(net_id)
+                if copy is not None:
+                    max_err = max(max_err, abs(copy.x - arrow.x), abs(copy.y - arrow.y))
+
+    subs = pub.subs
+    fast, slow_sub = subs[:viewers], subs[viewers:]
+    n_ticks = max(1, pub.ticks)
+    kb_per_s = sum(s.bytes_sent for s in fast) / max(1, len(fast)) / n_ticks * FPS / 1024
+    send_us = sum(s.send_s for s in subs) / len(subs) / n_ticks * 1e6
+    encode_us = pub.encode_s / n_ticks * 1e6
+    publish_ms.sort()
+    skipped = sum(s.skipped for s in slow_sub)
+    for client in clients:
+        client.close()
+    slow.close()
+    pub.close()
+    return (kb_per_s, encode_us, send_us, publish_ms[len(publish_ms) // 2], publish_ms[-1], skipped, max_err)
+
+
+if __name__ == "__main__":
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 1800
+    counts = [int(a) for a in sys.argv[2:]] or [1, 4, 16]
+    print(f"{'viewers':>8} {'KB/s/viewer':>12} {'encode us':>10} {'send us/viewer':>15} "
+          f"{'publish p50':>12} {'max ms':>8} {'slow skipped':>13} {'mirror err':>11}")
+    for n in counts:
+        kb, enc, send, p50, worst, skipped, err = run(ticks, n)
+        print(f"{n:>8} {kb:>12.2f} {enc:>10.1f} {send:>15.1f} {p50:>12.3f} {worst:>8.2f} {skipped:>13} {err:>11.4f}")
@@ -0,0 +1,20 @@
+"""DodgeArrow 엔진
+
+import만으로는 창을 열거나 파일을 읽지 않음. pygame은 그림이 필요한 모듈에서만 읽음.
+
+- config: 상수
+- state: 화면 배치(Layout), 라운드 상태(PlayState)
+- entities: Player, Arrow, SlashEffect, Spawner (규칙 + 상태)
+- rules: 한 틱 진행 (step)
+- spatial: 플레이어 주변 화살만 골라내는 격자 (충돌 후보)
+- render, shapes, sprite_cache, atlas, animation: 그리기 (pygame 사용)
+- texture_render: pygame._sdl2 렌더러로 그리는 백엔드 (config.RENDER_BACKEND)
+- round_flow: 라운드 흐름 (playing -> result -> restart). 결과 화면을 멈추지 않고 다음 라운드를 준비
+- game: 창을 열고 게임 실행 (main). 한 기계에서 여러 명 (config.LOCAL_PLAYERS), 지옥 모드 (config.GAME_MODE)
+- netplay: 두 기계에서 1P / 2P를 나눠 하는 P2P 모드 (입력 지연 + 되감기)
+- spectate: 관전 화면으로 판 상태 내보내기 / 관전 창
+- capture: 경기 녹화 (PNG 연번, 백그라운드 워커)
+- replay: 입력 + 키프레임 기록, 틱 단위로 찾아가기 / 리플레이 창
+- latency: 키 입력부터 화면에 보일 때까지 지연 (p50/p95/p99)
+- pacing: 프레임 맞추기 (sleep / busy / hybrid / vsync), 프레임 간격 히스토그램과 CPU 사용률
+"""
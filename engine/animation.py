@@ -0,0 +1,116 @@
+"""전투 장면 애니메이션: 프레임 수가 아니라 경과 ms로 넘어가는 클립과 캐릭터"""
+import collections
+
+
+class Clip:
+    """프레임 목록 + 프레임당 시간. 경과 시간으로 바로 프레임을 찾음"""
+
+    def __init__(self, frames, frame_ms: float, loop: bool = False):
+        self.frames = list(frames)
+        self.frame_ms = frame_ms
+        self.loop = loop
+        self.duration_ms = frame_ms * len(self.frames)
+
+    def frame_at(self, elapsed_ms: float):
+        idx = int(elapsed_ms // self.frame_ms)
+        if self.loop:
+            return self.frames[idx % len(self.frames)]
+        return self.frames[min(idx, len(self.frames) - 1)]
+
+    def finished(self, elapsed_ms: float) -> bool:
+        return not self.loop and elapsed_ms >= self.duration_ms
+
+
+class Actor:
+    """애니메이션 하나를 재생하는 대상 (캐릭터, 보스 등)
+
+    trigger()로 들어온 클립은 재생 중이면 큐에 쌓였다가 차례로 재생됨.
+    reacts_to에 다른 배우 이름을 주면, 그중 하나라도 idle이 아닐 동안 react_clip을 반복 재생함.
+    """
+
+    def __init__(self, name: str, clips: dict, idle: str = "idle", pos=(0, 0),
+                 reacts_to=(), react_clip: str = None, max_queue: int = 3):
+        self.name = name
+        self.clips = clips
+        self.idle = idle
+        self.pos = pos
+        self.reacts_to = tuple(reacts_to)
+        self.react_clip = react_clip
+        self.queue = collections.deque(maxlen=max_queue)
+        self.clip_name = idle
+        self.elapsed = 0.0
+
+    @property
+    def busy(self) -> bool:
+        return self.clip_name != self.idle
+
+    @property
+    def frame(self):
+        return self.clips[self.clip_name].frame_at(self.elapsed)
+
+    def play(self, clip_name: str):
+        self.clip_name = clip_name
+        self.elapsed = 0.0
+
+    def trigger(self, clip_name: str):
+        if self.busy:
+            self.queue.append(clip_name)
+        else:
+            self.play(clip_name)
+
+    def reset(self):
+        self.queue.clear()
+        self.play(self.idle)
+
+    def advance(self, dt_ms: float):
+        self.elapsed += dt_ms
+        clip = self.clips[self.clip_name]
+        # 한 틱에 여러 클립이 끝날 만큼 dt가 커도 남은 시간을 다음 클립으로 넘김
+        while clip.finished(self.elapsed):
+            over = self.elapsed - clip.duration_ms
+            self.play(self.queue.popleft() if self.queue else self.idle)
+            self.elapsed = over if self.busy else 0.0
+            clip = self.clips[self.clip_name]
+
+
+class Animator:
+    """여러 배우를 tick(dt) 한 번으로 진행. 반응형 배우는 대상 배우들 다음에 처리"""
+
+    def __init__(self):
+        self.actors = []        # 추가한 순서 = 그리는 순서
+        self.by_name = {}
+        self._tick_order = []
+
+    def add(self, actor: Actor):
+        self.actors.append(actor)
+        self.by_name[actor.name] = actor
+        # reacts_to가 있는 배우는 뒤로 보내서 같은 틱의 상태를 보고 반응하게 함
+        self._tick_order = sorted(self.actors, key=lambda a: bool(a.reacts_to))
+        return actor
+
+    def __getitem__(self, name: str) -> Actor:
+        return self.by_name[name]
+
+    def trigger(self, name: str, clip_name: str):
+        self.by_name[name].trigger(clip_name)
+
+    def tick(self, dt_ms: float):
+        for actor in self._tick_order:
+            if actor.reacts_to:
+                active = any(self.by_name[n].busy for n in actor.reacts_to)
+                if not active:
+                    if actor.busy:
+                        actor.play(actor.idle)
+                    continue
+                if actor.clip_name != actor.react_clip:
+                    actor.play(actor.react_clip)
+                    continue
+            actor.advance(dt_ms)
+
+    def reset(self):
+        for actor in self.actors:
+            actor.reset()
+
+    def draw(self, surf):
+        for actor in self.actors:
+            surf.blit(actor.frame, actor.pos)
@@ -0,0 +1,64 @@
+"""캐릭터/보스 프레임을 한 장으로 합친 아틀라스 (만들기는 오프라인, 읽기는 런타임)"""
+import json
+import os
+import sys
+
+import pygame
+
+# 아틀라스에 넣을 프레임 (에셋 폴더 기준 경로)
+ATLAS_SOURCES = (
+    ["boss/idle.png"] + [f"boss/attack{i}.png" for i in range(3)] +
+    ["player/1/idle.png"] + [f"player/1/attack{i}.png" for i in range(2)] +
+    ["player/2/idle.png"] + [f"player/2/attack{i}.png" for i in range(2)]
+)
+ATLAS_IMAGE = "atlas.png"
+ATLAS_INDEX = "atlas.json"
+PADDING = 1   # 스케일할 때 옆 프레임 픽셀이 번지지 않도록 띄우는 간격
+
+
+def pack(sizes: dict, max_width: int = 1024):
+    """선반(shelf) 방식 배치. {이름: (w, h)} -> ({이름: (x, y, w, h)}, (아틀라스 w, h))"""
+    rects = {}
+    x = y = shelf_h = used_w = 0
+    for name in sorted(sizes, key=lambda n: (-sizes[n][1], n)):
+        w, h = sizes[name]
+        if x + w > max_width and x > 0:
+            y += shelf_h + PADDING
+            x = shelf_h = 0
+        rects[name] = (x, y, w, h)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+        used_w = max(used_w, x - PADDING)
+    return rects, (used_w, y + shelf_h)
+
+
+def build(assets_dir: str):
+    """오프라인 단계: 개별 PNG들을 한 장으로 합쳐 atlas.png + atlas.json 저장"""
+    images = {name: pygame.image.load(os.path.join(assets_dir, name)) for name in ATLAS_SOURCES}
+    rects, size = pack({name: img.get_size() for name, img in images.items()})
+    sheet = pygame.Surface(size, pygame.SRCALPHA)
+    for name, (x, y, _, _) in rects.items():
+        sheet.blit(images[name], (x, y))
+    pygame.image.save(sheet, os.path.join(assets_dir, ATLAS_IMAGE))
+    with open(os.path.join(assets_dir, ATLAS_INDEX), "w", encoding="utf-8") as f:
+        json.dump({"image": ATLAS_IMAGE, "frames": rects}, f, separators=(",", ":"), sort_keys=True)
+    return rects, size
+
+
+def load(index_path: str):
+    """런타임: 아틀라스를 한 번만 열고 {정규화한 에셋 경로: 서브서피스} 를 돌려줌 (파일 없으면 빈 dict)"""
+    if not os.path.exists(index_path):
+        return {}
+    assets_dir = os.path.dirname(index_path)
+    with open(index_path, encoding="utf-8") as f:
+        index = json.load(f)
+    sheet = pygame.image.load(os.path.join(assets_dir, index["image"])).convert_alpha()
+    return {os.path.normpath(os.path.join(assets_dir, name)): sheet.subsurface(rect)
+            for name, rect in index["frames"].items()}
+
+
+if __name__ == "__main__":
+    # 사용법: python -m engine.atlas [에셋 폴더]  (기본 ./assets)
+    target = sys.argv[1] if len(sys.argv) > 1 else "./assets"
+    frames, atlas_size = build(target)
+    print(f"{len(frames)} frames -> {os.path.join(target, ATLAS_IMAGE)} {atlas_size[0]}x{atlas_size[1]}")
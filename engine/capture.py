@@ -0,0 +1,144 @@
+"""경기 녹화: 화면에 나간 프레임을 PNG 연번 이미지로 저장
+
+frame()은 고정된 수의 버퍼(슬롯) 중 빈 곳에 화면을 블릿만 하고 돌아옴. PNG 인코딩과 파일 쓰기는 워커 스레드가 함.
+빈 슬롯이 없으면(워커가 못 따라오면) 그 프레임은 버리고 dropped를 셈. 메인 루프는 파일을 기다리지 않음.
+"""
+import collections
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+import pygame
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(tag, data):
+    return struct.pack("!I", len(data)) + tag + data + struct.pack("!I", zlib.crc32(tag + data))
+
+def encode_png(width, height, rgb, level=1):
+    """24비트 RGB 바이트 -> PNG 바이트 (필터 없음). zlib은 압축하는 동안 GIL을 놓음"""
+    stride = width * 3
+    view = memoryview(rgb)
+    raw = b"".join(b"\x00" + view[y * stride:(y + 1) * stride] for y in range(height))
+    return (PNG_SIGNATURE +
+            _png_chunk(b"IHDR", struct.pack("!IIBBBBB", width, height, 8, 2, 0, 0, 0)) +
+            _png_chunk(b"IDAT", zlib.compress(raw, level)) +
+            _png_chunk(b"IEND", b""))
+
+
+class FrameCapture:
+    """슬롯 수만큼의 화면 크기 서피스를 돌려 씀 (슬롯마다 처음 쓸 때와 창 크기가 바뀔 때만 새로 만듦)"""
+
+    def __init__(self, directory, slots, workers, every=1, level=1):
+        self.directory = directory
+        self.every = every
+        self.level = level
+        self.surfaces = [None] * slots     # 슬롯별 화면 복사본 (화면 크기가 바뀔 때만 새로 만듦)
+        self.free = collections.deque(range(slots))
+        self.jobs = queue.Queue()
+        self.n_workers = workers
+        self.threads = []
+        self.session_dir = None
+        self.recording = False
+        self.frame_no = 0
+        self.saved_no = 0
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.encode_s = 0.0
+        self._lock = threading.Lock()
+
+    def start(self):
+        """새 폴더에 녹화 시작"""
+        if self.recording:
+            return
+        self.session_dir = os.path.join(self.directory, time.strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(self.session_dir, exist_ok=True)
+        self.saved_no = 0
+        self.recording = True
+        while len(self.threads) < self.n_workers:
+            t = threading.Thread(target=self._run, name=f"capture-{len(self.threads)}", daemon=True)
+            t.start()
+            self.threads.append(t)
+
+    def stop(self):
+        self.recording = False
+
+    def toggle(self):
+        if self.recording:
+            self.stop()
+        else:
+            self.start()
+
+    def frame(self, screen):
+        """flip 직후에 부름. 빈 슬롯에 블릿만 하고 바로 돌아옴"""
+        if not self.recording:
+            return
+        self.frame_no += 1
+        if self.frame_no % self.every:
+            return
+        if not self.free:
+            # 세는 값은 모두 _lock 안에서 바꿈 (stats()가 읽고 0으로 되돌리는 사이에 센 것을 잃지 않게)
+            with self._lock:
+                self.dropped += 1
+            return
+        idx = self.free.popleft()
+        surf = self.surfaces[idx]
+        if surf is None or surf.get_size() != screen.get_size():
+            surf = self.surfaces[idx] = pygame.Surface(screen.get_size(), 0, screen)
+        surf.blit(screen, (0, 0))
+        path = os.path.join(self.session_dir, f"frame_{self.saved_no:06d}.png")
+        self.saved_no += 1
+        with self._lock:
+            self.captured += 1
+        self.jobs.put((path, idx))
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            path, idx = job
+            surf = self.surfaces[idx]
+            width, height = surf.get_size()
+            rgb = pygame.image.tobytes(surf, "RGB")
+            # 픽셀을 꺼냈으니 슬롯은 바로 돌려줌 (인코딩하는 동안 다음 프레임을 받을 수 있게)
+            self.free.append(idx)
+            start = time.perf_counter()
+            try:
+                data = encode_png(width, height, rgb, self.level)
+                with open(path, "wb") as f:
+                    f.write(data)
+                ok = True
+            except OSError:
+                ok = False
+            with self._lock:
+                self.encode_s += time.perf_counter() - start
+                if ok:
+                    self.written += 1
+                else:
+                    self.failed += 1
+
+    def stats(self):
+        """지난 호출 이후 잡은 / 버린 / 쓴 프레임 수와 한 장당 평균 인코딩+쓰기 ms"""
+        with self._lock:
+            out = {"captured": self.captured, "dropped": self.dropped, "written": self.written,
+                   "failed": self.failed, "pending": self.jobs.qsize(),
+                   "encode_ms": round(self.encode_s / self.written * 1000, 2) if self.written else 0.0}
+            self.captured = self.dropped = self.written = self.failed = 0
+            self.encode_s = 0.0
+        return out
+
+    def close(self):
+        """남은 프레임을 다 쓰고 워커를 끝냄"""
+        self.recording = False
+        for _ in self.threads:
+            self.jobs.put(None)
+        for t in self.threads:
+            t.join()
+        self.threads = []
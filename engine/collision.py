@@ -0,0 +1,117 @@
+"""화살 충돌 계산 (로컬 좌표 변환, 캡슐 스윕, 화살촉 최단 거리). pygame 없이 숫자만 다룸"""
+import math
+import sys
+
+_numpy = None   # load_numpy()가 처음 불릴 때 채움. 없으면 False
+PIXEL_EPS = 1e-6   # pixel()에서 자르기 전에 더하는 값. 부동소수점 오차보다 크고 실제 이동량보다 훨씬 작음
+
+
+def load_numpy():
+    """numpy 모듈, 없으면 None. import 시간이 길어서 배열 경로를 처음 쓸 때만 읽음"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:   # numpy가 없으면 화살마다 계산하는 경로만 씀
+            _numpy = False
+    return _numpy or None
+
+
+def pixel(v):
+    """좌표 -> 마스크 판정용 정수 픽셀. 틱 길이에 따라 304.0이 303.9999999999998이 되는 식의 오차로
+    한 칸 밀려서 판정이 갈리지 않게, 살짝 올린 뒤 자름
+    """
+    return int(v + PIXEL_EPS)
+
+
+def to_local(dx, dy, dirx, diry):
+    """월드 기준 벡터를 (화살 진행 방향, 그 수직 방향) 좌표로"""
+    return dx * dirx + dy * diry, dy * dirx - dx * diry
+
+
+def sweep_capsule(q0, q1, a, b, radius):
+    """점이 q0 -> q1 로 움직이는 동안 처음 캡슐에 닿는 시각 t (0~1), 안 닿으면 None
+
+    캡슐은 로컬 x축 위의 선분 (a, 0) - (b, 0) 에서 radius 이내인 영역.
+    원(반지름 r)과 캡슐(반지름 R)의 충돌은 점과 반지름 r + R 캡슐의 충돌과 같으므로 radius에 합쳐서 넘김.
+    """
+    x0, y0 = q0
+    dx, dy = q1[0] - x0, q1[1] - y0
+    if _capsule_contains(x0, y0, a, b, radius):
+        return 0.0
+
+    best = None
+    # 몸통 부분: |y| = radius 가 되는 순간에 x가 [a, b] 안인지
+    if dy != 0:
+        for edge in (radius, -radius):
+            t = (edge - y0) / dy
+            if 0.0 <= t <= 1.0 and a <= x0 + dx * t <= b and (best is None or t < best):
+                best = t
+    # 양 끝 반원
+    for cx in (a, b):
+        t = _sweep_circle(x0 - cx, y0, dx, dy, radius)
+        if t is not None and (best is None or t < best):
+            best = t
+    return best
+
+
+def head_approach_sq(x, y, x0, y0, dirx, diry, head_offset, player_pos, player_prev, player_ipos):
+    """화살촉이 이번 틱 동안 플레이어 중심에 가장 가까이 온 거리의 제곱
+
+    틱 끝의 거리(플레이어 좌표는 pixel()로 자른 player_ipos)와, 화살 기준으로 본 플레이어 경로 위 최단 거리 중 작은 값.
+    x, y, ... 에 float 대신 numpy 배열을 넘기면 화살 전체를 한 번에 계산하고, 연산 순서가 같아서 결과도 똑같음.
+    """
+    hx = x + dirx * head_offset - player_ipos[0]
+    hy = y + diry * head_offset - player_ipos[1]
+    end_sq = hx * hx + hy * hy
+
+    rx0, ry0 = player_prev[0] - x0, player_prev[1] - y0
+    rx1, ry1 = player_pos[0] - x, player_pos[1] - y
+    qx0, qy0 = rx0 * dirx + ry0 * diry, ry0 * dirx - rx0 * diry
+    qx1, qy1 = rx1 * dirx + ry1 * diry, ry1 * dirx - rx1 * diry
+    dx, dy = qx1 - qx0, qy1 - qy0
+    t = _clamped_ratio((head_offset - qx0) * dx + (0.0 - qy0) * dy, dx * dx + dy * dy)
+    ex = qx0 + dx * t - head_offset
+    ey = qy0 + dy * t
+    path_sq = ex * ex + ey * ey
+
+    if _is_array(end_sq):
+        return sys.modules["numpy"].minimum(end_sq, path_sq)
+    return min(end_sq, path_sq)
+
+
+def _clamped_ratio(num, den):
+    # num / den 를 0~1로 자름. den이 0이면 0
+    if _is_array(den):
+        numpy = sys.modules["numpy"]
+        ratio = numpy.divide(num, den, out=numpy.zeros_like(den), where=den > 0)
+        return numpy.clip(ratio, 0.0, 1.0)
+    if den > 0:
+        return min(1.0, max(0.0, num / den))
+    return 0.0
+
+
+def _is_array(value):
+    # numpy 배열이면 numpy는 이미 읽혀 있음
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def _capsule_contains(x, y, a, b, radius):
+    cx = min(b, max(a, x))
+    return (x - cx) ** 2 + y * y <= radius * radius
+
+
+def _sweep_circle(x0, y0, dx, dy, radius):
+    # |p0 + d t| = radius 의 작은 근
+    qa = dx * dx + dy * dy
+    if qa == 0:
+        return None
+    qb = 2 * (x0 * dx + y0 * dy)
+    qc = x0 * x0 + y0 * y0 - radius * radius
+    disc = qb * qb - 4 * qa * qc
+    if disc < 0:
+        return None
+    t = (-qb - math.sqrt(disc)) / (2 * qa)
+    return t if 0.0 <= t <= 1.0 else None
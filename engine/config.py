@@ -0,0 +1,166 @@
+"""게임 상수. import만 해도 되도록 다른 모듈을 읽지 않음"""
+
+# --- 창 / 진행 속도 ---
+F_W, F_H = 1200, 700 # 처음 창 크기
+FPS = 60
+SIM_BASE_FPS = 60 # 속도 상수(한 틱에 몇 px)의 기준 틱 속도
+TICK_SCALE = SIM_BASE_FPS / FPS # FPS를 30으로 낮추면 한 틱에 두 배씩 움직임
+
+WIN_SCORE_THRESHOLD = 50 # 난이도 조절
+GAME_OVER_DELAY_MS = 2000
+RESULT_IDLE_FPS = 15 # 결과 화면처럼 그림이 안 바뀌는 동안은 이 FPS로 쉬면서 이벤트만 꺼냄
+RESULT_PREWARM_BUDGET_MS = 8 # 결과 화면 한 프레임에 다음 라운드 준비(GC, 화살 모양 미리 만들기)에 쓸 최대 시간
+# 지옥 모드에서는 라운드 중에 자동 GC(순환 참조 수거)를 끄고 라운드 사이(연습 모드는 체크포인트로 돌아갈 때)에 한 번에 함.
+# 켜 두면 화살 수천 개를 훑는 전체 수거가 수십 프레임마다 10ms 넘게 걸려 프레임이 튐. 기본 모드는 자동 GC 그대로
+GC_BETWEEN_ROUNDS = True
+
+# --- 기록 ---
+# 점수/프레임 기록은 stdout 대신 파일로 (꺼두면 아무것도 안 함)
+TELEMETRY_ENABLED = False
+TELEMETRY_SAMPLE_RATE = 1.0 # 초당 기록 중 남길 비율
+TELEMETRY_PATH = "./telemetry/telemetry.jsonl"
+
+# 라운드 결과 순위표 (켜면 ./leaderboard/leaderboard.db 하나에 계속 쌓음, 끄면 결과 화면에 순위 없음)
+LEADERBOARD_ENABLED = True
+LEADERBOARD_DIR = "./leaderboard"
+LEADERBOARD_TOP_N = 5
+
+# 밸런스 분석용 틱 단위 이벤트 기록 (켜면 ./events 에 세션마다 파일 하나)
+EVENT_LOG_ENABLED = False
+EVENT_LOG_DIR = "./events"
+
+# --- 전투 장면 ---
+BACKGROUND_PATH = "./assets/background.png"
+
+# 프레임 수 대신 시간 기준 (예전 60FPS에서 8프레임, 10프레임마다 넘기던 속도)
+CHAR_FRAME_MS = 1000 * 8 / 60
+BOSS_FRAME_MS = 1000 * 10 / 60
+
+FIGHT_ATTACK_1P_THRESHOLD = 5
+FIGHT_ATTACK_2P_THRESHOLD = 5
+
+# (배우 이름, 공격을 트리거하는 점수 간격) - 플레이어 순서대로
+FIGHT_HEROES = [("char1", FIGHT_ATTACK_1P_THRESHOLD), ("char2", FIGHT_ATTACK_2P_THRESHOLD)]
+
+# --- 피하기 구역 ---
+HUD_H = 70
+BG_COLOR = (22, 24, 27)
+HUD_BG = (30, 32, 38)
+FRAME_COLOR = (55, 60, 75)
+TEXT_COLOR = (235, 238, 245)
+PLAYER_COLOR_1P = (100, 150, 255)
+PLAYER_COLOR_2P = (255, 100, 150)
+SHAFT_MAIN = (170, 205, 255)
+SHAFT_CORE = (220, 240, 255)
+SHAFT_OUTLINE = (70, 105, 165)
+HEAD_MAIN = (255, 145, 130)
+HEAD_OUTLINE = (210, 90, 80)
+COLOR_FEATHER_OUT = (80, 110, 175)
+COLOR_FEATHER = (170, 205, 255)
+ARROW_COLORKEY = (255, 0, 255) # 화살 그림의 투명색 (화살에 안 쓰는 색)
+ARROW_FEATHER_LEN = 18
+ARROW_FEATHER_W = 14
+ARROW_LENGTH = 150
+ARROW_SHAFT_W = 7
+ARROW_HEAD_LEN = 26
+ARROW_HEAD_W = 18
+ARROW_HEAD_OFFSET = ARROW_LENGTH * 0.55 + ARROW_HEAD_LEN * 0.6   # 화살 중심에서 화살촉까지
+ARROW_ANGLE_STEP = 2   # 화살 그림/마스크를 공유하는 각도 구간 (도)
+# 스윕 판정용 캡슐 (화살 중심 기준 진행 방향 좌표). 마스크 모양 안쪽에 들어가게 잡아서 마스크보다 후하게 맞지 않음
+ARROW_LOCAL_TIP = 18 - (ARROW_LENGTH + ARROW_HEAD_LEN + 20) / 2 + ARROW_LENGTH
+SHAFT_CAPSULE = (ARROW_LOCAL_TIP - ARROW_LENGTH + 4, ARROW_LOCAL_TIP - ARROW_HEAD_LEN, ARROW_SHAFT_W / 2 - 0.5)
+HEAD_CAPSULE = (ARROW_LOCAL_TIP - ARROW_HEAD_LEN + 3, ARROW_LOCAL_TIP - 8, 3)
+PLAYER_RADIUS = 16
+PLAYER_RADIUS_SMALL = 9
+PLAYER_SPEED = 5.0
+ARROW_MIN_SPEED = 3.0
+ARROW_MAX_SPEED = 6.0
+ARROW_SPAWN_INTERVAL_INIT = 800
+ARROW_SPAWN_INTERVAL_MIN = 260
+ARROW_SPAWN_ACCEL_EVERY = 12
+ARROW_OFFSCREEN_PAD = 120
+SHAFT_SCORE_COOLDOWN_MS = 450
+SCORE_PER_SHAFT = 1
+SKILL_METER_MAX_1P = 15
+SKILL_METER_MAX_2P = 20
+SKILL_DURATION_MS_1P = 7000
+SKILL_DURATION_MS_2P = 10000
+SLOW_FACTOR = 0.25
+SLOW_PLAYER_BOOST = 1.5 # 슬로우 동안 1P 이동 속도 배율
+PROX_DIST_1 = 120
+PROX_DIST_2 = 85
+PROX_DIST_3 = 55
+PROXIMITY_VECTORIZED = True # numpy가 있으면 2P 근접 점수를 화살 전체에 대해 한 번에 계산
+SHOW_HITBOX = False # 시작할 때 히트박스 표시 여부 (H키로 전환)
+# 히트박스 표시: 실제 판정에 쓰는 마스크 외곽선 색
+HITBOX_SHAFT_COLOR = (80, 180, 90)
+HITBOX_HEAD_COLOR = (255, 80, 80)
+HITBOX_PLAYER_COLOR = (255, 230, 90)
+SPAWN_CENTER_GAP = 10 # 구역 경계 좌우로 이 거리 안에서는 화살 생성 안 함
+SPATIAL_CELL = 128 # 플레이어 근처 화살만 골라 판정하는 격자 한 칸 크기 (px)
+
+# --- 플레이어 ---
+RULE_SCRAPE = "scrape" # 몸통을 스치면 점수, 화살촉에 맞으면 죽음. 스킬은 슬로우 (기존 1P)
+RULE_DODGE = "dodge" # 어디든 맞으면 죽음, 화살촉 가까이 피할수록 점수. 스킬은 작아지기 (기존 2P)
+# 한 기계에서 같이 하는 플레이어 (규칙, 조작). 한 명당 세로 구역 하나, 왼쪽부터 1P, 2P, ...
+# 조작: 키 묶음 "wasd" / "arrows" / "ijkl" / "navkeys" / "numpad", 또는 조이스틱 "joy0", "joy1" ...
+LOCAL_PLAYERS = ((RULE_SCRAPE, "wasd"), (RULE_DODGE, "arrows"))
+PLAYER_COLORS = (PLAYER_COLOR_1P, PLAYER_COLOR_2P, (120, 220, 140), (250, 200, 90),
+                 (190, 130, 255), (90, 220, 230), (240, 150, 90), (200, 200, 200))
+JOY_DEADZONE = 0.35 # 조이스틱 축이 이보다 작으면 안 움직임
+
+# --- 모드 ---
+MODE_NORMAL = "normal"
+MODE_HELL = "hell" # 탄막 모드 (python DodgeArrow.py --hell): 여러 발씩 쏟아지고 화살 수천 개가 동시에 날아다님
+GAME_MODE = MODE_NORMAL
+# 지옥 모드 스폰 (기본 모드의 ARROW_SPAWN_* 대신). 간격은 화살 하나당 평균 ms
+HELL_SPAWN_INTERVAL_INIT = 24
+HELL_SPAWN_INTERVAL_MIN = 2
+HELL_SPAWN_ACCEL_EVERY = 40
+HELL_WIN_SCORE = 3000 # 지옥 모드는 점수가 빨리 오르므로 이김 기준을 따로 둠
+
+# --- 프레임 맞추기 (engine.pacing) ---
+PACE_SLEEP = "sleep" # clock.tick (기존). CPU는 적게, 깨는 시각이 몇 ms씩 흔들림
+PACE_BUSY = "busy" # clock.tick_busy_loop. 정확하지만 기다리는 동안 CPU 한 코어
+PACE_HYBRID = "hybrid" # 목표 시각 PACING_SPIN_MS 전까지 자고 나머지만 돌면서 기다림
+PACE_VSYNC = "vsync" # 화면 갱신에 맞춤 (드라이버가 지원할 때만. 안 되면 hybrid로 바뀜)
+FRAME_PACING = PACE_SLEEP # python DodgeArrow.py --pacing hybrid 처럼 바꿀 수 있음
+PACING_SPIN_MS = 2.0
+
+# --- 그리기 백엔드 ---
+RENDER_SURFACE = "surface" # Surface 블릿 + display.flip (기존 방식)
+RENDER_TEXTURE = "texture" # pygame._sdl2.video 렌더러: 정적인 그림은 텍스처로 한 번 올리고 복사만 (python DodgeArrow.py --texture)
+RENDER_BACKEND = RENDER_SURFACE
+RENDER_DRIVER = "software" # 텍스처 백엔드의 SDL 렌더 드라이버 이름 (None이면 SDL이 고름). software는 GPU 없는 리눅스에서도 됨
+# 텍스처 백엔드에서 화살 텍스처 하나를 그릴 때 구간 각도만큼 돌림. GPU 드라이버면 거의 공짜지만
+# software 드라이버는 돌리는 복사가 몇 배 느려서 기본은 각도 구간별 텍스처 (처음 쓸 때 하나씩 올림)
+TEXTURE_ROTATE_ARROWS = False
+
+# --- 넷플레이 (python -m engine.netplay) ---
+NETPLAY_PORT = 7000
+NETPLAY_INPUT_DELAY = 2 # 내 입력을 몇 틱 뒤에 적용할지 (클수록 되감기가 줄고 입력이 늦게 느껴짐)
+NETPLAY_MAX_ROLLBACK = 8 # 상대 입력 없이 예측으로 앞서갈 수 있는 최대 틱 (넘으면 기다림)
+NETPLAY_RESEND = 32 # 패킷 하나에 다시 실어 보내는 최대 입력 수 (UDP 손실 대비)
+
+# --- 관전 (python -m engine.spectate) ---
+SPECTATE_ENABLED = False # 켜면 게임이 관전 화면들에 판 상태를 내보냄
+SPECTATE_HOST = "127.0.0.1" # 다른 기계의 관전 화면도 받으려면 "0.0.0.0"
+SPECTATE_PORT = 7100
+SPECTATE_KEYFRAME_EVERY = 120 # 이 틱마다 전체 상태를 다시 보냄 (델타 누적 오차 정리)
+SPECTATE_MAX_BUFFER = 64 * 1024 # 관전자 하나에 쌓아둘 최대 바이트. 넘으면 밀린 델타를 버리고 키프레임부터 다시
+
+# --- 녹화 (F9로 켜고 끔) ---
+CAPTURE_ENABLED = False # 시작하자마자 녹화
+CAPTURE_DIR = "./captures" # 녹화마다 하위 폴더 하나에 frame_000000.png ...
+CAPTURE_EVERY = 1 # 몇 프레임마다 한 장 (2면 30fps 영상)
+CAPTURE_SLOTS = 8 # 미리 만들어 두는 프레임 버퍼 수. 다 차 있으면 그 프레임은 버림
+CAPTURE_WORKERS = 2 # PNG 인코딩/쓰기 스레드 수
+CAPTURE_PNG_LEVEL = 1 # zlib 압축 단계 (낮을수록 빠르고 파일이 큼)
+
+# --- 리플레이 (python -m engine.replay <파일>) ---
+REPLAY_ENABLED = False # 틱마다 입력을 replays/session-*.darp 에 기록
+REPLAY_DIR = "./replays"
+REPLAY_KEYFRAME_EVERY = 300 # 이 틱마다 전체 상태를 같이 저장 (찾아갈 때 다시 계산하는 최대 틱 수)
+
+# --- 연습 모드 (python DodgeArrow.py --practice) ---
+PRACTICE_MODE = False # F5로 체크포인트 저장, R키를 누르거나 죽으면 체크포인트부터 바로 다시 (리더보드에 안 남김)
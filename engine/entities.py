@@ -0,0 +1,373 @@
+"""피하기 구역의 엔티티 (상태 + 규칙). 그리기는 engine.render에 있음
+
+pygame은 화살 모양/마스크가 처음 필요할 때(engine.shapes) 읽으므로 import만으로는 읽지 않음.
+"""
+import math
+import random
+
+from engine.collision import head_approach_sq, load_numpy, pixel, sweep_capsule, to_local
+from engine.config import (
+    ARROW_HEAD_OFFSET, ARROW_MAX_SPEED, ARROW_MIN_SPEED, ARROW_OFFSCREEN_PAD, ARROW_SPAWN_ACCEL_EVERY,
+    ARROW_SPAWN_INTERVAL_INIT, ARROW_SPAWN_INTERVAL_MIN, HEAD_CAPSULE, HELL_SPAWN_ACCEL_EVERY,
+    HELL_SPAWN_INTERVAL_INIT, HELL_SPAWN_INTERVAL_MIN, MODE_HELL, MODE_NORMAL, PLAYER_RADIUS, PLAYER_RADIUS_SMALL,
+    PLAYER_SPEED, PROX_DIST_1, PROX_DIST_2, PROX_DIST_3, PROXIMITY_VECTORIZED, RULE_DODGE, RULE_SCRAPE,
+    SCORE_PER_SHAFT, SHAFT_CAPSULE, SHAFT_SCORE_COOLDOWN_MS, SKILL_METER_MAX_1P, SKILL_METER_MAX_2P,
+    SIM_BASE_FPS, SPAWN_CENTER_GAP, TICK_SCALE,
+)
+from engine.spawn_scheduler import SPAWN_TABLE_HELL, SPAWN_TABLE_NORMAL, SpawnScheduler
+
+# 모드별 (처음 간격, 최소 간격, 몇 발마다 빨라지는지, 스폰 표)
+SPAWN_MODES = {
+    MODE_NORMAL: (ARROW_SPAWN_INTERVAL_INIT, ARROW_SPAWN_INTERVAL_MIN, ARROW_SPAWN_ACCEL_EVERY, SPAWN_TABLE_NORMAL),
+    MODE_HELL: (HELL_SPAWN_INTERVAL_INIT, HELL_SPAWN_INTERVAL_MIN, HELL_SPAWN_ACCEL_EVERY, SPAWN_TABLE_HELL),
+}
+
+_shapes = None
+
+def _load_shapes():
+    # engine.shapes는 pygame을 읽으므로 처음 화살을 만들 때 읽음
+    global _shapes
+    if _shapes is None:
+        from engine import shapes
+        _shapes = shapes
+    return _shapes
+
+def clamp(v, lo, hi):
+    return max(lo, min(hi, v))
+
+def vec_normalize(x, y):
+    mag = math.hypot(x, y)
+    if mag == 0:
+        return 0, 0
+    return x / mag, y / mag
+
+def default_rule(who: str):
+    """예전 두 명 모드의 규칙: 1P는 몸통 스치기, 나머지는 피하기"""
+    return RULE_SCRAPE if who == "1P" else RULE_DODGE
+
+class SkillState:
+    __slots__ = ("rule", "meter", "ready", "max_meter")
+
+    def __init__(self, rule: str):
+        self.rule = rule
+        self.meter = 0
+        self.ready = False
+        self.max_meter = SKILL_METER_MAX_1P if rule == RULE_SCRAPE else SKILL_METER_MAX_2P
+
+    def add(self, amount: int):
+        if self.ready:
+            return
+        self.meter += amount
+        if self.meter >= self.max_meter:
+            self.meter = self.max_meter
+            self.ready = True
+
+    def consume(self):
+        if self.ready:
+            self.ready = False
+            self.meter = 0
+
+    def snapshot(self):
+        return self.meter, self.ready
+
+    def restore(self, snap):
+        self.meter, self.ready = snap
+
+    def reset(self):
+        self.meter = 0
+        self.ready = False
+
+class Player:
+    """bounds는 left/top/right/bottom/centerx/centery가 있는 사각형 (state.Bounds 또는 pygame.Rect)
+
+    rule: RULE_SCRAPE / RULE_DODGE (없으면 who로 정함: 1P는 스치기, 나머지는 피하기)
+    """
+    __slots__ = ("x", "y", "x0", "y0", "who", "rule", "bounds", "base_speed", "speed", "base_r", "small_r", "r")
+
+    def __init__(self, x, y, bounds_rect, who: str, rule: str = None):
+        self.x = x
+        self.y = y
+        self.x0, self.y0 = x, y   # 이번 틱 시작 위치 (스윕 판정용)
+        self.who = who
+        self.rule = rule or default_rule(who)
+        self.bounds = bounds_rect
+        self.base_speed = PLAYER_SPEED
+        self.speed = self.base_speed
+        self.base_r = PLAYER_RADIUS
+        self.small_r = PLAYER_RADIUS_SMALL
+        self.r = self.base_r
+
+    def move(self, dx, dy, tick_scale=TICK_SCALE):
+        """dx, dy: 입력 방향 (-1, 0, 1). 대각선은 정규화해서 같은 속도로
+        tick_scale: 이번 틱이 SIM_BASE_FPS 틱 몇 개만큼인지 (rules.step과 같은 값)
+        """
+        self.x0, self.y0 = self.x, self.y
+        if dx or dy:
+            dx, dy = vec_normalize(dx, dy)
+
+        self.x += dx * self.speed * tick_scale
+        self.y += dy * self.speed * tick_scale
+
+        self.x = clamp(self.x, self.bounds.left + self.r, self.bounds.right - self.r)
+        self.y = clamp(self.y, self.bounds.top + self.r, self.bounds.bottom - self.r)
+
+    def path_at(self, dx, dy, tick_scale, t):
+        """이번 틱 move(dx, dy, tick_scale) 경로에서 t (0~1) 지점. 도중에 벽에 막히는 것도 기준 틱마다 움직일 때와 같음"""
+        if dx or dy:
+            dx, dy = vec_normalize(dx, dy)
+        x = clamp(self.x0 + dx * self.speed * tick_scale * t, self.bounds.left + self.r, self.bounds.right - self.r)
+        y = clamp(self.y0 + dy * self.speed * tick_scale * t, self.bounds.top + self.r, self.bounds.bottom - self.r)
+        return x, y
+
+    def set_speed_factor(self, factor: float):
+        self.speed = self.base_speed * factor
+
+    def set_small(self, small: bool):
+        if self.rule == RULE_DODGE:
+            self.r = self.small_r if small else self.base_r
+            self.x = clamp(self.x, self.bounds.left + self.r, self.bounds.right - self.r)
+            self.y = clamp(self.y, self.bounds.top + self.r, self.bounds.bottom - self.r)
+
+    def circle(self):
+        return (self.x, self.y), self.r
+
+    def snapshot(self):
+        return self.x, self.y, self.x0, self.y0, self.speed, self.r
+
+    def restore(self, snap):
+        self.x, self.y, self.x0, self.y0, self.speed, self.r = snap
+
+    def reset(self):
+        """라운드 시작 자리로 (구역 가운데)"""
+        self.x = self.x0 = self.bounds.centerx
+        self.y = self.y0 = self.bounds.centery
+        self.speed = self.base_speed
+        self.r = self.base_r
+
+class Arrow:
+    __slots__ = ("x", "y", "x0", "y0", "target", "vx", "vy", "dirx", "diry",
+                 "last_scored_time", "proximity_level", "shape")
+
+    def __init__(self, origin, velocity, feathers=True, target=-1, rng=random, speed=None):
+        self.launch(origin, velocity, feathers, target, rng, speed)
+
+    def launch(self, origin, velocity, feathers=True, target=-1, rng=random, speed=None):
+        """새 화살로 초기화. 풀에서 꺼낸 화살을 다시 쓸 때도 부름. speed가 없으면 rng로 뽑음"""
+        self.x, self.y = origin
+        self.x0, self.y0 = origin
+        self.target = target
+        vx, vy = vec_normalize(*velocity)
+        base_speed = rng.uniform(ARROW_MIN_SPEED, ARROW_MAX_SPEED) if speed is None else speed
+        self.vx = vx * base_speed
+        self.vy = vy * base_speed
+        self.dirx = vx
+        self.diry = vy
+        self.last_scored_time = -99999
+        self.proximity_level = 0
+        self.shape = _load_shapes().arrow_shape(math.degrees(math.atan2(self.vy, self.vx)), feathers)
+
+    def snapshot(self):
+        # shape는 바뀌지 않는 공유 객체라 참조만 담음
+        return (self.x, self.y, self.x0, self.y0, self.target, self.vx, self.vy, self.dirx, self.diry,
+                self.last_scored_time, self.proximity_level, self.shape)
+
+    @classmethod
+    def from_snapshot(cls, snap):
+        a = cls.__new__(cls)
+        (a.x, a.y, a.x0, a.y0, a.target, a.vx, a.vy, a.dirx, a.diry,
+         a.last_scored_time, a.proximity_level, a.shape) = snap
+        return a
+
+    def topleft(self):
+        """그림/마스크 왼쪽 위 (pixel()로 자른 중심 기준)"""
+        w, h = self.shape.size
+        return pixel(self.x) - w // 2, pixel(self.y) - h // 2
+
+    def head_pos(self):
+        return (
+            self.x + self.dirx * ARROW_HEAD_OFFSET,
+            self.y + self.diry * ARROW_HEAD_OFFSET
+        )
+
+    def update(self, speed_factor: float = 1.0, tick_scale: float = TICK_SCALE):
+        self.x0, self.y0 = self.x, self.y
+        self.x += self.vx * speed_factor * tick_scale
+        self.y += self.vy * speed_factor * tick_scale
+
+    def offscreen(self, play_rect):
+        pad = ARROW_OFFSCREEN_PAD
+        return (self.x < play_rect.left - pad or self.x > play_rect.right + pad or
+                self.y < play_rect.top - pad or self.y > play_rect.bottom + pad)
+
+    def relative_path(self, player_prev, player_pos):
+        """이번 틱 동안 화살 기준(마스크 방향 좌표)으로 본 플레이어 중심의 시작/끝 위치
+
+        축은 shape의 구간 방향: 캡슐이 마스크 안에 들어가 있어야 스윕과 마스크 판정이 서로 어긋나지 않음.
+        """
+        dirx, diry = self.shape.dirx, self.shape.diry
+        q0 = to_local(player_prev[0] - self.x0, player_prev[1] - self.y0, dirx, diry)
+        q1 = to_local(player_pos[0] - self.x, player_pos[1] - self.y, dirx, diry)
+        return q0, q1
+
+    def proximity_sq(self, player_pos, player_prev):
+        """이번 틱 동안 화살촉과 플레이어 사이 최단 거리의 제곱"""
+        ipos = (pixel(player_pos[0]), pixel(player_pos[1]))
+        return head_approach_sq(self.x, self.y, self.x0, self.y0, self.dirx, self.diry,
+                                ARROW_HEAD_OFFSET, player_pos, player_prev, ipos)
+
+    def raise_proximity(self, new_level):
+        """근접 단계가 올라갔으면 올라간 만큼 점수를 돌려줌"""
+        if new_level > self.proximity_level:
+            gained = new_level - self.proximity_level
+            self.proximity_level = new_level
+            return gained
+        return 0
+
+    def check_collision(self, player_pos, player_r, now_ms, rule: str, player_prev=None, proximity=True):
+        """틱 끝 위치의 마스크 판정 + 틱 동안 움직인 경로의 스윕 판정
+
+        스윕 판정이 있어서 틱 하나에 움직이는 거리가 얇은 몸통보다 커져도 (낮은 FPS, 긴 dt) 뚫고 지나가지 않음.
+        머리와 몸통에 둘 다 닿았으면 먼저 닿은 쪽으로 처리함.
+        rule: 플레이어 규칙 (RULE_SCRAPE / RULE_DODGE)
+        proximity=False면 피하기 규칙의 근접 점수는 건너뜀 (proximity_levels로 한 번에 계산할 때).
+        """
+        if player_prev is None:
+            player_prev = player_pos
+        px, py = pixel(player_pos[0]), pixel(player_pos[1])
+        rpad = player_r + 4
+        p_mask = _shapes.circle_mask(player_r)
+
+        dead = False
+        gained = 0
+        left, top = self.topleft()
+        offset = (px - rpad - left, py - rpad - top)
+
+        # 플레이어 반지름은 1px 줄여서 씀 (픽셀 마스크 가장자리 반올림보다 후하지 않게)
+        q0, q1 = self.relative_path(player_prev, player_pos)
+        head_t = sweep_capsule(q0, q1, HEAD_CAPSULE[0], HEAD_CAPSULE[1], HEAD_CAPSULE[2] + player_r - 1)
+        if head_t is None and self.shape.head_mask.overlap(p_mask, offset):
+            head_t = 1.0
+        shaft_t = sweep_capsule(q0, q1, SHAFT_CAPSULE[0], SHAFT_CAPSULE[1], SHAFT_CAPSULE[2] + player_r - 1)
+        if shaft_t is None and self.shape.shaft_mask.overlap(p_mask, offset):
+            shaft_t = 1.0
+        shaft_first = shaft_t is not None and (head_t is None or shaft_t < head_t)
+
+        if rule == RULE_SCRAPE:
+            if shaft_first and now_ms - self.last_scored_time >= SHAFT_SCORE_COOLDOWN_MS:
+                self.last_scored_time = now_ms
+                gained = SCORE_PER_SHAFT
+                return dead, gained, True
+            if head_t is not None:
+                dead = True
+            return dead, gained, False
+
+        elif rule == RULE_DODGE:
+            if head_t is not None or shaft_t is not None:
+                dead = True
+                return dead, gained, False
+
+            if proximity:
+                gained = self.raise_proximity(proximity_level(self.proximity_sq(player_pos, player_prev)))
+            return dead, gained, False
+
+        return dead, gained, False
+
+def proximity_level(dist_sq):
+    """거리 제곱 -> 근접 단계 (0~3). 경계가 안쪽으로 갈수록 좁아지므로 넘은 경계 수가 곧 단계
+
+    numpy 배열도 그대로 받음 (bool 배열끼리 더하면 or가 되므로 1을 곱해 정수로 바꿔서 더함).
+    """
+    return (1 * (dist_sq <= PROX_DIST_1 * PROX_DIST_1) + 1 * (dist_sq <= PROX_DIST_2 * PROX_DIST_2) +
+            1 * (dist_sq <= PROX_DIST_3 * PROX_DIST_3))
+
+def proximity_levels(arrows, player_pos, player_prev):
+    """화살마다 새 근접 단계. numpy가 있으면 배열 연산 한 번, 없으면 화살마다 같은 식으로 계산"""
+    np = load_numpy() if PROXIMITY_VECTORIZED and arrows else None
+    if np is None:
+        return [proximity_level(a.proximity_sq(player_pos, player_prev)) for a in arrows]
+    n = len(arrows)
+    cols = [np.fromiter((getattr(a, name) for a in arrows), dtype=np.float64, count=n)
+            for name in ("x", "y", "x0", "y0", "dirx", "diry")]
+    ipos = (pixel(player_pos[0]), pixel(player_pos[1]))
+    dist_sq = head_approach_sq(*cols, ARROW_HEAD_OFFSET, player_pos, player_prev, ipos)
+    return proximity_level(dist_sq).tolist()
+
+class SlashEffect:
+    __slots__ = ("x", "y", "life", "max_life", "size", "angle")
+
+    def __init__(self, pos):
+        self.x, self.y = pos
+        self.life = 10
+        self.max_life = 10
+        self.size = 22
+        self.angle = random.uniform(-20, 20)
+
+    @property
+    def alive(self):
+        return self.life > 0
+
+    def update(self):
+        self.life -= 1
+        self.size += 2
+
+class Spawner:
+    """dividers: 구역 경계 x 좌표들 (혼자 하는 모드는 없음). 노릴 플레이어 수는 구역 수
+    mode: SPAWN_MODES의 키 (간격과 스폰 표)
+    """
+
+    def __init__(self, play_rect, dividers=(), start_ms=0, rng=random, mode=MODE_NORMAL):
+        self.play_rect = play_rect
+        self.rng = rng
+        self.mode = mode
+        interval_init, interval_min, accel_every, table = SPAWN_MODES[mode]
+        self.schedule = SpawnScheduler(
+            (play_rect.left, play_rect.top, play_rect.right, play_rect.bottom), dividers,
+            interval_init, interval_min, accel_every, table,
+            center_gap=SPAWN_CENTER_GAP, start_ms=start_ms, rng=rng, targets=len(dividers) + 1)
+
+    @property
+    def interval(self):
+        return self.schedule.interval
+
+    @property
+    def spawned(self):
+        return self.schedule.spawned
+
+    def snapshot(self):
+        return self.schedule.snapshot()
+
+    def restore(self, snap):
+        self.schedule.restore(snap)
+
+    def reset(self, start_ms=0):
+        self.schedule.reset(start_ms)
+
+    def spawn_due(self, now_ms, targets, feathers=True, pool=None, tick_ms=0, prev_targets=None, speed_factor=1.0):
+        """targets: 플레이어 번호 순서의 위치 목록
+        pool: 지난 라운드에서 쓰고 남은 Arrow 목록. 있으면 새로 만들지 않고 꺼내 씀
+        돌려주는 값: [(만기 시각, Arrow)]
+
+        tick_ms를 주면 (rules.step) 화살이 이번 틱 안의 만기 시각에 나온 것처럼 맞춤:
+        그 시각의 플레이어 위치(prev_targets -> targets 사이)를 노리고, 이번 틱 이동 뒤 만기 시각부터 날아간
+        만큼의 자리에 오도록 틱 시작 위치를 당겨 둠. 그래서 틱 길이가 달라도 같은 화살이 같은 길로 날아감.
+        """
+        arrows = []
+        for due_ms, sp in self.schedule.due(now_ms):
+            target_pos = targets[sp.target]
+            late = min(max(now_ms - due_ms, 0), tick_ms) if tick_ms else 0
+            if late and prev_targets is not None:
+                px, py = prev_targets[sp.target]
+                t = late / tick_ms
+                target_pos = (target_pos[0] - (target_pos[0] - px) * t, target_pos[1] - (target_pos[1] - py) * t)
+            if pool:
+                a = pool.pop()
+                a.launch(sp.origin, sp.velocity(target_pos), feathers, sp.target, self.rng, sp.speed)
+            else:
+                a = Arrow(sp.origin, sp.velocity(target_pos), feathers=feathers, target=sp.target, rng=self.rng,
+                          speed=sp.speed)
+            if tick_ms:
+                ahead = (now_ms - due_ms - tick_ms) * SIM_BASE_FPS / 1000 * speed_factor
+                a.x = a.x0 = a.x + a.vx * ahead
+                a.y = a.y0 = a.y + a.vy * ahead
+            arrows.append((due_ms, a))
+        return arrows
@@ -0,0 +1,136 @@
+"""틱마다 일어난 일을 열(column)별로 모아 청크 단위로 저장하는 이벤트 기록과 읽기"""
+import array
+import glob
+import os
+import struct
+import sys
+import time
+
+MAGIC = b"DAEV"
+CHUNK_MAGIC = b"CHNK"
+VERSION = 1
+
+# (열 이름, array 타입코드) - 모든 열은 고정 폭
+COLUMNS = (
+    ("tick", "I"),     # 세션 시작부터 센 프레임 번호
+    ("t_ms", "I"),     # 라운드 시작부터 지난 시간
+    ("kind", "B"),     # 아래 EV_* 값
+    ("who", "b"),      # 플레이어 번호 (0 = 1P, 1 = 2P, -1 = 없음)
+    ("x", "f"),
+    ("y", "f"),
+    ("vx", "f"),
+    ("vy", "f"),
+    ("value", "i"),    # 종류별 값 (점수, 근접 단계, 스킬 번호, 라운드 번호)
+)
+
+EV_ROUND = 0       # value = 라운드 번호
+EV_SPAWN = 1       # x, y = 생성 위치 / vx, vy = 속도 / who = 노린 플레이어
+EV_SCRAPE = 2      # x, y = 화살 중심 / value = 얻은 점수
+EV_PROXIMITY = 3   # x, y = 화살촉 / value = 새 근접 단계
+EV_SKILL = 4       # who = 사용한 플레이어 / value = 스킬 번호 (0 = 슬로우, 1 = 작아지기)
+EV_DEATH = 5       # x, y = 죽은 플레이어 위치
+
+EVENT_NAMES = {EV_ROUND: "round", EV_SPAWN: "spawn", EV_SCRAPE: "scrape",
+               EV_PROXIMITY: "proximity", EV_SKILL: "skill", EV_DEATH: "death"}
+
+
+class EventLog:
+    """틱 단위 이벤트를 열별 배열에 모았다가 chunk_rows개마다 파일 끝에 덧붙임"""
+
+    def __init__(self, directory: str, enabled: bool = True, chunk_rows: int = 4096):
+        self.enabled = enabled
+        self.chunk_rows = chunk_rows
+        self.path = None
+        self._file = None
+        self._cols = [array.array(code) for _, code in COLUMNS]
+        if not enabled:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, time.strftime("session-%Y%m%d-%H%M%S.dael"))
+        self._file = open(self.path, "wb")
+        self._file.write(MAGIC + struct.pack("<HcB", VERSION, b"<" if sys.byteorder == "little" else b">",
+                                             len(COLUMNS)))
+        for name, code in COLUMNS:
+            raw = name.encode()
+            self._file.write(struct.pack("<B", len(raw)) + raw + code.encode())
+
+    def log(self, tick, t_ms, kind, who=-1, x=0.0, y=0.0, vx=0.0, vy=0.0, value=0):
+        if not self.enabled:
+            return
+        row = (tick, t_ms, kind, who, x, y, vx, vy, value)
+        for col, v in zip(self._cols, row):
+            col.append(v)
+        if len(self._cols[0]) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.enabled or not self._cols[0]:
+            return
+        self._file.write(CHUNK_MAGIC + struct.pack("<I", len(self._cols[0])))
+        for col in self._cols:
+            col.tofile(self._file)
+            del col[:]
+        self._file.flush()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+
+def iter_chunks(path: str):
+    """파일을 청크 단위로 읽어 {열 이름: array} 를 하나씩 돌려줌. 메모리는 청크 하나 크기만 씀"""
+    with open(path, "rb") as f:
+        if f.read(4) != MAGIC:
+            raise ValueError(f"{path}: event log 파일이 아님")
+        version, order, ncols = struct.unpack("<HcB", f.read(4))
+        if version != VERSION:
+            raise ValueError(f"{path}: 지원하지 않는 버전 {version}")
+        swap = (order == b"<") != (sys.byteorder == "little")
+        columns = []
+        for _ in range(ncols):
+            (name_len,) = struct.unpack("<B", f.read(1))
+            name = f.read(name_len).decode()
+            code = f.read(1).decode()
+            columns.append((name, code))
+
+        while True:
+            head = f.read(8)
+            if len(head) < 8:
+                return
+            if head[:4] != CHUNK_MAGIC:
+                raise ValueError(f"{path}: 청크가 깨져 있음")
+            (nrows,) = struct.unpack("<I", head[4:])
+            chunk = {}
+            for name, code in columns:
+                col = array.array(code)
+                col.fromfile(f, nrows)
+                if swap:
+                    col.byteswap()
+                chunk[name] = col
+            yield chunk
+
+
+def iter_events(paths):
+    """여러 세션 파일을 이어서 (열 이름 -> 값) 행 단위로 돌려줌"""
+    for path in paths:
+        for chunk in iter_chunks(path):
+            names = list(chunk)
+            for row in zip(*chunk.values()):
+                yield dict(zip(names, row))
+
+
+if __name__ == "__main__":
+    # 사용법: python -m engine.event_log [파일 또는 glob 패턴 ...]  -> 종류별 이벤트 수
+    patterns = sys.argv[1:] or ["./events/*.dael"]
+    paths = sorted(p for pattern in patterns for p in glob.glob(pattern))
+    counts = {}
+    for path in paths:
+        for chunk in iter_chunks(path):
+            for kind in chunk["kind"]:
+                counts[kind] = counts.get(kind, 0) + 1
+    print(f"{len(paths)} sessions")
+    for kind, n in sorted(counts.items()):
+        print(f"{EVENT_NAMES.get(kind, kind):>10}: {n}")
@@ -0,0 +1,582 @@
+"""창을 열고 게임을 실행. 창, 에셋, 기록 파일은 전부 main()에서 만듦
+
+한 기계에서 같이 하는 인원과 조작은 config.LOCAL_PLAYERS (키 묶음 또는 조이스틱).
+넷플레이(engine.netplay)면 이 기계는 1P나 2P 한쪽 키만 읽고, 틱 진행은 RollbackSession이 맡음.
+"""
+import gc
+import random
+import sys
+import time
+from functools import partial
+
+import pygame
+
+from engine import event_log, render, rules
+from engine.capture import FrameCapture
+from engine.config import (
+    ARROW_ANGLE_STEP, CAPTURE_DIR, CAPTURE_ENABLED, CAPTURE_EVERY, CAPTURE_PNG_LEVEL, CAPTURE_SLOTS,
+    CAPTURE_WORKERS, EVENT_LOG_DIR, EVENT_LOG_ENABLED, FPS, FRAME_COLOR, FRAME_PACING, F_H, F_W, GAME_MODE,
+    GC_BETWEEN_ROUNDS, JOY_DEADZONE, LEADERBOARD_DIR, LEADERBOARD_ENABLED, LEADERBOARD_TOP_N, LOCAL_PLAYERS,
+    MODE_HELL, MODE_NORMAL, PACE_HYBRID, PACE_VSYNC, PRACTICE_MODE, RENDER_BACKEND, RENDER_TEXTURE, REPLAY_DIR,
+    REPLAY_ENABLED, RESULT_IDLE_FPS, SHOW_HITBOX, SPECTATE_ENABLED, TELEMETRY_ENABLED, TELEMETRY_PATH,
+    TELEMETRY_SAMPLE_RATE,
+)
+from engine.entities import SlashEffect
+from engine.event_log import EV_PROXIMITY, EV_SCRAPE, EventLog
+from engine.latency import InputLatency
+from engine.leaderboard import Leaderboard, make_row
+from engine.pacing import FramePacer
+from engine.quality import QualityGovernor
+from engine.replay import ReplayWriter
+from engine.round_flow import PHASE_RESULT, RoundFlow
+from engine.shapes import arrow_shape
+from engine.state import TWO_PLAYER_RULES, Layout, PlayState
+from engine.telemetry import Telemetry
+
+# 키 묶음별 (위, 아래, 왼쪽, 오른쪽, 스킬) 키
+KEY_SETS = {
+    "wasd": (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d, pygame.K_e),
+    "arrows": (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_RSHIFT),
+    "ijkl": (pygame.K_i, pygame.K_k, pygame.K_j, pygame.K_l, pygame.K_o),
+    # H(히트박스), M(메모리), R(연습 재시작)과 겹치지 않게 편집 키 묶음
+    "navkeys": (pygame.K_HOME, pygame.K_END, pygame.K_DELETE, pygame.K_PAGEDOWN, pygame.K_INSERT),
+    "numpad": (pygame.K_KP8, pygame.K_KP5, pygame.K_KP4, pygame.K_KP6, pygame.K_KP_ENTER),
+}
+KEYS_1P = KEY_SETS["wasd"]
+KEYS_2P = KEY_SETS["arrows"]
+# 텍스처 백엔드는 창이 둘(숨은 창 + 그리는 창)이라 창을 닫아도 QUIT이 오지 않고 WINDOWCLOSE만 옴
+QUIT_EVENTS = (pygame.QUIT, pygame.WINDOWCLOSE)
+
+def read_move(keys, bindings):
+    up, down, left, right, _ = bindings
+    dx = dy = 0
+    if keys[up]: dy -= 1
+    if keys[down]: dy += 1
+    if keys[left]: dx -= 1
+    if keys[right]: dx += 1
+    return dx, dy
+
+def read_joy_move(joy):
+    """왼쪽 스틱 (데드존 밖이면 -1/1), 스틱이 가운데면 첫 번째 방향 패드"""
+    dx = dy = 0
+    if joy.get_numaxes() >= 2:
+        ax, ay = joy.get_axis(0), joy.get_axis(1)
+        dx = (ax > JOY_DEADZONE) - (ax < -JOY_DEADZONE)
+        dy = (ay > JOY_DEADZONE) - (ay < -JOY_DEADZONE)
+    if not dx and not dy and joy.get_numhats():
+        hx, hy = joy.get_hat(0)
+        dx, dy = hx, -hy
+    return dx, dy
+
+class LocalControls:
+    """LOCAL_PLAYERS의 조작 이름마다 키 묶음이나 조이스틱을 붙여서 틱 입력을 만듦
+
+    꽂혀 있지 않은 조이스틱은 입력이 없는 플레이어가 됨 (나중에 꽂으면 JOYDEVICEADDED로 붙음).
+    """
+
+    def __init__(self, controls):
+        self.controls = controls
+        self.keys = {key for c in controls if c in KEY_SETS for key in KEY_SETS[c]}
+        self.joysticks = {}
+        self.pressed = [False] * len(controls)
+        self.open_joysticks()
+
+    def open_joysticks(self):
+        if not any(c.startswith("joy") for c in self.controls):
+            return
+        pygame.joystick.init()
+        for index in range(pygame.joystick.get_count()):
+            if index not in self.joysticks:
+                joy = pygame.joystick.Joystick(index)
+                joy.init()
+                self.joysticks[index] = joy
+
+    def skill_labels(self):
+        labels = []
+        for c in self.controls:
+            if c.startswith("joy"):
+                labels.append(f"PAD{c[3:]} A")
+            else:
+                labels.append(pygame.key.name(KEY_SETS[c][4]).upper())
+        return tuple(labels)
+
+    def handle(self, event):
+        """스킬 키/버튼은 누른 순간만 씀 (read에서 비움)"""
+        if event.type == pygame.KEYDOWN:
+            for i, c in enumerate(self.controls):
+                if c in KEY_SETS and event.key == KEY_SETS[c][4]:
+                    self.pressed[i] = True
+        elif event.type == pygame.JOYBUTTONDOWN and event.button == 0:
+            for i, c in enumerate(self.controls):
+                joy = self.joysticks.get(int(c[3:])) if c.startswith("joy") else None
+                if joy is not None and joy.get_instance_id() == event.instance_id:
+                    self.pressed[i] = True
+        elif event.type == pygame.JOYDEVICEADDED:
+            self.open_joysticks()
+
+    def is_input(self, event):
+        """이동/스킬 입력 이벤트인지 (입력 지연 측정용). 스틱은 데드존을 넘긴 움직임만"""
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            return event.key in self.keys
+        if event.type == pygame.JOYAXISMOTION:
+            return event.axis < 2 and abs(event.value) > JOY_DEADZONE
+        return event.type in (pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION)
+
+    def read(self, keys):
+        """이번 틱 입력 (플레이어마다 (dx, dy, skill)). 스킬 눌림은 읽으면서 비움"""
+        inputs = []
+        for i, c in enumerate(self.controls):
+            if c in KEY_SETS:
+                dx, dy = read_move(keys, KEY_SETS[c])
+            else:
+                joy = self.joysticks.get(int(c[3:]))
+                dx, dy = read_joy_move(joy) if joy is not None else (0, 0)
+            inputs.append((dx, dy, self.pressed[i]))
+            self.pressed[i] = False
+        return tuple(inputs)
+
+def open_window(layout, resizable=True, vsync=False):
+    """vsync를 못 켜면 (드라이버가 지원 안 함) vsync 없이 열고 (화면, False)"""
+    size = (layout.f_w, layout.f_h)
+    screen = None
+    if vsync:
+        # pygame은 SCALED(또는 OPENGL) 창에서만 vsync를 켬. SCALED는 창 크기를 바꾸면 배치 대신 그림을 늘리므로 크기 고정
+        try:
+            screen = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+        except pygame.error:
+            vsync = False
+    if screen is None:
+        screen = pygame.display.set_mode(size, pygame.RESIZABLE if resizable else 0)
+    pygame.display.set_caption("DodgeArrow")
+    return screen, vsync
+
+def present(screen, textures):
+    """screen에 그린 화면을 보여줌. 텍스처 백엔드면 창이 따로 있으므로 Surface를 통째로 올림"""
+    if textures is None:
+        pygame.display.flip()
+    else:
+        textures.show_surface(screen)
+
+def wait_for_peer(screen, clock, netplay, textures=None):
+    """상대와 seed를 맞출 때까지 대기 화면. 창을 닫으면 False"""
+    font = pygame.font.SysFont(None, 40)
+    text = font.render(f"{'1P' if netplay.local == 0 else '2P'}: waiting for the other player...", True, (235, 238, 245))
+    while not netplay.handshake():
+        for event in pygame.event.get():
+            if event.type in QUIT_EVENTS or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                return False
+        screen.fill((0, 0, 0))
+        screen.blit(text, text.get_rect(center=screen.get_rect().center))
+        present(screen, textures)
+        clock.tick(FPS)
+    return True
+
+def show_net_stats(netplay, summary):
+    """롤백 통계를 창 제목에 표시 (1초마다)"""
+    who = "1P" if netplay.local == 0 else "2P"
+    if summary.get("rollbacks"):
+        detail = (f"rollback {summary['rollbacks']}/{summary['frames']}f depth avg {summary['depth_avg']} "
+                  f"max {summary['depth_max']} | resim p95 {summary['resim_p95_ms']} ms")
+    else:
+        detail = "no rollback"
+    pygame.display.set_caption(f"DodgeArrow {who} | {detail} | stalls {summary['stalls']}")
+
+def show_title(title, textures=None):
+    """창 제목 (텍스처 백엔드는 자기 창에)"""
+    if textures is not None:
+        textures.window.title = title
+    else:
+        pygame.display.set_caption(title)
+
+def warm_arrow(angle, feathers, textures):
+    shape = arrow_shape(angle, feathers)
+    if textures is not None:
+        textures.arrow_texture(shape)
+
+def prewarm_jobs(feathers, textures=None, writers=(), collect=False):
+    """다음 라운드 준비 (결과 화면 동안 RoundFlow가 예산만큼씩 부름)
+
+    라운드 사이로 미룬 GC와 기록 파일 쓰기를 하고, 화살 모양(구간별 그림 + 마스크)을 전부 미리 만들어서
+    라운드 초반에 새 각도가 나올 때마다 모양을 만드느라 프레임이 튀지 않게 함.
+    """
+    if collect:
+        yield gc.collect
+    for writer in writers:
+        yield writer.flush
+    for bucket in range(360 // ARROW_ANGLE_STEP):
+        yield partial(warm_arrow, bucket * ARROW_ANGLE_STEP, feathers, textures)
+
+def save_checkpoint(state, checkpoint, at_ms):
+    """연습 모드 F5: 지금 상태를 새 체크포인트로. 죽은 상태면 이전 체크포인트를 그대로 돌려줌
+    (죽은 상태로 되돌리면 바로 또 게임 오버라 같은 곳으로만 계속 되돌아감)
+    """
+    if state.game_over:
+        return checkpoint
+    return state.snapshot(), at_ms
+
+def restore_checkpoint(state, checkpoint, now):
+    """연습 모드: 체크포인트로 되돌리고, 체크포인트 시각부터 이어지도록 게임 시계와의 차이를 돌려줌"""
+    snap, at_ms = checkpoint
+    state.restore(snap)
+    return now - at_ms
+
+def main(netplay=None, practice=PRACTICE_MODE, mode=GAME_MODE, render_backend=RENDER_BACKEND, pacing=FRAME_PACING):
+    """netplay: engine.netplay.RollbackSession (없으면 LOCAL_PLAYERS 인원이 한 기계에서 같이 함)
+    practice: 연습 모드 (넷플레이에서는 쓸 수 없음)
+    mode: MODE_NORMAL / MODE_HELL (넷플레이는 기본 모드만)
+    render_backend: RENDER_SURFACE / RENDER_TEXTURE (텍스처 백엔드는 창 크기 고정)
+    pacing: 프레임 맞추기 방식 (engine.pacing). vsync면 창 크기 고정
+    """
+    practice = practice and netplay is None
+    if netplay is not None:
+        mode = MODE_NORMAL
+    pygame.init()
+    try:
+        pygame.font.init()
+    except:
+        pass
+
+    # 넷플레이는 두 명, 기존 규칙 그대로
+    if netplay is None:
+        player_rules = tuple(rule for rule, _ in LOCAL_PLAYERS)
+        controls = LocalControls(tuple(control for _, control in LOCAL_PLAYERS))
+        skill_keys = controls.skill_labels()
+    else:
+        player_rules, controls, skill_keys = TWO_PLAYER_RULES, None, render.DEFAULT_SKILL_KEYS
+    lanes = len(player_rules)
+    layout = Layout.for_window(F_W, F_H, lanes)
+    pacer = FramePacer(FPS, pacing)
+    vsync = pacing == PACE_VSYNC
+    textures = None
+    if render_backend == RENDER_TEXTURE:
+        from engine.texture_render import TextureBackend
+        textures = TextureBackend(layout, vsync=vsync)
+        # 게임 오버/대기 화면만 여기에 그려서 통째로 올림
+        screen = pygame.Surface((layout.f_w, layout.f_h))
+    else:
+        # 넷플레이는 양쪽 좌표계가 같아야 하므로 창 크기를 고정
+        screen, vsync_on = open_window(layout, resizable=netplay is None and not vsync, vsync=vsync)
+        if vsync and not vsync_on:
+            pacer.mode, pacer.fallback = PACE_HYBRID, "vsync window failed"
+    clock = pygame.time.Clock()
+    latency = InputLatency()
+    quality_governor = QualityGovernor(1000 / FPS)
+    telemetry = Telemetry(TELEMETRY_PATH, enabled=TELEMETRY_ENABLED, sample_rate=TELEMETRY_SAMPLE_RATE)
+    leaderboard = Leaderboard(LEADERBOARD_DIR, enabled=LEADERBOARD_ENABLED, top_n=LEADERBOARD_TOP_N)
+    events = EventLog(EVENT_LOG_DIR, enabled=EVENT_LOG_ENABLED)
+    # 넷플레이는 RollbackSession이 틱을 되감으므로 기록하지 않음
+    replay = ReplayWriter(REPLAY_DIR, enabled=REPLAY_ENABLED and netplay is None)
+    capture = FrameCapture(CAPTURE_DIR, CAPTURE_SLOTS, CAPTURE_WORKERS, CAPTURE_EVERY, CAPTURE_PNG_LEVEL)
+    if CAPTURE_ENABLED:
+        capture.start()
+    spectators = None
+    # 관전 형식은 두 명 기준
+    if SPECTATE_ENABLED and lanes == 2:
+        from engine.spectate import SpectatorPublisher
+        spectators = SpectatorPublisher()
+
+    fight = render.FightScene()
+    fight.set_layout(layout.f_w, layout.fight_h, quality_governor.tier.smooth_background)
+    show_hitbox = SHOW_HITBOX
+
+    # 자동 GC를 끄는 건 지옥 모드만. 끄면 라운드 사이와 연습 모드 체크포인트 복원 때 직접 수거함
+    gc_between_rounds = GC_BETWEEN_ROUNDS and mode == MODE_HELL
+    if gc_between_rounds:
+        # 에셋까지 읽은 지금까지의 객체는 수거 대상에서 빼서 라운드 사이 수거도 짧게
+        gc.freeze()
+        gc.disable()
+
+    running_global = True
+    state = None
+    tick = 0
+    round_no = 0
+    # 첫 라운드 전에도 같은 준비 (창을 여는 동안 한 번에)
+    flow = RoundFlow()
+    flow.queue(prewarm_jobs(quality_governor.tier.arrow_feathers, textures, collect=gc_between_rounds))
+    if netplay is not None:
+        running_global = wait_for_peer(screen, clock, netplay, textures)
+        local_keys = (KEYS_1P, KEYS_2P)[netplay.local]
+
+        def is_input(event):
+            return event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key in local_keys
+    else:
+        is_input = controls.is_input
+
+    while running_global:
+        # restart -> playing (결과 화면 동안 못 끝낸 준비 작업이 있으면 여기서 마저 함)
+        blocked_ms = flow.start()
+        if netplay is None:
+            # seed를 줘야 리플레이에서 같은 화살이 다시 나옴
+            start_ms, seed = pygame.time.get_ticks(), random.getrandbits(32)
+        else:
+            # 양쪽이 같은 seed, 같은 틱 시각(0부터)으로 시작
+            start_ms, seed = 0, netplay.round_seed(round_no)
+        # 창 크기가 그대로면 지난 라운드 상태를 그대로 다시 씀 (화살 풀, 타이머 휠, 가장자리 구간)
+        if state is not None and state.layout == layout:
+            state.reset(start_ms, seed)
+        else:
+            state = PlayState(layout, start_ms, seed=seed, rules=player_rules, mode=mode)
+        if netplay is not None:
+            netplay.start_round(state, round_no)
+        latency.reset()
+        # 결과 화면/접속 대기 동안은 프레임 작업이 아니므로 품질 판단과 프레임 간격에 넣지 않음
+        quality_governor.reset_window()
+        pacer.resume()
+        clock_offset = 0   # 연습 모드에서 체크포인트로 돌아간 만큼 시뮬레이션 시계를 늦춤
+        checkpoint = (state.snapshot(), start_ms) if practice else None
+        effects = []
+        fight.new_round()
+        if spectators is not None:
+            spectators.new_round()
+
+        game_over = False
+        game_won = False
+        round_start_time = pygame.time.get_ticks()
+        round_no += 1
+        events.log(tick, 0, event_log.EV_ROUND, value=round_no)
+        telemetry.record("round_start", always=True, round=round_no, prewarm_blocked_ms=blocked_ms)
+        last_print_time = round_start_time
+        frame_no = 0
+
+        while running_global and not game_over and not game_won:
+            dt = pacer.tick()
+            now = pygame.time.get_ticks()
+            frame_no += 1
+            tick += 1
+            round_ms = now - round_start_time
+
+            # 대기 시간을 뺀 실제 작업 시간으로 품질 단계 조절
+            # (라운드 첫 프레임은 앞 프레임이 없어서 잰 값이 없으므로 뺌)
+            work_ms = pacer.work_ms
+            if frame_no > 1:
+                telemetry.frame(work_ms)
+                if quality_governor.record(work_ms):
+                    old_tier, new_tier, avg_ms = quality_governor.last_change
+                    telemetry.record("quality", always=True, old=old_tier, new=new_tier, avg_ms=avg_ms)
+                    # 배경 축소 방식도 단계에 따름 (만들어 둔 두 가지 중에서 바꾸기만 함)
+                    fight.set_layout(layout.f_w, layout.fight_h, quality_governor.tier.smooth_background)
+
+            skill_key = False
+            restart = False
+            frame_events = pygame.event.get()
+            latency.pumped(sum(map(is_input, frame_events)))
+            for event in frame_events:
+                if event.type in QUIT_EVENTS:
+                    running_global = False
+                    game_over = True
+
+                elif event.type == pygame.VIDEORESIZE:
+                    layout = Layout.for_window(event.w, event.h, lanes)
+                    screen, _ = open_window(layout)
+                    fight.set_layout(layout.f_w, layout.fight_h, quality_governor.tier.smooth_background)
+                    state = PlayState(layout, now - clock_offset, seed=random.getrandbits(32), rules=player_rules,
+                                      mode=mode)
+                    if practice:
+                        checkpoint = (state.snapshot(), now - clock_offset)
+                    effects = []
+                    fight.new_round()
+                    if spectators is not None:
+                        spectators.new_round()
+
+                if controls is not None:
+                    controls.handle(event)
+
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running_global = False
+                        game_over = True
+                    if event.key == pygame.K_h:
+                        show_hitbox = not show_hitbox
+                    if event.key == pygame.K_F9:
+                        capture.toggle()
+                        # stdout은 키오스크에서 느린 로거로 가므로 기록과 창 제목으로만 알림
+                        telemetry.record("capture_toggle", always=True, recording=capture.recording,
+                                         dir=capture.session_dir)
+                        show_title("DodgeArrow | REC" if capture.recording else "DodgeArrow", textures)
+                    if practice and event.key == pygame.K_F5:
+                        checkpoint = save_checkpoint(state, checkpoint, now - clock_offset)
+                    if practice and event.key == pygame.K_r:
+                        restart = True
+                    if event.key == pygame.K_m:
+                        # 보고서는 기록으로만 (여러 줄을 프레임 루프에서 stdout으로 쓰지 않음)
+                        telemetry.record("memory", always=True, lines=render.memory_report(fight, state.arrows))
+                    if netplay is not None and event.key == local_keys[4]:
+                        skill_key = True
+
+            if not running_global:
+                break
+
+            keys = pygame.key.get_pressed()
+            feathers = quality_governor.tier.arrow_feathers
+            if netplay is None:
+                # 연습 모드에서는 죽어도 게임 오버 화면 없이 다음 프레임에 체크포인트부터 다시
+                if restart or (practice and state.game_over):
+                    start = time.perf_counter()
+                    clock_offset = restore_checkpoint(state, checkpoint, now)
+                    if gc_between_rounds:
+                        # 연습 모드는 라운드가 안 끝나므로 여기서 수거 (안 하면 세션 내내 순환 참조가 쌓임)
+                        gc.collect()
+                    telemetry.record("practice", always=True, arrows=len(state.arrows),
+                                     restore_ms=round((time.perf_counter() - start) * 1000, 3))
+                    effects = []
+                    replay.flush()
+                    if spectators is not None:
+                        spectators.new_round()
+                sim_now = now - clock_offset
+                inputs = controls.read(keys)
+                replay.record(tick, round_no, layout, state, fight, sim_now, dt, inputs)
+                happened = rules.step(state, inputs, sim_now, feathers=feathers)
+                latency.applied(tick)
+                latency.stepped(tick + 1)
+            else:
+                # 내 입력은 NETPLAY_INPUT_DELAY 틱 뒤에 들어감. 그 틱에 이미 보낸 입력이 있으면 이번 입력은 다음 프레임으로
+                input_tick = netplay.tick + netplay.input_delay
+                fresh = input_tick not in netplay.local_inputs
+                # 상대 입력을 너무 오래 못 받았으면 None (이번 프레임은 멈춤)
+                happened = netplay.advance((*read_move(keys, local_keys), skill_key), feathers) or []
+                sim_now = netplay.now_ms
+                if fresh:
+                    latency.applied(input_tick)
+                latency.stepped(netplay.tick)
+
+            for ef in effects:
+                ef.update()
+            effects = [e for e in effects if e.alive]
+
+            for kind, who, x, y, vx, vy, value in happened:
+                events.log(tick, round_ms, kind, who, x, y, vx, vy, value)
+                if kind == EV_SCRAPE and quality_governor.allow_effect(len(effects)):
+                    effects.append(SlashEffect((int(x), int(y))))
+                elif kind == EV_PROXIMITY and quality_governor.allow_effect(len(effects)):
+                    player = state.players[who]
+                    effects.append(SlashEffect((player.x, player.y)))
+
+            # 넷플레이는 예측으로 계산한 결과가 아니라 양쪽 입력이 다 모인 결과로만 라운드를 끝냄
+            settled = netplay is None or netplay.synced
+            game_over = state.game_over and settled and not practice
+
+            # 전투 장면 영웅 둘: 스치기 규칙 점수 합, 피하기 규칙 점수 합
+            fight.try_attack(state.team_scores())
+            fight.tick(dt)
+
+            game_won = state.game_won and settled
+
+            if spectators is not None:
+                if netplay is not None and netplay.rolled_back:
+                    # 되감아서 다시 계산한 화살 위치는 델타로 전해지지 않음
+                    spectators.resync()
+                spectators.publish(state, layout, fight, frame_no if netplay is None else netplay.tick, sim_now)
+
+            if now - last_print_time > 1000:
+                s1, s2 = state.team_scores()
+                telemetry.record("sec", s1=s1, s2=s2, total=state.total,
+                                 arrows=len(state.arrows), tier=quality_governor.tier.name,
+                                 render=render_backend, frame=telemetry.frame_stats())
+                if netplay is not None:
+                    summary = netplay.stats.summary()
+                    telemetry.record("netplay", **summary)
+                    show_net_stats(netplay, summary)
+                if spectators is not None:
+                    telemetry.record("spectate", **spectators.stats())
+                if capture.recording:
+                    telemetry.record("capture", **capture.stats())
+                # 키를 꺼낸 시각부터 그 입력이 처음 보인 flip까지
+                input_latency = latency.summary()
+                if input_latency:
+                    telemetry.record("input_latency", arrows=len(state.arrows), **input_latency)
+                # 프레임 간격 히스토그램 + CPU 사용률
+                telemetry.record("pacing", **pacer.stats())
+                if pacer.fallback:
+                    telemetry.record("pacing_fallback", always=True, reason=pacer.fallback)
+                    pacer.fallback = None
+                last_print_time = now
+
+            if textures is not None:
+                # 렌더러는 present 뒤 화면이 남지 않으므로 전투 장면도 매 프레임 그림 (텍스처 복사라 쌈)
+                textures.draw_frame(layout, fight, state, effects, sim_now, quality_governor.tier.name, show_hitbox,
+                                    skill_keys)
+                if capture.recording:
+                    # present 전에 읽어야 그린 화면이 남아 있음
+                    capture.frame(textures.to_surface())
+                pacer.before_present()
+                textures.present()
+                latency.shown()
+            else:
+                # 가장 낮은 품질에선 전투 장면을 건너뛴 프레임은 이전 그림을 그대로 둠
+                if quality_governor.should_draw_fight(frame_no):
+                    screen.fill((0, 0, 0), pygame.Rect(0, 0, layout.f_w, layout.fight_h))
+                    fight_surf = screen.subsurface(pygame.Rect(0, 0, layout.f_w, layout.fight_h))
+                    fight.draw(fight_surf)
+
+                pygame.draw.line(screen, FRAME_COLOR, (0, layout.fight_h), (layout.f_w, layout.fight_h), 5)
+
+                play_surf = screen.subsurface(pygame.Rect(0, layout.fight_h, layout.f_w, layout.play_h))
+                render.draw_play_scene(play_surf, layout, state, effects, sim_now, quality_governor.tier.name,
+                                       show_hitbox, skill_keys)
+
+                pacer.before_present()
+                pygame.display.flip()
+                latency.shown()
+                capture.frame(screen)
+
+        if (game_over or game_won) and running_global:
+            duration_ms = pygame.time.get_ticks() - round_start_time
+            dead_who = "" if game_won else state.players[state.dead.index(True)].who
+            s1, s2 = state.team_scores()
+            # 큐에만 넣고, 화면에는 캐시된 상위 기록 + 방금 라운드를 합쳐서 바로 보여줌
+            # (연습과 지옥 모드는 점수 기준이 달라서 안 남김)
+            if not practice and mode == MODE_NORMAL:
+                leaderboard.submit(make_row(s1, s2, game_won, duration_ms, dead_who))
+
+            render.draw_game_over(screen, layout, state, game_won, leaderboard.top_scores())
+            present(screen, textures)
+            capture.frame(screen)
+
+            telemetry.record("round", always=True,
+                             result="win" if game_won else f"dead_{dead_who.lower()}",
+                             s1=s1, s2=s2, total=state.total, players=lanes,
+                             threshold=state.win_score, mode=mode, duration_ms=duration_ms)
+
+            # 결과 화면: 멈추지 않고 낮은 FPS로 이벤트를 꺼내면서 다음 라운드를 준비함.
+            # 넷플레이는 기다리는 동안에도 받고 보내야 상대가 마지막 입력을 받고 같은 틱에서 끝남
+            flow.finish(pygame.time.get_ticks(),
+                        prewarm_jobs(quality_governor.tier.arrow_feathers, textures, (replay, events),
+                                     gc_between_rounds))
+            while running_global and flow.phase == PHASE_RESULT:
+                clock.tick(RESULT_IDLE_FPS)
+                redraw = False
+                for event in pygame.event.get():
+                    if event.type in QUIT_EVENTS or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                        running_global = False
+                    elif event.type == pygame.VIDEORESIZE:
+                        layout = Layout.for_window(event.w, event.h, lanes)
+                        screen, _ = open_window(layout)
+                        fight.set_layout(layout.f_w, layout.fight_h, quality_governor.tier.smooth_background)
+                        redraw = True
+                    elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                        redraw = True
+                    elif event.type == pygame.JOYDEVICEADDED and controls is not None:
+                        controls.handle(event)
+                    # 나머지 키/버튼은 버림 (다음 라운드 첫 틱에 밀려 들어가지 않게)
+                if redraw:
+                    render.draw_game_over(screen, layout, state, game_won, leaderboard.top_scores())
+                    present(screen, textures)
+                if netplay is not None:
+                    netplay.flush()
+                flow.update(pygame.time.get_ticks(), ready=netplay is None or netplay.delivered)
+            fight.reset()
+
+    if netplay is not None:
+        netplay.transport.close()
+    if spectators is not None:
+        spectators.close()
+    capture.close()
+    replay.close()
+    telemetry.close()
+    leaderboard.close()
+    events.close()
+    if textures is not None:
+        textures.close()
+    gc.enable()
+    pygame.quit()
+    sys.exit()
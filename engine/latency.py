@@ -0,0 +1,67 @@
+"""입력 지연: 키/버튼 이벤트를 꺼낸(pump) 시각부터 그 입력이 들어간 틱을 처음 보여주는 flip까지 (ms)
+
+pygame 이벤트에는 SDL 시각이 없어서 이벤트를 꺼낸 시각부터 잼. clock.tick이 자는 동안 눌린 키가
+큐에서 기다린 시간(최대 한 프레임)은 빠지므로, benchmarks/input_latency.py가 그 몫까지 같이 보여줌.
+틱 번호로 이어 붙이므로 넷플레이의 입력 지연(NETPLAY_INPUT_DELAY 틱)도 그대로 들어감.
+"""
+import time
+
+
+def percentiles(values):
+    """{"n", "p50", "p95", "p99", "max"} (ms, 소수 둘째 자리). 값이 없으면 빈 dict"""
+    if not values:
+        return {}
+    values = sorted(values)
+    n = len(values)
+
+    def pick(q):
+        return round(values[min(n - 1, int(n * q))], 2)
+    return {"n": n, "p50": pick(0.5), "p95": pick(0.95), "p99": pick(0.99), "max": round(values[-1], 2)}
+
+
+class InputLatency:
+    """pumped -> applied(틱) -> stepped(틱) -> shown 순서로 프레임마다 부름. summary()는 모은 값을 돌려주고 초기화"""
+
+    def __init__(self):
+        self.pending = []   # 꺼냈지만 아직 어느 틱 입력에도 안 들어간 시각
+        self.waiting = []   # (적용 틱, 시각): 그 틱이 계산되기를 기다림
+        self.ready = []     # 계산은 됐고 flip을 기다리는 시각
+        self.samples = []
+
+    def pumped(self, count, at=None):
+        """이번에 꺼낸 이벤트 중 조작 입력이 count개"""
+        if count:
+            self.pending.extend([time.perf_counter() if at is None else at] * count)
+
+    def applied(self, tick):
+        """지금까지 꺼낸 입력이 tick의 입력으로 들어감"""
+        if self.pending:
+            self.waiting.extend((tick, at) for at in self.pending)
+            self.pending.clear()
+
+    def stepped(self, next_tick):
+        """next_tick 앞 틱까지 계산됨 (다음 flip에 보임)"""
+        if self.waiting:
+            self.ready.extend(at for tick, at in self.waiting if tick < next_tick)
+            self.waiting = [(tick, at) for tick, at in self.waiting if tick >= next_tick]
+
+    def shown(self, at=None):
+        """flip 직후. 이번에 처음 보인 입력들의 지연(ms) 목록"""
+        if not self.ready:
+            return []
+        at = time.perf_counter() if at is None else at
+        new = [(at - t) * 1000 for t in self.ready]
+        self.ready.clear()
+        self.samples.extend(new)
+        return new
+
+    def reset(self):
+        """라운드가 바뀌어 틱 번호가 다시 시작할 때. 아직 안 보인 입력은 버림"""
+        self.pending.clear()
+        self.waiting.clear()
+        self.ready.clear()
+
+    def summary(self):
+        out = percentiles(self.samples)
+        self.samples = []
+        return out
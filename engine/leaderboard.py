@@ -0,0 +1,137 @@
+"""라운드 결과를 SQLite에 모아서 백그라운드로 쓰는 순위표"""
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+DB_NAME = "leaderboard.db"
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS rounds (
+        id INTEGER PRIMARY KEY,
+        ended_at INTEGER NOT NULL,
+        score_1p INTEGER NOT NULL,
+        score_2p INTEGER NOT NULL,
+        total INTEGER NOT NULL,
+        won INTEGER NOT NULL,
+        duration_ms INTEGER NOT NULL,
+        dead TEXT NOT NULL
+    )""",
+    # 상위 N개 조회가 행 수와 상관없이 인덱스 앞부분만 읽도록
+    "CREATE INDEX IF NOT EXISTS rounds_total ON rounds (total DESC, id)",
+)
+
+INSERT_SQL = ("INSERT INTO rounds (ended_at, score_1p, score_2p, total, won, duration_ms, dead) "
+              "VALUES (?, ?, ?, ?, ?, ?, ?)")
+TOP_SQL = ("SELECT total, score_1p, score_2p, won, dead, ended_at FROM rounds "
+           "ORDER BY total DESC, id LIMIT ?")
+
+
+def make_row(score_1p, score_2p, won, duration_ms, dead):
+    """dead: 죽은 플레이어 ("1P" / "2P"), 승리면 빈 문자열"""
+    return (int(time.time()), score_1p, score_2p, score_1p + score_2p, int(won), duration_ms, dead)
+
+
+class Leaderboard:
+    """라운드 결과를 directory/leaderboard.db (SQLite, WAL)에 저장. 쓰기와 상위 점수 조회는 백그라운드 스레드에서
+
+    enabled=False면 스레드도 파일도 만들지 않고 submit()은 버리고 top_scores()는 빈 목록.
+    """
+
+    def __init__(self, directory: str, enabled: bool = True, top_n: int = 5, batch_size: int = 64,
+                 flush_interval: float = 0.5):
+        self.enabled = enabled
+        self.path = None
+        self.top_n = top_n
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.top = []              # 마지막으로 커밋된 기준 상위 기록 (total, 1P, 2P, won, dead, ended_at)
+        self._queue = queue.Queue()
+        self._uncommitted = []     # 넣었지만 아직 커밋 안 된 행
+        self._lock = threading.Lock()
+        self._thread = None
+        if not enabled:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, DB_NAME)
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+
+    def submit(self, row):
+        """make_row()로 만든 행을 큐에 넣고 바로 리턴"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._uncommitted.append(row)
+        self._queue.put(row)
+
+    def top_scores(self):
+        """커밋된 상위 기록에 아직 커밋 안 된 행까지 합쳐서 돌려줌 (DB 접근 없음)"""
+        with self._lock:
+            pending = [(r[3], r[1], r[2], r[4], r[6], r[0]) for r in self._uncommitted]
+            rows = self.top + pending
+        rows.sort(key=lambda r: -r[0])
+        return rows[:self.top_n]
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        for stmt in SCHEMA:
+            conn.execute(stmt)
+        conn.commit()
+        return conn
+
+    def _run(self):
+        conn = self._connect()
+        self._refresh_top(conn)
+        running = True
+        while running:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            item = first
+            while True:
+                if item is None:
+                    running = False
+                else:
+                    batch.append(item)
+                if not running or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                with conn:
+                    conn.executemany(INSERT_SQL, batch)
+                self._refresh_top(conn, committed=len(batch))
+        conn.close()
+
+    def _refresh_top(self, conn, committed=0):
+        rows = conn.execute(TOP_SQL, (self.top_n,)).fetchall()
+        # 상위 기록 교체와 대기 행 정리를 한 번에 해야 조회 중에 행이 빠지지 않음
+        with self._lock:
+            self.top = rows
+            del self._uncommitted[:committed]
+
+
+if __name__ == "__main__":
+    # 사용법: python -m engine.leaderboard [db 경로] [개수]
+    db_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join("./leaderboard", DB_NAME)
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    conn = sqlite3.connect(db_path)
+    for rank, (total, s1, s2, won, dead, ended_at) in enumerate(conn.execute(TOP_SQL, (n,)), 1):
+        result = "WIN" if won else f"{dead} DEAD"
+        print(f"{rank:>3}. {total:>4}  (1P {s1} / 2P {s2})  {result}  "
+              f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(ended_at))}")
@@ -0,0 +1,382 @@
+"""두 기계에서 1P / 2P를 나눠 하는 P2P 넷플레이 (입력 지연 + 되감기)
+
+양쪽이 같은 seed로 PlayState를 만들고 틱 번호로 시각을 정하므로, 같은 입력이면 같은 결과가 나옴.
+주고받는 건 틱마다 입력 1바이트뿐. 상대 입력이 아직 안 왔으면 마지막 입력을 그대로 쓴다고 예측해서
+진행하고, 나중에 실제 입력이 예측과 다르면 그 틱의 스냅샷으로 되감아 지금 틱까지 다시 계산함.
+
+사용법:
+    python -m engine.netplay 1P <상대 IP>[:포트] [내 포트]   # 한쪽은 1P (seed를 정함)
+    python -m engine.netplay 2P <상대 IP>[:포트] [내 포트]   # 다른 쪽은 2P
+    python -m engine.netplay loopback [틱 수] [지연] [손실률]  # 한 기계에서 두 세션을 돌려 비교
+"""
+import random
+import socket
+import struct
+import sys
+import time
+
+from engine import rules
+from engine.config import (
+    FPS, NETPLAY_INPUT_DELAY, NETPLAY_MAX_ROLLBACK, NETPLAY_PORT, NETPLAY_RESEND,
+)
+from engine.rules import pack_input, unpack_input
+
+# 패킷: 종류 1바이트 + 내용 (네트워크 바이트 순서)
+PK_HELLO = b"H"      # 1P -> 2P: seed
+PK_WELCOME = b"W"    # 2P -> 1P: seed 받음
+PK_INPUT = b"I"      # 라운드, 받은 마지막 틱(ack), 첫 틱, 개수, 입력 바이트들
+HELLO = struct.Struct("!cI")
+INPUT_HEADER = struct.Struct("!cHiiB")
+
+NO_MOVE = (0, 0, False)
+
+
+def tick_ms(tick):
+    """틱 번호 -> 시뮬레이션 시각 (벽시계 대신 써서 양쪽 시각이 같음)"""
+    return tick * 1000 // FPS
+
+
+class LoopbackTransport:
+    """한 프로세스 안에서 두 세션을 잇는 가짜 연결. 지연은 받는 쪽 recv 호출 횟수(프레임) 기준"""
+
+    def __init__(self, latency=0, jitter=0, drop=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.drop = drop
+        self.rng = random.Random(seed)
+        self.peer = None
+        self.inbox = []   # (도착할 recv 번호, 패킷)
+        self.polls = 0
+
+    @classmethod
+    def pair(cls, latency=0, jitter=0, drop=0.0, seed=0):
+        a = cls(latency, jitter, drop, seed)
+        b = cls(latency, jitter, drop, seed + 1)
+        a.peer, b.peer = b, a
+        return a, b
+
+    def send(self, data):
+        if self.rng.random() < self.drop:
+            return
+        at = self.peer.polls + self.latency + self.rng.randint(0, self.jitter)
+        self.peer.inbox.append((at, data))
+
+    def recv(self):
+        self.polls += 1
+        ready = [d for at, d in self.inbox if at <= self.polls]
+        self.inbox = [(at, d) for at, d in self.inbox if at > self.polls]
+        return ready
+
+    def close(self):
+        pass
+
+
+class UdpTransport:
+    """논블로킹 UDP 소켓. 상대 주소에서 온 패킷만 받음"""
+
+    def __init__(self, peer_addr, port=NETPLAY_PORT):
+        self.peer_addr = (socket.gethostbyname(peer_addr[0]), peer_addr[1])
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("", port))
+        self.sock.setblocking(False)
+
+    def send(self, data):
+        try:
+            self.sock.sendto(data, self.peer_addr)
+        except OSError:
+            pass   # 상대가 아직 안 켜졌으면 버림 (다음 프레임에 다시 보냄)
+
+    def recv(self):
+        out = []
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                continue   # 윈도우에서 상대 포트가 닫혀 있으면 recv가 ConnectionResetError를 냄
+            if addr[0] == self.peer_addr[0]:
+                out.append(data)
+        return out
+
+    def close(self):
+        self.sock.close()
+
+
+class RollbackStats:
+    """프레임마다 되감은 틱 수(depth)와 다시 계산하는 데 걸린 시간. summary()는 모은 값을 돌려주고 초기화"""
+
+    def __init__(self):
+        self.last_depth = 0
+        self.last_resim_ms = 0.0
+        self._reset()
+
+    def _reset(self):
+        self.frames = 0
+        self.stalls = 0
+        self.depths = []
+        self.resim_ms = []
+
+    def frame(self, depth, resim_ms, stalled=False):
+        self.frames += 1
+        self.stalls += stalled
+        self.last_depth = depth
+        self.last_resim_ms = resim_ms
+        if depth:
+            self.depths.append(depth)
+            self.resim_ms.append(resim_ms)
+
+    def summary(self):
+        depths, times = sorted(self.depths), sorted(self.resim_ms)
+        n = len(depths)
+        out = {"frames": self.frames, "stalls": self.stalls, "rollbacks": n}
+        if n:
+            out.update({
+                "depth_avg": round(sum(depths) / n, 2),
+                "depth_max": depths[-1],
+                "resim_avg_ms": round(sum(times) / n, 3),
+                "resim_p95_ms": round(times[min(n - 1, int(n * 0.95))], 3),
+                "resim_max_ms": round(times[-1], 3),
+            })
+        self._reset()
+        return out
+
+
+class RollbackSession:
+    """내 입력은 input_delay 틱 뒤에 적용하고, 상대 입력은 예측해서 먼저 진행한 뒤 틀리면 되감음
+
+    local: 0 = 이 기계가 1P, 1 = 2P. 라운드마다 start_round로 새 PlayState를 넘김.
+    """
+
+    def __init__(self, local, transport, input_delay=NETPLAY_INPUT_DELAY,
+                 max_rollback=NETPLAY_MAX_ROLLBACK, resend=NETPLAY_RESEND):
+        self.local = local
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.resend = resend
+        self.seed = None
+        self.connected = False
+        self.stats = RollbackStats()
+        self.state = None
+        self.round_no = -1
+        self.early = []   # 상대가 먼저 시작한 다음 라운드 패킷
+
+    # --- 연결 ---
+    def handshake(self, seed=None):
+        """프레임마다 부름. 1P는 seed를 보내고 2P는 받아서 답함. 양쪽 seed가 맞으면 True"""
+        if self.local == 0 and self.seed is None:
+            self.seed = seed if seed is not None else random.getrandbits(32)
+        if self.local == 0 and not self.connected:
+            self.transport.send(HELLO.pack(PK_HELLO, self.seed))
+        self.poll()
+        return self.connected
+
+    def round_seed(self, round_no):
+        return (self.seed * 1000003 + round_no) & 0xFFFFFFFF
+
+    # --- 라운드 ---
+    def start_round(self, state, round_no):
+        """state는 round_seed(round_no)로 만든 PlayState (start_ms=0)"""
+        self.state = state
+        self.round_no = round_no
+        self.tick = 0                # 다음에 계산할 틱
+        self.local_inputs = {t: NO_MOVE for t in range(self.input_delay)}
+        self.remote_inputs = {}
+        self.remote_confirmed = -1   # 이 틱까지는 상대 입력을 빠짐없이 받음
+        self.peer_ack = -1           # 상대가 빠짐없이 받은 내 입력의 마지막 틱
+        self.predicted = {}          # 틱 -> 예측해서 쓴 상대 입력 (아직 실제 입력이 안 온 틱만)
+        self.snapshots = {}          # 틱 -> 그 틱을 계산하기 전 상태
+        self.rollback_from = None
+        self.rolled_back = 0         # 마지막 advance에서 되감은 틱 수 (관전 화면 다시 맞추기용)
+        pending, self.early = self.early, []
+        for data in pending:
+            self._receive(data)
+
+    @property
+    def now_ms(self):
+        return tick_ms(self.tick)
+
+    @property
+    def ended(self):
+        return self.state.game_over or self.state.game_won
+
+    @property
+    def synced(self):
+        """지금 상태가 예측 없이 양쪽 실제 입력만으로 계산됐는지 (라운드 결과를 확정해도 되는지)"""
+        return self.remote_confirmed >= self.tick - 1
+
+    @property
+    def delivered(self):
+        """내 입력을 상대가 모두 받았는지. 라운드를 끝내기 전에 이걸 기다려야 상대가 멈추지 않음"""
+        return self.peer_ack >= max(self.local_inputs, default=-1)
+
+    def advance(self, local_input, feathers=True):
+        """프레임마다 한 번. 한 틱 진행하고 그 틱의 이벤트를 돌려줌. 상대를 기다려야 하면 None"""
+        self.poll()
+        if self.tick + self.input_delay not in self.local_inputs:
+            # 한 번 보낸 틱의 입력은 바꾸지 않음 (기다리는 동안 누른 키는 버림)
+            self.local_inputs[self.tick + self.input_delay] = local_input
+        self._send()
+        depth, resim_ms = self._rollback(feathers)
+        self.rolled_back = depth
+
+        if self.tick - self.remote_confirmed > self.max_rollback:
+            self.stats.frame(depth, resim_ms, stalled=True)
+            return None
+        self.stats.frame(depth, resim_ms)
+        if self.ended:
+            return []
+        events = self._step(self.tick, feathers)
+        self.tick += 1
+        self._prune()
+        return events
+
+    def flush(self):
+        """진행 없이 받고 보내기만 (라운드 사이 대기 화면용)"""
+        self.poll()
+        self._send()
+        self._rollback(True)
+
+    # --- 내부 ---
+    def poll(self):
+        for data in self.transport.recv():
+            self._receive(data)
+
+    def _receive(self, data):
+        kind = data[:1]
+        if kind == PK_HELLO and self.local == 1:
+            (_, seed) = HELLO.unpack_from(data)
+            if self.seed is None:
+                self.seed = seed
+            self.connected = True
+            self.transport.send(HELLO.pack(PK_WELCOME, self.seed))
+        elif kind == PK_WELCOME and self.local == 0:
+            self.connected = True
+        elif kind == PK_INPUT:
+            _, round_no, ack, first, count = INPUT_HEADER.unpack_from(data)
+            if round_no > self.round_no:
+                self.early.append(data)
+                return
+            if round_no < self.round_no or self.state is None:
+                return
+            self.peer_ack = max(self.peer_ack, ack)
+            body = data[INPUT_HEADER.size:INPUT_HEADER.size + count]
+            for t, b in enumerate(body, first):
+                if t in self.remote_inputs or t <= self.remote_confirmed:
+                    continue
+                inp = unpack_input(b)
+                self.remote_inputs[t] = inp
+                guess = self.predicted.pop(t, None)
+                if guess is not None and guess != inp:
+                    self.rollback_from = t if self.rollback_from is None else min(self.rollback_from, t)
+            while self.remote_confirmed + 1 in self.remote_inputs:
+                self.remote_confirmed += 1
+
+    def _send(self):
+        if self.state is None:
+            return
+        first = self.peer_ack + 1
+        last = max(self.local_inputs)
+        body = bytes(pack_input(self.local_inputs[t]) for t in range(first, min(last + 1, first + self.resend)))
+        self.transport.send(INPUT_HEADER.pack(PK_INPUT, self.round_no, self.remote_confirmed, first, len(body)) + body)
+
+    def _predict(self):
+        # 상대가 마지막으로 누르고 있던 방향을 그대로 유지한다고 봄. 스킬은 한 번 누르는 키라 예측하지 않음
+        dx, dy, _ = self.remote_inputs.get(self.remote_confirmed, NO_MOVE)
+        return dx, dy, False
+
+    def _step(self, t, feathers):
+        remote = self.remote_inputs.get(t)
+        if remote is None:
+            remote = self.predicted[t] = self._predict()
+        self.snapshots[t] = self.state.snapshot()
+        local = self.local_inputs[t]
+        inputs = (local, remote) if self.local == 0 else (remote, local)
+        return rules.step(self.state, inputs, tick_ms(t), feathers)
+
+    def _rollback(self, feathers):
+        """예측이 틀린 가장 이른 틱으로 되감고 지금 틱까지 다시 계산. (되감은 틱 수, 걸린 ms)"""
+        t0 = self.rollback_from
+        if t0 is None:
+            return 0, 0.0
+        self.rollback_from = None
+        start = time.perf_counter()
+        end = self.tick
+        self.state.restore(self.snapshots[t0])
+        self.predicted = {t: p for t, p in self.predicted.items() if t < t0}
+        for t in range(t0, end):
+            self._step(t, feathers)   # 다시 계산하는 틱의 이벤트(효과음/효과)는 버림
+            if self.ended:
+                # 고친 입력으로는 더 일찍 끝났으면 거기서 멈춤
+                self.tick = t + 1
+                break
+        depth = end - t0
+        return depth, (time.perf_counter() - start) * 1000
+
+    def _prune(self):
+        keep_from = min(self.remote_confirmed + 1, self.tick)   # 이보다 앞 틱은 되감거나 다시 계산할 일이 없음
+        for t in [t for t in self.snapshots if t < keep_from]:
+            del self.snapshots[t]
+        for t in [t for t in self.remote_inputs if t < keep_from and t != self.remote_confirmed]:
+            del self.remote_inputs[t]
+        for t in [t for t in self.local_inputs if t < keep_from and t <= self.peer_ack]:
+            del self.local_inputs[t]
+
+
+def parse_addr(text, default_port=NETPLAY_PORT):
+    host, _, port = text.partition(":")
+    return host, int(port) if port else default_port
+
+def run_loopback(ticks=1800, latency=3, drop=0.05, seed=1):
+    """같은 기계에서 두 세션을 무작위 입력으로 돌리고, 끝난 뒤 두 상태가 같은지 비교"""
+    from engine.config import F_H, F_W
+    from engine.replay import pack_state
+    from engine.state import Layout, PlayState
+
+    layout = Layout.for_window(F_W, F_H)
+    ta, tb = LoopbackTransport.pair(latency=latency, jitter=2, drop=drop, seed=seed)
+    sessions = [RollbackSession(0, ta), RollbackSession(1, tb)]
+    while not all([s.handshake(seed) for s in sessions]):
+        pass
+    for s in sessions:
+        s.start_round(PlayState(layout, 0, seed=s.round_seed(0)), 0)
+
+    def done(s):
+        return s.tick >= ticks or (s.ended and s.synced)
+
+    rng = random.Random(seed)
+    held = [NO_MOVE, NO_MOVE]
+    for _ in range(ticks * 4):
+        if all(done(s) for s in sessions):
+            break
+        for who, s in enumerate(sessions):
+            if rng.random() < 0.1:
+                held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.05)
+            if done(s):
+                s.flush()
+            else:
+                s.advance(held[who])
+    a, b = sessions
+    same = a.tick == b.tick and a.synced and b.synced and pack_state(a.state) == pack_state(b.state)
+    print(f"ticks {a.tick}/{b.tick}, scores {a.state.score_1p}:{a.state.score_2p} / "
+          f"{b.state.score_1p}:{b.state.score_2p}, {'in sync' if same else 'DESYNC'}")
+    for name, s in zip(("1P", "2P"), sessions):
+        print(name, s.stats.summary())
+    return same
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    if sys.argv[1] == "loopback":
+        args = sys.argv[2:]
+        ok = run_loopback(int(args[0]) if len(args) > 0 else 1800,
+                          int(args[1]) if len(args) > 1 else 3,
+                          float(args[2]) if len(args) > 2 else 0.05)
+        sys.exit(0 if ok else 1)
+    who = {"1P": 0, "2P": 1}[sys.argv[1].upper()]
+    transport = UdpTransport(parse_addr(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) > 3 else NETPLAY_PORT)
+    from engine.game import main
+    main(RollbackSession(who, transport))
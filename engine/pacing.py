@@ -0,0 +1,139 @@
+"""프레임 맞추기 (clock.tick(FPS) 대신). 방식은 config.FRAME_PACING
+
+- sleep: clock.tick. 잠들었다 깨므로 CPU는 적게 쓰지만 깨는 시각이 OS 타이머만큼 흔들림 (기존 방식)
+- busy: clock.tick_busy_loop. 목표 시각까지 돌면서 기다림. 정확하지만 기다리는 동안 CPU 한 코어
+- hybrid: 목표 시각 PACING_SPIN_MS 전까지 자고 나머지만 돌면서 기다림
+- vsync: 기다리지 않고 flip/present가 화면 갱신을 기다림. 창을 vsync로 열어야 하고,
+  처음 VSYNC_PROBE_FRAMES 동안 간격이 FPS에 맞지 않으면 (드라이버가 무시했거나 주사율이 다르면) hybrid로 바꿈
+
+프레임 시간은 tick()이 돌아오는 간격(화면에 보이는 간격). stats()가 백분위, 1ms 단위 히스토그램, CPU 사용률을 돌려줌.
+"""
+import time
+
+import pygame
+
+from engine.config import FRAME_PACING, PACE_BUSY, PACE_HYBRID, PACE_SLEEP, PACE_VSYNC, PACING_SPIN_MS
+from engine.latency import percentiles
+
+PACING_MODES = (PACE_SLEEP, PACE_BUSY, PACE_HYBRID, PACE_VSYNC)
+VSYNC_PROBE_FRAMES = 60
+HISTOGRAM_MAX_MS = 50   # 이보다 긴 프레임은 마지막 칸에 모음
+
+
+class FramePacer:
+    def __init__(self, fps, mode=FRAME_PACING, spin_ms=PACING_SPIN_MS):
+        if mode not in PACING_MODES:
+            raise ValueError(f"알 수 없는 프레임 맞추기 방식: {mode}")
+        self.fps = fps
+        self.mode = mode
+        self.period = 1.0 / fps
+        self.spin = spin_ms / 1000
+        self.clock = pygame.time.Clock()
+        self.deadline = None        # hybrid: 다음 프레임을 시작할 시각
+        self.last = None            # 지난 tick()이 돌아온 시각
+        self.presented = None       # vsync: flip/present를 부르기 직전 시각
+        self.work_ms = 0.0          # 기다린 시간을 뺀 지난 프레임 작업 시간
+        self.fallback = None        # vsync가 안 맞아서 바꿨으면 그 이유
+        self.probe = []
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.frame_ms = []
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+
+    def tick(self):
+        """프레임 시작에 한 번. 지난 tick부터 지난 ms (clock.tick처럼 정수)"""
+        start = time.perf_counter()
+        if self.last is not None:
+            done = self.presented if self.mode == PACE_VSYNC and self.presented is not None else start
+            self.work_ms = (done - self.last) * 1000
+        if self.mode == PACE_SLEEP:
+            self.clock.tick(self.fps)
+        elif self.mode == PACE_BUSY:
+            self.clock.tick_busy_loop(self.fps)
+        elif self.mode == PACE_HYBRID:
+            self._wait_hybrid()
+        now = time.perf_counter()
+        if self.last is None:
+            self.last = now
+            return round(self.period * 1000)
+        elapsed = now - self.last
+        self.last = now
+        self.frame_ms.append(elapsed * 1000)
+        if self.mode == PACE_VSYNC:
+            self._check_vsync(elapsed)
+        return round(elapsed * 1000)
+
+    def resume(self):
+        """게임을 안 돌리던 시간(결과 화면, 접속 대기) 뒤에 부름. 다음 tick()은 한 프레임 값을 돌려주고 아무것도 안 남김"""
+        self.last = None
+        self.deadline = None
+        self.presented = None
+        self.work_ms = 0.0
+
+    def before_present(self):
+        """flip/present 바로 전 (vsync에서 flip이 기다린 시간을 작업 시간에서 빼려고)"""
+        self.presented = time.perf_counter()
+
+    def _wait_hybrid(self):
+        now = time.perf_counter()
+        if self.deadline is None or now - self.deadline > self.period:
+            # 처음이거나 한 프레임 넘게 밀렸으면 따라잡지 않고 지금부터 다시
+            self.deadline = now
+        else:
+            sleep_s = self.deadline - now - self.spin
+            if sleep_s > 0:
+                time.sleep(sleep_s)
+            while time.perf_counter() < self.deadline:
+                pass
+        self.deadline += self.period
+
+    def _check_vsync(self, elapsed):
+        if self.probe is None:
+            return
+        self.probe.append(elapsed)
+        if len(self.probe) < VSYNC_PROBE_FRAMES:
+            return
+        median = sorted(self.probe)[len(self.probe) // 2]
+        self.probe = None
+        # 틱 속도가 FPS 기준이라 화면 갱신이 FPS보다 빠르면 게임이 빨라짐
+        if median < self.period * 0.9:
+            self.fallback = f"vsync interval {median * 1000:.1f} ms < {self.period * 1000:.1f} ms"
+            self.mode = PACE_HYBRID
+
+    def stats(self):
+        """지금까지의 프레임 시간 통계를 돌려주고 초기화
+
+        {"mode", "n", "p50", "p95", "p99", "max", "jitter"(평균 절대 편차 ms), "cpu_pct", "hist"{ms: 프레임 수}}
+        """
+        times = self.frame_ms
+        cpu = time.process_time() - self.cpu_start
+        wall = time.perf_counter() - self.wall_start
+        self._reset_stats()
+        out = {"mode": self.mode}
+        if not times:
+            return out
+        out.update(percentiles(times))
+        avg = sum(times) / len(times)
+        out["jitter"] = round(sum(abs(t - avg) for t in times) / len(times), 2)
+        out["cpu_pct"] = round(cpu * 100 / wall, 1) if wall > 0 else 0.0
+        hist = {}
+        for t in times:
+            bucket = min(int(t), HISTOGRAM_MAX_MS)
+            hist[bucket] = hist.get(bucket, 0) + 1
+        out["hist"] = dict(sorted(hist.items()))
+        return out
+
+
+def format_histogram(hist, width=40):
+    """stats()["hist"] -> 줄 목록 ("16 ms |######## 812")"""
+    if not hist:
+        return []
+    top = max(hist.values())
+    lines = []
+    for ms in range(min(hist), max(hist) + 1):
+        n = hist.get(ms, 0)
+        label = f"{ms}+" if ms == HISTOGRAM_MAX_MS else str(ms)
+        lines.append(f"{label:>4} ms |{'#' * round(n * width / top):<{width}} {n}")
+    return lines
@@ -0,0 +1,95 @@
+"""프레임 시간에 따라 그리기 품질 단계를 내리고 올리는 조절기"""
+import collections
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    name: str
+    max_effects: int          # 동시에 보여줄 SlashEffect 최대 개수 (None이면 제한 없음)
+    arrow_feathers: bool      # 화살 스프라이트에 깃털 레이어를 그릴지
+    smooth_background: bool   # 배경을 smoothscale로 만들지 (False면 scale + 불투명 변환)
+    fight_draw_every: int     # 전투 장면을 몇 프레임마다 다시 그릴지
+
+
+# 0번이 최고 품질, 뒤로 갈수록 가벼운 설정
+QUALITY_TIERS = (
+    QualityTier("HIGH", None, True, True, 1),
+    QualityTier("MEDIUM", 6, True, True, 1),
+    QualityTier("LOW", 2, False, True, 1),
+    QualityTier("LOWER", 0, False, False, 1),
+    QualityTier("MIN", 0, False, False, 2),
+)
+
+
+class QualityGovernor:
+    """최근 프레임 시간 평균을 보고 품질 단계를 내리고 올림"""
+
+    def __init__(self, budget_ms: float, window: int = 60,
+                 degrade_ratio: float = 1.0, recover_ratio: float = 0.7,
+                 recover_hold: int = 180):
+        self.budget_ms = budget_ms
+        self.window = window
+        self.degrade_ratio = degrade_ratio    # 평균이 예산 * 이 값을 넘으면 한 단계 내림
+        self.recover_ratio = recover_ratio    # 평균이 예산 * 이 값보다 낮게 유지되면 한 단계 올림
+        self.recover_hold = recover_hold      # 여유가 이 프레임 수만큼 계속돼야 올림 (히스테리시스)
+        self.samples = collections.deque(maxlen=window)
+        self.total_ms = 0.0
+        self.headroom_frames = 0
+        self.level = 0
+        self.last_change = None   # (이전 단계 이름, 새 단계 이름, 당시 평균 ms)
+
+    @property
+    def tier(self) -> QualityTier:
+        return QUALITY_TIERS[self.level]
+
+    def average_ms(self):
+        if not self.samples:
+            return 0.0
+        return self.total_ms / len(self.samples)
+
+    def record(self, frame_ms: float) -> bool:
+        """프레임 작업 시간을 기록하고, 단계가 바뀌었으면 True"""
+        if len(self.samples) == self.window:
+            self.total_ms -= self.samples[0]
+        self.samples.append(frame_ms)
+        self.total_ms += frame_ms
+
+        # 단계를 바꾼 직후에는 창이 다시 찰 때까지 판단하지 않음
+        if len(self.samples) < self.window:
+            return False
+
+        avg = self.total_ms / self.window
+        if avg > self.budget_ms * self.degrade_ratio:
+            self.headroom_frames = 0
+            if self.level < len(QUALITY_TIERS) - 1:
+                return self._set_level(self.level + 1, avg)
+            return False
+
+        if avg < self.budget_ms * self.recover_ratio:
+            self.headroom_frames += 1
+            if self.headroom_frames >= self.recover_hold and self.level > 0:
+                return self._set_level(self.level - 1, avg)
+        else:
+            self.headroom_frames = 0
+        return False
+
+    def reset_window(self):
+        """모은 프레임 시간을 버림 (결과 화면처럼 게임을 안 돌린 뒤 새로 잴 때)"""
+        self.samples.clear()
+        self.total_ms = 0.0
+        self.headroom_frames = 0
+
+    def _set_level(self, level: int, avg_ms: float) -> bool:
+        old = self.tier
+        self.level = level
+        self.reset_window()
+        self.last_change = (old.name, self.tier.name, round(avg_ms, 2))
+        return True
+
+    def allow_effect(self, effect_count: int) -> bool:
+        limit = self.tier.max_effects
+        return limit is None or effect_count < limit
+
+    def should_draw_fight(self, frame_no: int) -> bool:
+        return frame_no % self.tier.fight_draw_every == 0
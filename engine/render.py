@@ -0,0 +1,257 @@
+"""그리기 (전투 장면, 피하기 구역, HUD, 게임 오버 화면). 에셋은 FightScene을 만들 때 읽음"""
+import pygame
+
+from engine.animation import Actor, Animator, Clip
+from engine.config import (
+    BACKGROUND_PATH, BG_COLOR, BOSS_FRAME_MS, CHAR_FRAME_MS, FIGHT_HEROES, FRAME_COLOR, HUD_BG, HUD_H,
+    PLAYER_COLORS, RULE_DODGE, RULE_SCRAPE, TEXT_COLOR,
+)
+from engine.shapes import arrow_hitbox, arrow_shapes, circle_outline
+from engine.sprite_cache import format_memory_report, sprites
+
+
+def getImage(path: str, scale=0.6):
+    return sprites.get(path, scale)
+
+class FightScene:
+    """위쪽 전투 장면: 배경 + 1P / 보스 / 2P 애니메이션"""
+
+    def __init__(self):
+        self.backgrounds = None   # {smooth: 화면 크기로 줄인 배경}
+        self.background = None
+        self.background_smooth = None
+        char1Idle = getImage("./assets/player/1/idle.png")
+        char1Attack = [getImage(f"./assets/player/1/attack{i}.png") for i in range(2)]
+        char2Idle = getImage("./assets/player/2/idle.png")
+        char2Attack = [getImage(f"./assets/player/2/attack{i}.png") for i in range(2)]
+        bossIdle = getImage("./assets/boss/idle.png", scale=1.0)
+        bossHit = [getImage(f"./assets/boss/attack{i}.png", scale=1.0) for i in range(3)]
+
+        # 최종 변형을 다 만들었으니 변형 재료로만 쓴 원본은 놓아줌
+        sprites.release_sources()
+
+        self.animator = Animator()
+        self.animator.add(Actor("char1", {"idle": Clip([char1Idle], CHAR_FRAME_MS, loop=True),
+                                          "attack": Clip(char1Attack, CHAR_FRAME_MS)}))
+        self.animator.add(Actor("boss", {"idle": Clip([bossIdle], BOSS_FRAME_MS, loop=True),
+                                         "hit": Clip(bossHit, BOSS_FRAME_MS, loop=True)},
+                                reacts_to=[name for name, _ in FIGHT_HEROES], react_clip="hit"))
+        self.animator.add(Actor("char2", {"idle": Clip([char2Idle], CHAR_FRAME_MS, loop=True),
+                                          "attack": Clip(char2Attack, CHAR_FRAME_MS)}))
+        self.last_attack_scores = [0] * len(FIGHT_HEROES)
+
+    def build_background(self, w, h):
+        """배경 원본(1397x1032, 약 5.5MB)은 상주시키지 않고, 한 번 읽어서 화면 크기로 줄인 두 가지
+        (smoothscale / scale)만 남김. 품질 단계가 바뀌면 둘 중 하나로 바꾸기만 하므로 프레임 도중에 다시 읽지 않음
+        """
+        # 배경은 완전히 불투명하므로 알파 없이 변환
+        source = pygame.image.load(BACKGROUND_PATH).convert()
+        self.backgrounds = {True: pygame.transform.smoothscale(source, (w, h)),
+                            False: pygame.transform.scale(source, (w, h))}
+
+    def set_layout(self, current_F_W, current_FIGHT_H, smooth=True):
+        """창 크기가 바뀌었을 때만 배경을 다시 만듦. 품질 단계(smooth)는 만들어 둔 것 중에서 고름"""
+        if self.backgrounds is None or self.backgrounds[True].get_size() != (current_F_W, current_FIGHT_H):
+            self.build_background(current_F_W, current_FIGHT_H)
+        self.background = self.backgrounds[smooth]
+        self.background_smooth = smooth
+
+        char1_x = current_F_W * 1 // 4
+        boss_x = current_F_W * 2 // 4
+        char2_x = current_F_W * 3 // 4
+
+        pos_y = current_FIGHT_H // 2
+
+        animator = self.animator
+        char1_w, char1_h = animator["char1"].clips["idle"].frames[0].get_size()
+        boss_w, boss_h = animator["boss"].clips["idle"].frames[0].get_size()
+        char2_w, char2_h = animator["char2"].clips["idle"].frames[0].get_size()
+
+        animator["char1"].pos = (char1_x - char1_w // 2 - 90, pos_y - char1_h // 2 + 40)
+        animator["boss"].pos = (boss_x - boss_w // 2, pos_y - boss_h // 2)
+        animator["char2"].pos = (char2_x - char2_w // 2 + 90, pos_y - char2_h // 2 + 40)
+
+    def try_attack(self, scores):
+        """점수가 간격만큼 오를 때마다 공격 애니메이션을 큐에 넣음 (재생 중이어도 버리지 않음)"""
+        for i, (name, threshold) in enumerate(FIGHT_HEROES):
+            if scores[i] >= self.last_attack_scores[i] + threshold:
+                self.animator.trigger(name, "attack")
+                self.last_attack_scores[i] = scores[i]
+
+    def tick(self, dt_ms):
+        self.animator.tick(dt_ms)
+
+    def new_round(self):
+        self.last_attack_scores = [0] * len(FIGHT_HEROES)
+
+    def reset(self):
+        self.animator.reset()
+
+    def draw(self, surf):
+        surf.blit(self.background, (0, 0))
+        self.animator.draw(surf)
+
+def memory_report(fight: FightScene, arrows):
+    """지금 메모리에 올라와 있는 서피스 목록 (이름, 형식, 바이트)"""
+    rows = [(f"background (smooth={smooth})", surf) for smooth, surf in fight.backgrounds.items()] + sprites.report()
+    # 화살 그림/마스크는 각도 구간별로 공유하므로 화살 수가 아니라 모양 수만큼만 셈
+    shape_bytes = sum(shape.nbytes() for shape in arrow_shapes.values())
+    rows.append((f"arrow shapes x{len(arrow_shapes)} ({len(arrows)} live)", ("32bit RGBA + mask", shape_bytes)))
+    return format_memory_report(rows)
+
+def draw_arrow(surf, arrow, show_hitbox=False):
+    image, dx, dy = arrow_hitbox(arrow.shape) if show_hitbox else arrow.shape.blit
+    surf.blit(image, (int(arrow.x) + dx, int(arrow.y) + dy))
+
+# (크기, 굵게) -> Font. SysFont는 부를 때마다 글꼴 파일을 다시 찾고 읽으므로 프레임마다 만들지 않음
+_fonts = {}
+
+def get_font(size, bold=False):
+    font = _fonts.get((size, bold))
+    if font is None:
+        font = _fonts[(size, bold)] = pygame.font.SysFont("malgungothic", size, bold=bold)
+    return font
+
+def clear_fonts():
+    """pygame.quit() 뒤 다시 init할 때 부름 (이전 세션의 Font는 쓰면 죽음)"""
+    _fonts.clear()
+
+def draw_arrows(surf, arrows, show_hitbox=False):
+    """화살 전부를 blits 한 번으로 (지옥 모드처럼 수천 개면 화살마다 blit을 부르는 비용이 큼)
+
+    show_hitbox면 판정에 쓰는 몸통/화살촉 마스크 외곽선을 겹친 그림(모양마다 한 번 만들어 둔 것)을 대신 그림.
+    화살마다 blit 한 번은 그대로라 켜 둬도 프레임 시간이 크게 달라지지 않음.
+    """
+    if show_hitbox:
+        surf.blits([(image, (int(a.x) + dx, int(a.y) + dy)) for a in arrows
+                    for image, dx, dy in (arrow_hitbox(a.shape),)], doreturn=False)
+        return
+    surf.blits([(image, (int(a.x) + dx, int(a.y) + dy)) for a in arrows for image, dx, dy in (a.shape.blit,)],
+               doreturn=False)
+
+def draw_player_hitbox(surf, player):
+    image, dx, dy = circle_outline(player.r)
+    surf.blit(image, (int(player.x) + dx, int(player.y) + dy))
+
+def player_color(who: str):
+    """"1P", "2P", ... 순서대로 PLAYER_COLORS"""
+    return PLAYER_COLORS[(int(who[:-1]) - 1) % len(PLAYER_COLORS)]
+
+def draw_player(surf, player):
+    pygame.draw.circle(surf, player_color(player.who), (int(player.x), int(player.y)), player.r)
+    if player.rule == RULE_DODGE and player.r == player.small_r:
+        pygame.draw.circle(surf, (255, 255, 255), (int(player.x), int(player.y)), player.r, 2)
+
+def draw_effect(surf, effect):
+    if effect.life <= 0:
+        return
+    alpha = int(255 * (effect.life / effect.max_life))
+    color = (255, 250, 240, alpha)
+    length = effect.size
+    thickness = 3
+
+    temp = pygame.Surface((length * 2, length * 2), pygame.SRCALPHA)
+    cx, cy = length, length
+
+    pygame.draw.line(temp, color, (cx - length // 2, cy - length // 2),
+                     (cx + length // 2, cy + length // 2), thickness)
+    pygame.draw.line(temp, color, (cx - length // 2, cy + length // 2),
+                     (cx + length // 2, cy - length // 2), thickness)
+
+    temp = pygame.transform.rotate(temp, effect.angle)
+    rect = temp.get_rect(center=(int(effect.x), int(effect.y)))
+    surf.blit(temp, rect)
+
+# 스킬 키 이름 (draw_hud에 안 주면 기존 두 명 모드 키)
+DEFAULT_SKILL_KEYS = ("E", "RSHIFT")
+# 구역 폭이 이보다 좁으면 HUD를 두 줄로 줄여서 그림
+HUD_WIDE_LANE = 560
+
+def draw_hud(surf, layout, state, now_ms, tier_name, skill_keys=DEFAULT_SKILL_KEYS):
+    W = layout.w
+    lane_w = W // layout.lanes
+    pygame.draw.rect(surf, HUD_BG, pygame.Rect(0, 0, W, HUD_H))
+    pygame.draw.line(surf, FRAME_COLOR, (0, HUD_H), (W, HUD_H), 2)
+    for x in layout.dividers:
+        pygame.draw.line(surf, FRAME_COLOR, (x, 0), (x, HUD_H), 2)
+
+    wide = lane_w >= HUD_WIDE_LANE
+    title_font = get_font(26 if wide else 20, bold=True)
+    small_font = get_font(20 if wide else 15)
+
+    for i, (player, skill) in enumerate(zip(state.players, state.skills)):
+        offset_x = (layout.dividers[i - 1] if i else 0) + 20
+        if player.rule == RULE_SCRAPE:
+            bar_color, active, end_time, name = (120, 210, 255), state.slow_active, state.slow_end_time, "SLOW"
+        else:
+            bar_color, active, end_time, name = (255, 120, 180), state.small_active, state.small_end_time, "SMALL"
+        key = skill_keys[i] if i < len(skill_keys) else ""
+
+        title = title_font.render(player.who, True, player_color(player.who))
+        score = small_font.render(f"Score : {state.scores[i]}", True, TEXT_COLOR)
+        if wide:
+            surf.blit(title, (offset_x, 18))
+            surf.blit(score, (offset_x + 60, 20))
+            bar_x, bar_y, bar_w, bar_h = offset_x + 220, 24, 200, 12
+            status_pos = (bar_x + bar_w + 20, 20)
+        else:
+            surf.blit(title, (offset_x - 8, 8))
+            surf.blit(score, (offset_x + 30, 11))
+            bar_x, bar_y, bar_w, bar_h = offset_x - 8, 38, max(20, lane_w // 2 - 20), 10
+            status_pos = (bar_x + bar_w + 8, 34)
+        pygame.draw.rect(surf, (65, 70, 82), (bar_x, bar_y, bar_w, bar_h), border_radius=6)
+        ratio = skill.meter / skill.max_meter
+        pygame.draw.rect(surf, bar_color, (bar_x, bar_y, int(bar_w * ratio), bar_h), border_radius=6)
+        if active:
+            if player.rule == RULE_SCRAPE:
+                timer = f"{name} {max(0, end_time - now_ms) / 1000.0:.1f}s"
+            else:
+                timer = f"{name} {max(1, max(0, end_time - now_ms) // 1000)}s"
+            surf.blit(small_font.render(timer, True, bar_color), status_pos)
+        elif skill.ready:
+            surf.blit(small_font.render(f"{key} READY".strip(), True, bar_color), status_pos)
+
+    quality_text = small_font.render(f"Q {tier_name}", True, (150, 155, 170))
+    surf.blit(quality_text, quality_text.get_rect(topright=(W - 16, 44)))
+
+def draw_play_scene(surf, layout, state, effects, now_ms, tier_name, show_hitbox=False,
+                    skill_keys=DEFAULT_SKILL_KEYS):
+    W, H = layout.w, layout.h
+    surf.fill(BG_COLOR)
+    pygame.draw.rect(surf, (18, 20, 24), pygame.Rect(0, HUD_H, W, H - HUD_H))
+    for x in layout.dividers:
+        pygame.draw.line(surf, FRAME_COLOR, (x, HUD_H), (x, H), 3)
+    pygame.draw.rect(surf, FRAME_COLOR, pygame.Rect(0, HUD_H, W, H - HUD_H), 2)
+
+    draw_arrows(surf, state.arrows, show_hitbox)
+    for ef in effects:
+        draw_effect(surf, ef)
+
+    for player, dead in zip(state.players, state.dead):
+        if not dead:
+            draw_player(surf, player)
+            if show_hitbox:
+                draw_player_hitbox(surf, player)
+
+    draw_hud(surf, layout, state, now_ms, tier_name, skill_keys)
+
+def draw_game_over(screen, layout, state, game_won, top_scores):
+    F_W, F_H = layout.f_w, layout.f_h
+    game_over_font = get_font(80, bold=True)
+    restart_font = get_font(30)
+
+    if game_won:
+        go_text = game_over_font.render("VICTORY! YOU WIN!", True, (50, 255, 50))
+    else:
+        who = state.players[state.dead.index(True)].who
+        go_text = game_over_font.render(f"{who} DEAD. GAME OVER!", True, player_color(who))
+
+    restart_text = restart_font.render("Restarting...", True, TEXT_COLOR)
+
+    screen.fill(BG_COLOR)
+    screen.blit(go_text, go_text.get_rect(center=(F_W // 2, F_H // 2 - 50)))
+    screen.blit(restart_text, restart_text.get_rect(center=(F_W // 2, F_H // 2 + 50)))
+    for rank, (total, s1, s2, won, dead, _) in enumerate(top_scores, 1):
+        result = "WIN" if won else f"{dead} DEAD"
+        row_text = restart_font.render(f"{rank}. {total}  (1P {s1} / 2P {s2})  {result}", True, TEXT_COLOR)
+        screen.blit(row_text, row_text.get_rect(center=(F_W // 2, F_H // 2 + 80 + rank * 34)))
@@ -0,0 +1,438 @@
+"""리플레이: 틱마다 입력을 기록하고, 일정 틱마다 전체 상태(키프레임)를 같이 저장
+
+파일은 블록의 연속. 블록 하나 = 키프레임(블록 첫 틱 직전 상태) + 그 뒤 최대 REPLAY_KEYFRAME_EVERY 틱의 입력.
+틱마다 입력은 플레이어 수만큼 1바이트씩 (플레이어 수는 블록 머리에 있음).
+라운드가 바뀌거나 창 크기가 바뀌면 새 블록을 시작함. 닫을 때 (시작 틱, 파일 위치) 색인을 파일 끝에 붙임.
+원하는 틱으로 갈 때는 그 틱 이전의 가장 가까운 키프레임을 복원하고 남은 틱만 다시 계산함.
+파일은 mmap으로 열어서 필요한 블록만 읽음 (색인이 없으면 블록 머리만 훑어서 만듦).
+
+사용법: python -m engine.replay <파일> [시작 틱]
+    SPACE 멈춤, ←/→ 5초, PageUp/PageDown 1분, HOME 처음으로
+"""
+import array
+import bisect
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+
+from engine import rules
+from engine.config import FPS, MODE_HELL, MODE_NORMAL, REPLAY_KEYFRAME_EVERY, RULE_DODGE, RULE_SCRAPE
+
+MAGIC = b"DARP"
+BLOCK_MAGIC = b"BLOK"
+INDEX_MAGIC = b"RIDX"
+VERSION = 5   # 2: 플레이어 수가 정해져 있지 않음, 3: 키프레임에 모드, 4: 예약된 화살에 속도, 5: 마스크 좌표를 pixel()로 자름
+
+FILE_HEAD = struct.Struct("<4sH")
+# 매직, 첫 틱, 라운드, 창 너비/높이, 플레이어 수, 키프레임 바이트 수, 입력 틱 수
+BLOCK_HEAD = struct.Struct("<4sIIHHBII")
+TICK = struct.Struct("<IH")            # 시각(ms), 전투 장면 dt(ms). 뒤에 플레이어마다 입력 1바이트
+INDEX_ENTRY = struct.Struct("<IQ")     # 블록 첫 틱, 파일 위치
+INDEX_TAIL = struct.Struct("<Q4s")     # 색인 시작 위치, 매직
+
+# 키프레임 안의 값들
+STATE_HEAD = struct.Struct("<BBBqq")     # 플레이어 수, 모드, 플래그, 슬로우/작아지기 끝나는 시각
+PLAYER_HEAD = struct.Struct("<BiHB")     # 규칙, 점수, 스킬 게이지, 플래그
+PLAYER = struct.Struct("<ddddd")         # x, y, x0, y0, speed (반지름은 아래 B 하나)
+SPAWNER_HEAD = struct.Struct("<iIB")     # 간격, 나온 수, rng 버전
+WHEEL_HEAD = struct.Struct("<qqI")       # cursor, pending, 채워진 슬롯 수
+WHEEL_SLOT = struct.Struct("<HI")        # 슬롯 번호, 항목 수
+WHEEL_ENTRY = struct.Struct("<qB")       # 절대 슬롯, payload 있음
+ARROW_SPAWN = struct.Struct("<ddbdddd")  # 생성 위치, 노릴 플레이어, 오차, 각도, 속도
+ARROW = struct.Struct("<ddddbddddqB")    # x, y, x0, y0, target, vx, vy, dirx, diry, 마지막 점수 시각, 근접 단계
+COUNT = struct.Struct("<I")
+
+F_SLOW, F_SMALL = 1, 2           # STATE_HEAD 플래그
+F_READY, F_DEAD = 1, 2           # PLAYER_HEAD 플래그
+RULE_CODES = (RULE_SCRAPE, RULE_DODGE)
+MODE_CODES = (MODE_NORMAL, MODE_HELL)
+
+
+def tick_size(players):
+    return TICK.size + players
+
+
+# --- 키프레임 인코딩 ---
+
+def pack_state(state, fight=None):
+    """PlayState (+ 전투 장면 애니메이션) -> 바이트"""
+    (players, arrows, spawner, scores, skills,
+     slow_active, slow_end_time, small_active, small_end_time, dead) = state.snapshot()
+    flags = (F_SLOW if slow_active else 0) | (F_SMALL if small_active else 0)
+    out = [STATE_HEAD.pack(len(players), MODE_CODES.index(state.mode), flags,
+                           int(slow_end_time), int(small_end_time))]
+    for rule, (x, y, x0, y0, speed, r), score, (meter, ready), is_dead in zip(
+            state.rules, players, scores, skills, dead):
+        out.append(PLAYER_HEAD.pack(RULE_CODES.index(rule), score, meter,
+                                    (F_READY if ready else 0) | (F_DEAD if is_dead else 0)))
+        out.append(PLAYER.pack(x, y, x0, y0, speed) + bytes((r,)))
+
+    interval, spawned, (rng_version, rng_words, gauss), (cursor, pending, filled) = spawner
+    out.append(SPAWNER_HEAD.pack(interval, spawned, rng_version))
+    out.append(array.array("I", rng_words).tobytes())
+    out.append(struct.pack("<Bd", gauss is not None, gauss or 0.0))
+    out.append(WHEEL_HEAD.pack(cursor, pending, len(filled)))
+    for idx, bucket in filled:
+        out.append(WHEEL_SLOT.pack(idx, len(bucket)))
+        for abs_slot, sp in bucket:
+            out.append(WHEEL_ENTRY.pack(abs_slot, sp is not None))
+            if sp is not None:
+                out.append(ARROW_SPAWN.pack(sp.origin[0], sp.origin[1], sp.target,
+                                            sp.jitter[0], sp.jitter[1], sp.angle_offset, sp.speed))
+
+    arrow_objs, arrow_values = arrows
+    out.append(COUNT.pack(len(arrow_objs)))
+    for a, (x, y, x0, y0, last_scored, level) in zip(arrow_objs, arrow_values):
+        out.append(ARROW.pack(x, y, x0, y0, a.target, a.vx, a.vy, a.dirx, a.diry, last_scored, level))
+
+    actors = fight.animator.actors if fight is not None else ()
+    out.append(bytes((len(actors),)))
+    for actor in actors:
+        names = sorted(actor.clips)
+        out.append(struct.pack("<BdB", names.index(actor.clip_name), actor.elapsed, len(actor.queue)))
+        out.append(bytes(names.index(c) for c in actor.queue))
+    scores = fight.last_attack_scores if fight is not None else ()
+    out.append(bytes((len(scores),)))
+    out.append(array.array("i", scores).tobytes())
+    return b"".join(out)
+
+def unpack_state(data, layout, fight=None):
+    """pack_state의 반대. 새 PlayState를 만들어 돌려주고, fight를 주면 애니메이션 상태도 되돌림"""
+    from engine.entities import Arrow
+    from engine.shapes import arrow_shape
+    from engine.spawn_scheduler import ArrowSpawn
+    from engine.state import PlayState
+
+    pos = 0
+
+    def take(st):
+        nonlocal pos
+        values = st.unpack_from(data, pos)
+        pos += st.size
+        return values
+
+    n_players, mode, flags, slow_end_time, small_end_time = take(STATE_HEAD)
+    player_rules, players, scores, skills, dead = [], [], [], [], []
+    for _ in range(n_players):
+        rule, score, meter, player_flags = take(PLAYER_HEAD)
+        player_rules.append(RULE_CODES[rule])
+        scores.append(score)
+        skills.append((meter, bool(player_flags & F_READY)))
+        dead.append(bool(player_flags & F_DEAD))
+        x, y, x0, y0, speed = take(PLAYER)
+        players.append((x, y, x0, y0, speed, data[pos]))
+        pos += 1
+
+    interval, spawned, rng_version = take(SPAWNER_HEAD)
+    words = array.array("I")
+    words.frombytes(data[pos:pos + 625 * 4])
+    pos += 625 * 4
+    has_gauss, gauss = struct.unpack_from("<Bd", data, pos)
+    pos += 9
+    cursor, pending, n_filled = take(WHEEL_HEAD)
+    filled = []
+    for _ in range(n_filled):
+        idx, n = take(WHEEL_SLOT)
+        bucket = []
+        for _ in range(n):
+            abs_slot, has_payload = take(WHEEL_ENTRY)
+            sp = None
+            if has_payload:
+                ox, oy, target, jx, jy, angle, speed = take(ARROW_SPAWN)
+                sp = ArrowSpawn((ox, oy), target, (jx, jy), angle, speed)
+            bucket.append((abs_slot, sp))
+        filled.append((idx, tuple(bucket)))
+
+    (n_arrows,) = take(COUNT)
+    arrows = []
+    for _ in range(n_arrows):
+        values = take(ARROW)
+        # 그림/마스크는 저장하지 않고 방향으로 다시 찾음 (리플레이는 항상 깃털 있는 그림)
+        shape = arrow_shape(math.degrees(math.atan2(values[6], values[5])))
+        arrows.append(Arrow.from_snapshot(values + (shape,)))
+    arrow_values = tuple([(a.x, a.y, a.x0, a.y0, a.last_scored_time, a.proximity_level) for a in arrows])
+
+    # seed를 줘서 전역 random 대신 자기 Random을 쓰게 한 뒤 상태를 덮어씀
+    state = PlayState(layout, 0, seed=0, rules=tuple(player_rules), mode=MODE_CODES[mode])
+    state.restore((
+        tuple(players), (tuple(arrows), arrow_values),
+        (interval, spawned, (rng_version, tuple(words), gauss if has_gauss else None), (cursor, pending, tuple(filled))),
+        tuple(scores), tuple(skills),
+        bool(flags & F_SLOW), slow_end_time, bool(flags & F_SMALL), small_end_time, tuple(dead)))
+
+    n_actors = data[pos]
+    pos += 1
+    actor_states = []
+    for _ in range(n_actors):
+        clip_idx, elapsed, n_queue = struct.unpack_from("<BdB", data, pos)
+        pos += 10
+        actor_states.append((clip_idx, elapsed, list(data[pos:pos + n_queue])))
+        pos += n_queue
+    n_scores = data[pos]
+    pos += 1
+    scores = array.array("i")
+    scores.frombytes(data[pos:pos + n_scores * 4])
+    if fight is not None and actor_states:
+        for actor, (clip_idx, elapsed, queue) in zip(fight.animator.actors, actor_states):
+            names = sorted(actor.clips)
+            actor.clip_name = names[clip_idx]
+            actor.elapsed = elapsed
+            actor.queue.clear()
+            actor.queue.extend(names[i] for i in queue)
+        fight.last_attack_scores = list(scores)
+    return state
+
+
+# --- 쓰기 ---
+
+class ReplayWriter:
+    """step 직전에 record()를 부름. 블록이 찰 때마다 파일 끝에 덧붙임 (블록 하나는 몇 KB)"""
+
+    def __init__(self, directory: str, enabled: bool = True, keyframe_every: int = REPLAY_KEYFRAME_EVERY):
+        self.enabled = enabled
+        self.keyframe_every = keyframe_every
+        self.path = None
+        self._file = None
+        self._index = []
+        self._state = None
+        self._block = None     # (첫 틱, 라운드, 창 크기, 플레이어 수, 키프레임 바이트)
+        self._ticks = array.array("B")
+        if not enabled:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, time.strftime("session-%Y%m%d-%H%M%S.darp"))
+        self._file = open(self.path, "wb")
+        self._file.write(FILE_HEAD.pack(MAGIC, VERSION))
+
+    def record(self, tick, round_no, layout, state, fight, now_ms, dt_ms, inputs):
+        """tick 틱을 계산하기 직전에 부름. 새 라운드/배치거나 블록이 찼으면 지금 상태로 키프레임을 만듦
+
+        상태가 기록과 상관없이 바뀌었으면 (연습 모드 체크포인트 등) 먼저 flush()를 부르면 새 키프레임부터 시작함.
+        """
+        if not self.enabled:
+            return
+        n = len(self._ticks) // tick_size(len(inputs))
+        if (self._block is None or state is not self._state or round_no != self._block[1] or
+                n >= self.keyframe_every):
+            self.flush()
+            self._state = state
+            self._block = (tick, round_no, (layout.f_w, layout.f_h), len(inputs), pack_state(state, fight))
+        self._ticks.frombytes(TICK.pack(int(now_ms) & 0xFFFFFFFF, min(int(dt_ms), 0xFFFF)))
+        self._ticks.extend(rules.pack_input(inp) for inp in inputs)
+
+    def flush(self):
+        if not self.enabled or self._block is None or not self._ticks:
+            return
+        start_tick, round_no, (f_w, f_h), n_players, key = self._block
+        self._index.append((start_tick, self._file.tell()))
+        self._file.write(BLOCK_HEAD.pack(BLOCK_MAGIC, start_tick, round_no, f_w, f_h, n_players, len(key),
+                                         len(self._ticks) // tick_size(n_players)))
+        self._file.write(key)
+        self._ticks.tofile(self._file)
+        self._file.flush()
+        del self._ticks[:]
+        self._block = None
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        index_at = self._file.tell()
+        self._file.write(INDEX_MAGIC + COUNT.pack(len(self._index)))
+        for entry in self._index:
+            self._file.write(INDEX_ENTRY.pack(*entry))
+        self._file.write(INDEX_TAIL.pack(index_at, INDEX_MAGIC))
+        self._file.close()
+        self._file = None
+
+
+# --- 읽기 / 찾아가기 ---
+
+class Replay:
+    """리플레이 파일을 mmap으로 열고 틱 단위로 찾아감"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "rb")
+        self.data = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = FILE_HEAD.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 리플레이 파일이 아님")
+        if version != VERSION:
+            raise ValueError(f"{path}: 지원하지 않는 버전 {version}")
+        self.blocks = self._read_index()   # [(첫 틱, 파일 위치, 틱 수)]
+        self.starts = [b[0] for b in self.blocks]
+
+    def _read_index(self):
+        data = self.data
+        entries = None
+        if len(data) >= FILE_HEAD.size + INDEX_TAIL.size:
+            index_at, magic = INDEX_TAIL.unpack_from(data, len(data) - INDEX_TAIL.size)
+            if magic == INDEX_MAGIC and data[index_at:index_at + 4] == INDEX_MAGIC:
+                (n,) = COUNT.unpack_from(data, index_at + 4)
+                entries = [INDEX_ENTRY.unpack_from(data, index_at + 8 + i * INDEX_ENTRY.size) for i in range(n)]
+        if entries is None:
+            # 게임이 도중에 끝나 색인이 없으면 블록 머리만 따라가며 만듦
+            entries = []
+            pos = FILE_HEAD.size
+            while pos + BLOCK_HEAD.size <= len(data) and data[pos:pos + 4] == BLOCK_MAGIC:
+                _, start_tick, _, _, _, n_players, key_len, n_ticks = BLOCK_HEAD.unpack_from(data, pos)
+                end = pos + BLOCK_HEAD.size + key_len + n_ticks * tick_size(n_players)
+                if end > len(data):
+                    break
+                entries.append((start_tick, pos))
+                pos = end
+        blocks = []
+        for start_tick, offset in entries:
+            n_ticks = BLOCK_HEAD.unpack_from(data, offset)[7]
+            blocks.append((start_tick, offset, n_ticks))
+        return blocks
+
+    @property
+    def first_tick(self):
+        return self.blocks[0][0] if self.blocks else 0
+
+    @property
+    def last_tick(self):
+        """기록된 마지막 틱 다음 (이 틱의 상태까지 볼 수 있음)"""
+        if not self.blocks:
+            return 0
+        start, _, n = self.blocks[-1]
+        return start + n
+
+    def block_at(self, tick):
+        """tick 이전의 가장 가까운 키프레임 블록 번호"""
+        return max(0, bisect.bisect_right(self.starts, tick) - 1)
+
+    def open_block(self, i):
+        """(라운드, Layout, 키프레임 바이트, 입력 memoryview). Layout의 구역 수는 플레이어 수"""
+        from engine.state import Layout
+
+        _, offset, _ = self.blocks[i]
+        _, start_tick, round_no, f_w, f_h, n_players, key_len, n_ticks = BLOCK_HEAD.unpack_from(self.data, offset)
+        key_at = offset + BLOCK_HEAD.size
+        ticks_at = key_at + key_len
+        view = memoryview(self.data)
+        return (round_no, Layout.for_window(f_w, f_h, n_players), view[key_at:ticks_at],
+                view[ticks_at:ticks_at + n_ticks * tick_size(n_players)])
+
+    def ticks(self, i):
+        """블록 i의 (시각, dt, 입력) 목록"""
+        _, layout, _, raw = self.open_block(i)
+        size = tick_size(layout.lanes)
+        out = []
+        for at in range(0, len(raw), size):
+            now, dt = TICK.unpack_from(raw, at)
+            out.append((now, dt, tuple(rules.unpack_input(b) for b in raw[at + TICK.size:at + size])))
+        return out
+
+    def seek(self, tick, fight=None):
+        """tick 틱을 계산하기 직전 상태. (블록 번호, 블록 안 위치, Layout, PlayState)
+
+        키프레임 하나를 복원하고 최대 REPLAY_KEYFRAME_EVERY 틱만 다시 계산하므로 세션 길이와 무관하게 빠름.
+        """
+        i = self.block_at(tick)
+        start, _, n = self.blocks[i]
+        _, layout, key, _ = self.open_block(i)
+        state = unpack_state(key, layout, fight)
+        steps = max(0, min(tick - start, n))
+        for now, dt, inputs in self.ticks(i)[:steps]:
+            advance(state, fight, now, dt, inputs)
+        return i, steps, layout, state
+
+    def close(self):
+        self.data.close()
+        self._f.close()
+
+
+def advance(state, fight, now_ms, dt_ms, inputs):
+    """게임 루프와 같은 순서로 한 틱 진행 (전투 장면은 fight가 있을 때만)"""
+    happened = rules.step(state, inputs, now_ms)
+    if fight is not None:
+        fight.try_attack(state.team_scores())
+        fight.tick(dt_ms)
+    return happened
+
+
+def play(path, start_tick=None):
+    """리플레이 창. 찾아가기에 걸린 시간을 창 제목에 표시"""
+    import pygame
+
+    from engine import render
+    from engine.config import FRAME_COLOR
+
+    replay = Replay(path)
+    if not replay.blocks:
+        print(f"{path}: 기록된 틱이 없음")
+        return
+    pygame.init()
+    layout = replay.open_block(0)[1]
+    screen = pygame.display.set_mode((layout.f_w, layout.f_h))
+    fight = render.FightScene()
+    fight.set_layout(layout.f_w, layout.fight_h)
+    clock = pygame.time.Clock()
+
+    def seek_to(tick):
+        nonlocal layout, screen
+        tick = max(replay.first_tick, min(tick, replay.last_tick - 1))
+        start = time.perf_counter()
+        i, pos, new_layout, state = replay.seek(tick, fight)
+        ms = (time.perf_counter() - start) * 1000
+        if new_layout != layout:
+            layout = new_layout
+            screen = pygame.display.set_mode((layout.f_w, layout.f_h))
+            fight.set_layout(layout.f_w, layout.fight_h)
+        pygame.display.set_caption(f"DodgeArrow replay | tick {tick} | seek {ms:.1f} ms")
+        return i, pos, state, replay.ticks(i)
+
+    i, pos, state, ticks = seek_to(replay.first_tick if start_tick is None else start_tick)
+    paused = False
+    now = 0
+    running = True
+    while running:
+        clock.tick(FPS)
+        target = None
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                current = replay.blocks[i][0] + pos
+                jumps = {pygame.K_LEFT: -5 * FPS, pygame.K_RIGHT: 5 * FPS,
+                         pygame.K_PAGEUP: -60 * FPS, pygame.K_PAGEDOWN: 60 * FPS}
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key == pygame.K_HOME:
+                    target = replay.first_tick
+                elif event.key in jumps:
+                    target = current + jumps[event.key]
+        if target is not None:
+            i, pos, state, ticks = seek_to(target)
+        elif not paused:
+            if pos >= len(ticks) and i + 1 < len(replay.blocks):
+                # 다음 블록 (라운드가 바뀌었으면 키프레임에서 새로 시작)
+                i, pos, state, ticks = seek_to(replay.blocks[i + 1][0])
+            if pos < len(ticks):
+                now, dt, inputs = ticks[pos]
+                advance(state, fight, now, dt, inputs)
+                pos += 1
+
+        fight_surf = screen.subsurface(pygame.Rect(0, 0, layout.f_w, layout.fight_h))
+        fight.draw(fight_surf)
+        pygame.draw.line(screen, FRAME_COLOR, (0, layout.fight_h), (layout.f_w, layout.fight_h), 5)
+        play_surf = screen.subsurface(pygame.Rect(0, layout.fight_h, layout.f_w, layout.play_h))
+        render.draw_play_scene(play_surf, layout, state, [], now, "replay")
+        pygame.display.flip()
+    replay.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    play(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else None)
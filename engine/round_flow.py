@@ -0,0 +1,55 @@
+"""라운드 흐름: playing -> result -> restart -> playing
+
+결과 화면(result)은 GAME_OVER_DELAY_MS 동안 보여주지만 pygame.time.delay로 멈추지 않음.
+게임 루프가 낮은 FPS(RESULT_IDLE_FPS)로 돌면서 이벤트를 계속 꺼내고, 프레임마다 update()가
+다음 라운드 준비 작업(prewarm)을 RESULT_PREWARM_BUDGET_MS만큼씩 함. 시간이 다 되고 ready면 restart.
+restart에서 start()를 부르면 남은 준비 작업을 마저 하고 playing으로.
+"""
+import collections
+import time
+
+from engine.config import GAME_OVER_DELAY_MS, RESULT_PREWARM_BUDGET_MS
+
+PHASE_PLAYING = "playing"
+PHASE_RESULT = "result"
+PHASE_RESTART = "restart"
+
+
+class RoundFlow:
+    def __init__(self, delay_ms=GAME_OVER_DELAY_MS, budget_ms=RESULT_PREWARM_BUDGET_MS):
+        self.delay_ms = delay_ms
+        self.budget = budget_ms / 1000
+        self.phase = PHASE_RESTART
+        self.result_until = 0
+        self.jobs = collections.deque()   # 인자 없는 함수. 하나가 몇 ms 안쪽이어야 예산을 지킴
+
+    def queue(self, jobs):
+        self.jobs.extend(jobs)
+
+    def finish(self, now_ms, jobs=()):
+        """playing -> result. jobs는 결과 화면 동안 할 다음 라운드 준비"""
+        self.phase = PHASE_RESULT
+        self.result_until = now_ms + self.delay_ms
+        self.queue(jobs)
+
+    def update(self, now_ms, ready=True):
+        """결과 화면 한 프레임. 준비 작업을 예산만큼 하고, 시간이 다 됐고 ready면 restart로 (바뀌었으면 True)"""
+        if self.phase != PHASE_RESULT:
+            return False
+        self._run_jobs(self.budget)
+        if now_ms >= self.result_until and ready:
+            self.phase = PHASE_RESTART
+            return True
+        return False
+
+    def start(self):
+        """restart -> playing. 못 끝낸 준비 작업은 여기서 다 하고, 그 때문에 멈춘 ms를 돌려줌"""
+        spent = self._run_jobs(None)
+        self.phase = PHASE_PLAYING
+        return round(spent, 2)
+
+    def _run_jobs(self, budget):
+        start = time.perf_counter()
+        while self.jobs and (budget is None or time.perf_counter() - start < budget):
+            self.jobs.popleft()()
+        return (time.perf_counter() - start) * 1000
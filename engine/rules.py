@@ -0,0 +1,221 @@
+"""한 틱 진행 규칙. 입력과 시각을 받아 PlayState를 바꾸고 일어난 일을 event_log 형식으로 돌려줌"""
+import math
+
+from engine.config import (
+    ARROW_OFFSCREEN_PAD, RULE_SCRAPE, SKILL_DURATION_MS_1P, SKILL_DURATION_MS_2P, SLOW_FACTOR, SLOW_PLAYER_BOOST,
+    SIM_BASE_FPS, TICK_SCALE,
+)
+from engine.entities import proximity_levels
+from engine.event_log import EV_DEATH, EV_PROXIMITY, EV_SCRAPE, EV_SKILL, EV_SPAWN
+from engine.spatial import REACH_HIT, REACH_PROXIMITY, widen
+
+# 입력이 없는 틱: 플레이어마다 (dx, dy, 스킬 키 눌림)
+NO_INPUT = ((0, 0, False), (0, 0, False))
+
+
+def pack_input(inp):
+    """플레이어 한 명의 (dx, dy, skill) -> 1바이트 (넷플레이 패킷, 리플레이 파일용)"""
+    dx, dy, skill = inp
+    return (dx + 1) | (dy + 1) << 2 | bool(skill) << 4
+
+def unpack_input(b):
+    return (b & 3) - 1, (b >> 2 & 3) - 1, bool(b >> 4 & 1)
+
+
+def tick_scale_for(dt_ms):
+    """틱 길이(ms) -> step의 tick_scale (SIM_BASE_FPS 틱 몇 개만큼인지). 1000 / FPS 같은 값의 오차는 버림"""
+    return round(dt_ms * SIM_BASE_FPS / 1000, 6)
+
+
+def step(state, inputs, now_ms, feathers=True, tick_scale=TICK_SCALE):
+    """inputs: 플레이어마다 (dx, dy, skill), 1P, 2P, ... 순서. feathers는 새 화살 그림에만 영향
+    tick_scale: 이번 틱에 움직일 양 (기본은 FPS 기준). 헤드리스로 긴 dt를 돌릴 때는 tick_scale_for(dt_ms)
+
+    돌려주는 값: [(종류, who, x, y, vx, vy, value), ...] (engine.event_log의 EV_* 종류, who는 플레이어 번호)
+    스킬은 규칙마다 하나씩 모두가 같이 씀: 스치기 규칙은 슬로우 (value 0), 피하기 규칙은 작아지기 (value 1).
+    """
+    out = []
+    players, dead, skills = state.players, state.dead, state.skills
+    # 스킬 시간은 틱 시작 시각 기준 (틱 길이가 달라도 같은 기준 틱들에 걸림).
+    # 끝나는 시각은 정수 ms로 둠 (리플레이/관전 패킷에 정수로 들어감). 기준 틱 시작은 x.0 / x.33 / x.67이라
+    # 반올림해도 틱 길이와 상관없이 같은 값
+    tick_ms = tick_scale * 1000 / SIM_BASE_FPS
+    start_ms = now_ms - tick_ms
+    skill_ms = round(start_ms)
+
+    for i, p in enumerate(players):
+        if not inputs[i][2] or dead[i] or not skills[i].ready:
+            continue
+        if p.rule == RULE_SCRAPE:
+            if not state.slow_active:
+                skills[i].consume()
+                state.slow_active = True
+                state.slow_end_time = skill_ms + SKILL_DURATION_MS_1P
+                out.append((EV_SKILL, i, p.x, p.y, 0.0, 0.0, 0))
+        elif not state.small_active:
+            skills[i].consume()
+            state.small_active = True
+            state.small_end_time = skill_ms + SKILL_DURATION_MS_2P
+            out.append((EV_SKILL, i, p.x, p.y, 0.0, 0.0, 1))
+
+    speed_factor = 1.0
+    if state.slow_active:
+        if skill_ms >= state.slow_end_time:
+            state.slow_active = False
+            for p in players:
+                if p.rule == RULE_SCRAPE:
+                    p.set_speed_factor(1.0)
+        else:
+            speed_factor = SLOW_FACTOR
+
+    # set_small은 피하기 규칙 플레이어에게만 효과가 있음
+    if state.small_active:
+        small = skill_ms < state.small_end_time
+        state.small_active = small
+        for p in players:
+            p.set_small(small)
+    else:
+        for i, p in enumerate(players):
+            if not dead[i]:
+                p.set_small(False)
+
+    for i, p in enumerate(players):
+        if dead[i]:
+            continue
+        if p.rule == RULE_SCRAPE:
+            p.set_speed_factor(SLOW_PLAYER_BOOST if state.slow_active else 1.0)
+        p.move(inputs[i][0], inputs[i][1], tick_scale)
+
+    arrows = state.arrows
+    spawned = state.spawner.spawn_due(now_ms, [(p.x, p.y) for p in players], feathers, state.arrow_pool,
+                                      tick_ms, [(p.x0, p.y0) for p in players], speed_factor)
+    for _, a in spawned:
+        arrows.append(a)
+        out.append((EV_SPAWN, a.target, a.x, a.y, a.vx, a.vy, 0))
+
+    # Arrow.update를 풀어 쓴 것 (틱마다 화살 수만큼 도는 가장 뜨거운 곳). 곱하는 순서도 같게 둬서 결과가 같음
+    for a in arrows:
+        a.x0 = x = a.x
+        a.y0 = y = a.y
+        a.x = x + a.vx * speed_factor * tick_scale
+        a.y = y + a.vy * speed_factor * tick_scale
+
+    # 긴 틱(기준 틱 여러 개)은 기준 틱마다 나눠서 판정. 라운드가 끝난 기준 틱 뒤의 점수/죽음은 세지 않음
+    sub_ticks = math.ceil(tick_scale - 1e-9)
+    if sub_ticks <= 1:
+        removed = _judge(state, arrows, now_ms, tick_scale, out)
+    else:
+        removed = _judge_sub_ticks(state, inputs, arrows, spawned, start_ms, tick_ms, tick_scale, sub_ticks, out)
+
+    # Arrow.offscreen과 같은 판정을 화살마다 메서드를 부르지 않고 한 번에 (지옥 모드에선 화살이 수천 개)
+    play_rect = state.play_rect
+    left, right = play_rect.left - ARROW_OFFSCREEN_PAD, play_rect.right + ARROW_OFFSCREEN_PAD
+    top, bottom = play_rect.top - ARROW_OFFSCREEN_PAD, play_rect.bottom + ARROW_OFFSCREEN_PAD
+    if removed:
+        arrows = [a for a in arrows if id(a) not in removed]
+    state.arrows = [a for a in arrows if left <= a.x <= right and top <= a.y <= bottom]
+    return out
+
+
+def _judge(state, arrows, now_ms, tick_scale, out, removed=None):
+    """화살 이동이 끝난 뒤의 충돌/점수 판정. 화살 위치는 x0, y0 -> x, y, 플레이어는 x0, y0 -> x, y 구간
+
+    removed: 스치기로 없앨 화살 id를 모으는 set (없으면 새로 만들어 돌려줌)
+    """
+    players, dead, skills = state.players, state.dead, state.skills
+    # 플레이어마다 주변 화살만 판정 (화살 순서는 그대로라 전부 판정할 때와 결과가 같음)
+    grid = state.grid
+    grid.build(arrows)
+    reach_hit, reach_proximity = widen(REACH_HIT, tick_scale), widen(REACH_PROXIMITY, tick_scale)
+    if removed is None:
+        removed = set()
+    for i, p in enumerate(players):
+        # 앞 플레이어가 죽으면 라운드가 끝나므로 뒤 플레이어는 판정하지 않음
+        if any(dead[:i]):
+            break
+        if dead[i]:
+            continue
+        pos, r = p.circle()
+        prev = (p.x0, p.y0)
+        if p.rule == RULE_SCRAPE:
+            near = [arrows[j] for j in grid.query(prev, pos, reach_hit)]
+            gained = _scrape(state, i, p, near, pos, r, prev, now_ms, removed, out)
+        else:
+            near = [arrows[j] for j in grid.query(prev, pos, reach_proximity)]
+            gained = _dodge(state, i, p, near, pos, r, prev, now_ms, out)
+        if gained:
+            state.scores[i] += gained
+            skills[i].add(gained)
+    return removed
+
+
+def _judge_sub_ticks(state, inputs, arrows, spawned, start_ms, tick_ms, tick_scale, sub_ticks, out):
+    """긴 틱을 기준 틱 sub_ticks개로 나눠 _judge. 화살과 플레이어를 기준 틱마다의 위치에 놓고 판정한 뒤
+    틱 끝 위치로 되돌림. 누가 죽거나 이기면 그 기준 틱에서 멈춤 -> 기준 틱 속도로 돌 때와 같은 판정
+    spawned: 이번 틱에 나온 [(만기 시각, Arrow)]. 만기 시각이 든 기준 틱부터 판정함
+    """
+    players = state.players
+    arrow_path = [(a.x0, a.y0, a.x, a.y) for a in arrows]
+    # 플레이어는 기준 틱마다의 위치 (벽에 막히면 직선 보간과 다름)
+    points = [[(p.x0, p.y0)] + [p.path_at(inputs[i][0], inputs[i][1], tick_scale, s / sub_ticks)
+                                for s in range(1, sub_ticks)] + [(p.x, p.y)]
+              for i, p in enumerate(players)]
+    born = {id(a): due_ms for due_ms, a in spawned}
+    removed = set()
+    for s in range(1, sub_ticks + 1):
+        t0, t1 = (s - 1) / sub_ticks, s / sub_ticks
+        end_ms = start_ms + tick_ms * t1
+        for a, (x0, y0, x1, y1) in zip(arrows, arrow_path):
+            a.x0, a.y0 = x0 + (x1 - x0) * t0, y0 + (y1 - y0) * t0
+            a.x, a.y = (x1, y1) if s == sub_ticks else (x0 + (x1 - x0) * t1, y0 + (y1 - y0) * t1)
+        for p, pts in zip(players, points):
+            (p.x0, p.y0), (p.x, p.y) = pts[s - 1], pts[s]
+        live = [a for a in arrows if id(a) not in removed and born.get(id(a), start_ms) <= end_ms + 1e-6]
+        _judge(state, live, end_ms, tick_scale / sub_ticks, out, removed)
+        if state.game_over or state.game_won:
+            break
+    for a, (x0, y0, x1, y1) in zip(arrows, arrow_path):
+        a.x0, a.y0, a.x, a.y = x0, y0, x1, y1
+    for p, pts in zip(players, points):
+        (p.x0, p.y0), (p.x, p.y) = pts[0], pts[-1]
+    return removed
+
+
+def _scrape(state, i, p, arrows, pos, r, prev, now_ms, removed, out):
+    """스치기 규칙: 몸통을 스치면 점수 (그 화살은 없앰), 화살촉에 맞으면 죽음"""
+    gained = 0
+    for a in arrows:
+        hit_head, plus, remove = a.check_collision(pos, r, now_ms, RULE_SCRAPE, prev)
+        if hit_head:
+            state.dead[i] = True
+            out.append((EV_DEATH, i, p.x, p.y, 0.0, 0.0, 0))
+            break
+        if plus > 0:
+            gained += plus
+            out.append((EV_SCRAPE, i, a.x, a.y, 0.0, 0.0, plus))
+            if remove:
+                removed.add(id(a))
+    return gained
+
+
+def _dodge(state, i, p, arrows, pos, r, prev, now_ms, out):
+    """피하기 규칙: 어디든 맞으면 죽음, 화살촉이 가까이 지나갈수록 점수"""
+    # 죽은 화살 앞까지만 근접 점수를 셈 (화살마다 계산하던 때와 같은 결과)
+    scored = len(arrows)
+    for k, a in enumerate(arrows):
+        hit_head, _, _ = a.check_collision(pos, r, now_ms, p.rule, prev, proximity=False)
+        if hit_head:
+            state.dead[i] = True
+            out.append((EV_DEATH, i, p.x, p.y, 0.0, 0.0, 0))
+            scored = k
+            break
+
+    gained = 0
+    scored_arrows = arrows[:scored]
+    for a, level in zip(scored_arrows, proximity_levels(scored_arrows, pos, prev)):
+        plus = a.raise_proximity(level)
+        if plus > 0:
+            gained += plus
+            hx, hy = a.head_pos()
+            out.append((EV_PROXIMITY, i, hx, hy, 0.0, 0.0, a.proximity_level))
+    return gained
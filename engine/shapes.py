@@ -0,0 +1,162 @@
+"""화살/플레이어 모양 (그림과 충돌 마스크). 화살은 각도 구간마다 한 번만 만들어 공유"""
+import math
+
+import pygame
+
+from engine.config import (
+    ARROW_ANGLE_STEP, ARROW_COLORKEY, ARROW_FEATHER_LEN, ARROW_FEATHER_W, ARROW_HEAD_LEN, ARROW_HEAD_W, ARROW_LENGTH,
+    ARROW_SHAFT_W, COLOR_FEATHER, COLOR_FEATHER_OUT, HEAD_MAIN, HEAD_OUTLINE, HITBOX_HEAD_COLOR, HITBOX_PLAYER_COLOR,
+    HITBOX_SHAFT_COLOR, SHAFT_CORE, SHAFT_MAIN, SHAFT_OUTLINE,
+)
+
+
+class ArrowShape:
+    """같은 각도 구간 화살들이 참조로 같이 쓰는 그림 + 충돌 마스크 (만든 뒤에는 바꾸지 않음)"""
+    __slots__ = ("image", "image_offset", "size", "shaft_mask", "head_mask", "blit", "angle", "feathers", "dirx", "diry")
+
+    def __init__(self, image, image_offset, size, shaft_mask, head_mask, angle=0, feathers=True):
+        self.image = image
+        self.image_offset = image_offset
+        self.size = size
+        self.shaft_mask = shaft_mask
+        self.head_mask = head_mask
+        # (그림, dx, dy): 화살 중심(정수로 자른 값)에 dx, dy를 더하면 그림 왼쪽 위. 화살 수천 개를 그릴 때 계산을 줄임
+        self.blit = (image, image_offset[0] - size[0] // 2, image_offset[1] - size[1] // 2)
+        # 구간 각도(도, 화면 기준 시계 방향)와 깃털 여부: 텍스처 백엔드가 0도 그림을 이만큼 돌려서 그림
+        self.angle = angle
+        self.feathers = feathers
+        # 마스크를 그린 방향. 스윕 판정 캡슐도 이 방향에 놓아야 마스크와 같은 모양을 봄
+        self.dirx, self.diry = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+
+    def nbytes(self):
+        w, h = self.image.get_size()
+        mw, mh = self.size
+        return w * h * self.image.get_bytesize() + 2 * ((mw * mh + 7) // 8)
+
+# (각도 구간, 깃털 여부) -> ArrowShape. 구간 수 * 2 개를 넘지 않음
+arrow_shapes = {}
+
+# 플레이어 반지름 -> 원 마스크 (반지름 + 4 여백 정사각형)
+circle_masks = {}
+
+# 히트박스 표시용 그림. 화살은 ArrowShape -> (화살 그림 + 마스크 외곽선, dx, dy), 플레이어는 반지름 -> (외곽선, dx, dy)
+arrow_hitboxes = {}
+circle_outlines = {}
+
+def build_arrow_shape(angle_deg, feathers=True):
+    total_len = ARROW_LENGTH + ARROW_HEAD_LEN + 20
+    surf_w = total_len
+    surf_h = max(ARROW_HEAD_W, ARROW_FEATHER_W) + 30
+    shaft_layer = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
+    head_layer = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
+    cx, cy = 18, surf_h // 2
+    tail_x = cx - 6
+    f1 = [(tail_x, cy), (tail_x - ARROW_FEATHER_LEN, cy - ARROW_FEATHER_W), (tail_x - ARROW_FEATHER_LEN * 0.4, cy - ARROW_FEATHER_W * 0.3)]
+    f2 = [(tail_x, cy), (tail_x - ARROW_FEATHER_LEN, cy + ARROW_FEATHER_W), (tail_x - ARROW_FEATHER_LEN * 0.4, cy + ARROW_FEATHER_W * 0.3)]
+    for pts in (f1, f2):
+        pygame.draw.polygon(shaft_layer, COLOR_FEATHER_OUT, pts)
+        shrink = [(x + (cx - x) * 0.15, y + (cy - y) * 0.15) for x, y in pts]
+        pygame.draw.polygon(shaft_layer, COLOR_FEATHER, shrink)
+    outer_rect = pygame.Rect(cx, cy - ARROW_SHAFT_W // 2 - 1, ARROW_LENGTH, ARROW_SHAFT_W + 2)
+    pygame.draw.rect(shaft_layer, SHAFT_OUTLINE, outer_rect, border_radius=4)
+    main_rect = pygame.Rect(cx, cy - ARROW_SHAFT_W // 2, ARROW_LENGTH, ARROW_SHAFT_W)
+    pygame.draw.rect(shaft_layer, SHAFT_MAIN, main_rect, border_radius=4)
+    inner_rect = pygame.Rect(cx, cy - ARROW_SHAFT_W // 4, ARROW_LENGTH, ARROW_SHAFT_W // 2)
+    pygame.draw.rect(shaft_layer, SHAFT_CORE, inner_rect, border_radius=3)
+    tip_x = cx + ARROW_LENGTH
+    half_w = ARROW_HEAD_W // 2
+    outline_pts = [(tip_x + 3, cy), (tip_x - ARROW_HEAD_LEN, cy - half_w - 2), (tip_x - ARROW_HEAD_LEN, cy + half_w + 2)]
+    inner_pts = [(tip_x + 1, cy), (tip_x - ARROW_HEAD_LEN + 4, cy - half_w + 1), (tip_x - ARROW_HEAD_LEN + 4, cy + half_w - 1)]
+    pygame.draw.polygon(head_layer, HEAD_OUTLINE, outline_pts)
+    pygame.draw.polygon(head_layer, HEAD_MAIN, inner_pts)
+    shaft_img = pygame.transform.rotate(shaft_layer, -angle_deg)
+    head_img = pygame.transform.rotate(head_layer, -angle_deg)
+    final_w = max(shaft_img.get_width(), head_img.get_width())
+    final_h = max(shaft_img.get_height(), head_img.get_height())
+    final_img = pygame.Surface((final_w, final_h), pygame.SRCALPHA)
+    shaft_rect = shaft_img.get_rect(center=(final_w // 2, final_h // 2))
+    head_rect = head_img.get_rect(center=(final_w // 2, final_h // 2))
+    # 충돌 마스크는 품질과 상관없이 항상 깃털 포함 모양으로 만듦
+    shaft_mask = pygame.mask.from_surface(shaft_img)
+    head_mask = pygame.mask.from_surface(head_img)
+    if not feathers:
+        # 가벼운 스프라이트: 깃털 없이 몸통만 다시 그림
+        shaft_layer.fill((0, 0, 0, 0))
+        pygame.draw.rect(shaft_layer, SHAFT_OUTLINE, outer_rect, border_radius=4)
+        pygame.draw.rect(shaft_layer, SHAFT_MAIN, main_rect, border_radius=4)
+        shaft_img = pygame.transform.rotate(shaft_layer, -angle_deg)
+    final_img.blit(shaft_img, shaft_rect)
+    final_img.blit(head_img, head_rect)
+    # 빈 여백을 잘라 블릿 면적을 줄이고, 알파 대신 색 키 + RLE로 바꿈.
+    # 그림에 안티에일리어싱이 없어서 알파는 0 아니면 255뿐이라 결과 그림은 같고 블릿은 몇 배 빠름 (지옥 모드 화살 수천 개)
+    crop = final_img.get_bounding_rect()
+    image = pygame.Surface(crop.size)
+    image.fill(ARROW_COLORKEY)
+    image.blit(final_img, (0, 0), crop)
+    image.set_colorkey(ARROW_COLORKEY, pygame.RLEACCEL)
+    return ArrowShape(image, crop.topleft, (final_w, final_h), shaft_mask, head_mask, angle_deg, feathers)
+
+def arrow_shape(angle_deg, feathers=True):
+    """각도를 ARROW_ANGLE_STEP 단위로 묶어서 구간마다 한 번만 그림
+
+    그림뿐 아니라 충돌 마스크도 구간 각도로 돌린 것이라, 화살촉 마스크는 실제 방향과 최대 ARROW_ANGLE_STEP / 2도
+    (화살촉 끝에서 약 1.7px) 어긋남. 화살은 실제 방향으로 날아가고, 판정 모양만 구간 각도.
+    """
+    bucket = round(angle_deg / ARROW_ANGLE_STEP) % (360 // ARROW_ANGLE_STEP)
+    key = (bucket, feathers)
+    shape = arrow_shapes.get(key)
+    if shape is None:
+        shape = arrow_shapes[key] = build_arrow_shape(bucket * ARROW_ANGLE_STEP, feathers)
+    return shape
+
+def circle_mask(radius):
+    """플레이어 원 마스크. 충돌 판정마다 새로 그리지 않도록 반지름별로 한 번만 만듦"""
+    mask = circle_masks.get(radius)
+    if mask is None:
+        rpad = radius + 4
+        p_surf = pygame.Surface((rpad * 2, rpad * 2), pygame.SRCALPHA)
+        pygame.draw.circle(p_surf, (255, 255, 255), (rpad, rpad), radius)
+        mask = circle_masks[radius] = pygame.mask.from_surface(p_surf)
+    return mask
+
+def outline_image(surf, masks_colors):
+    """색 키로 채운 surf 위에 마스크마다 연결된 조각별로 Mask.outline을 그림 -> (여백을 자른 그림, 잘린 왼쪽 위)"""
+    for mask, color in masks_colors:
+        # outline은 첫 조각만 따라가므로 (몸통 마스크는 깃털이 떨어져 있음) 조각마다 땀
+        for part in mask.connected_components():
+            points = part.outline()
+            if len(points) > 1:
+                pygame.draw.lines(surf, color, True, points)
+            elif points:
+                surf.set_at(points[0], color)
+    surf.set_colorkey(ARROW_COLORKEY)
+    crop = surf.get_bounding_rect()
+    image = surf.subsurface(crop).copy()
+    image.set_colorkey(ARROW_COLORKEY, pygame.RLEACCEL)
+    return image, crop.topleft
+
+def arrow_hitbox(shape):
+    """(그림, dx, dy): 화살 그림에 몸통/화살촉 마스크 외곽선을 겹친 그림. 화살 중심(정수)에 dx, dy를 더하면 왼쪽 위
+
+    모양마다 한 번만 만들고, 히트박스를 켜면 화살 그림 대신 이걸 그려서 화살마다 blit은 그대로 한 번.
+    """
+    entry = arrow_hitboxes.get(shape)
+    if entry is None:
+        surf = pygame.Surface(shape.size)
+        surf.fill(ARROW_COLORKEY)
+        surf.blit(shape.image, shape.image_offset)
+        image, (ox, oy) = outline_image(surf, ((shape.shaft_mask, HITBOX_SHAFT_COLOR),
+                                               (shape.head_mask, HITBOX_HEAD_COLOR)))
+        entry = arrow_hitboxes[shape] = (image, ox - shape.size[0] // 2, oy - shape.size[1] // 2)
+    return entry
+
+def circle_outline(radius):
+    """(그림, dx, dy): 플레이어 중심(정수)에 더하면 왼쪽 위. 충돌 판정과 같은 circle_mask의 외곽선"""
+    entry = circle_outlines.get(radius)
+    if entry is None:
+        rpad = radius + 4
+        surf = pygame.Surface((rpad * 2, rpad * 2))
+        surf.fill(ARROW_COLORKEY)
+        image, (ox, oy) = outline_image(surf, ((circle_mask(radius), HITBOX_PLAYER_COLOR),))
+        entry = circle_outlines[radius] = (image, ox - rpad, oy - rpad)
+    return entry
@@ -0,0 +1,65 @@
+"""플레이어 주변 화살만 골라내는 격자 (spatial hash)
+
+화살은 틱 끝 위치가 든 칸 하나에만 번호를 넣고, 플레이어는 자기 경로를 REACH만큼 넓힌 칸들만 봄.
+REACH에는 화살이 한 틱에 움직이는 최대 거리가 들어 있어서 틱 시작 위치(스윕 판정)도 빠지지 않음.
+틱 동안 플레이어와 화살 중심 거리가 REACH를 넘으면 마스크, 스윕, 근접 점수 어느 판정에도 걸리지 않으므로
+전부 판정할 때와 결과가 같음. 비용은 화살 수 + 플레이어 수 * 주변 칸 수.
+"""
+import math
+
+from engine.config import (
+    ARROW_FEATHER_W, ARROW_HEAD_LEN, ARROW_HEAD_OFFSET, ARROW_HEAD_W, ARROW_LENGTH, ARROW_MAX_SPEED, PLAYER_RADIUS,
+    PROX_DIST_1, TICK_SCALE,
+)
+
+# 화살 그림(회전 전 196x48)의 대각선 절반 = 어느 각도로 돌려도 중심에서 마스크 끝까지의 최대 거리
+ARROW_EXTENT = math.hypot(ARROW_LENGTH + ARROW_HEAD_LEN + 20, max(ARROW_HEAD_W, ARROW_FEATHER_W) + 30) / 2 + 2
+# 화살이 한 틱에 움직이는 최대 거리 (슬로우면 더 짧음)
+ARROW_STEP = ARROW_MAX_SPEED * TICK_SCALE + 1
+# 플레이어 원 마스크 여백(4) + 정수로 자르는 오차
+REACH_HIT = ARROW_EXTENT + PLAYER_RADIUS + 6 + ARROW_STEP
+# 근접 점수는 화살촉에서 PROX_DIST_1까지
+REACH_PROXIMITY = max(REACH_HIT, ARROW_HEAD_OFFSET + PROX_DIST_1 + 2 + ARROW_STEP)
+
+
+def widen(reach, tick_scale):
+    """틱이 TICK_SCALE보다 길면 (낮은 틱 속도, 긴 dt) 화살이 더 움직인 만큼 reach를 넓힘"""
+    return reach + ARROW_MAX_SPEED * max(0.0, tick_scale - TICK_SCALE)
+
+# 칸 키 = cx * ROW + cy. 세로 칸 번호가 ±ROW/2 안이면 겹치지 않음 (칸 128px이면 ±26만 px)
+ROW = 4096
+
+
+class SpatialHash:
+    """틱마다 build()로 다시 채움. 칸 목록 dict는 그대로 다시 씀"""
+
+    def __init__(self, cell: int):
+        self.cell = cell
+        self.cells = {}
+
+    def build(self, arrows):
+        cells = self.cells
+        cells.clear()
+        c = self.cell
+        for i, a in enumerate(arrows):
+            # 칸 (cx, cy)를 숫자 하나로 (튜플 키보다 빠름). 실수 그대로 써도 1.0과 1은 같은 키
+            key = (a.x // c) * ROW + a.y // c
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [i]
+            else:
+                bucket.append(i)
+
+    def query(self, prev, pos, reach):
+        """prev -> pos 경로에서 reach 안에 들어올 수 있는 화살 번호 (원래 순서대로)"""
+        c = self.cell
+        cells = self.cells
+        found = []
+        for cx in range(int((min(prev[0], pos[0]) - reach) // c), int((max(prev[0], pos[0]) + reach) // c) + 1):
+            for cy in range(int((min(prev[1], pos[1]) - reach) // c), int((max(prev[1], pos[1]) + reach) // c) + 1):
+                bucket = cells.get(cx * ROW + cy)
+                if bucket:
+                    found.extend(bucket)
+        # 화살마다 칸이 하나라 겹치지 않음
+        found.sort()
+        return found
@@ -0,0 +1,244 @@
+"""화살 생성 예약: 패턴 표, 가장자리 좌표 뽑기, 타이머 휠"""
+import bisect
+import math
+import random
+from dataclasses import dataclass
+
+from engine.config import ARROW_MAX_SPEED, ARROW_MIN_SPEED
+
+
+@dataclass(frozen=True)
+class SpawnPattern:
+    name: str
+    weight: int           # 뽑힐 가중치
+    unlock_at: int        # 화살이 이만큼 나온 뒤부터 등장
+    count: int            # 한 번에 나오는 화살 수
+    spacing_ms: int       # 화살 사이 시간 간격 (0이면 동시에)
+    spread_deg: float     # 부채꼴 전체 각도 (0이면 모두 같은 방향)
+    edge_step: float      # 가장자리를 따라 벌어지는 간격(px), 웨이브용
+
+
+# 기본 모드 스폰 표
+SPAWN_TABLE_NORMAL = (
+    SpawnPattern("single", 8, 0, 1, 0, 0, 0),
+    SpawnPattern("burst", 3, 24, 3, 110, 0, 0),
+    SpawnPattern("fan", 2, 48, 3, 0, 24, 0),
+    SpawnPattern("wave", 1, 72, 4, 0, 0, 90),
+)
+
+# 지옥 모드 스폰 표: 한 번에 여러 발 (일제 사격, 연사, 화살비, 둘러싸기)
+SPAWN_TABLE_HELL = (
+    SpawnPattern("single", 2, 0, 1, 0, 0, 0),
+    SpawnPattern("volley", 4, 0, 8, 0, 50, 0),
+    SpawnPattern("stream", 3, 40, 10, 30, 0, 0),
+    SpawnPattern("rain", 2, 120, 16, 0, 0, 45),
+    SpawnPattern("ring", 1, 400, 12, 0, 330, 0),
+)
+
+
+@dataclass(frozen=True)
+class ArrowSpawn:
+    origin: tuple         # 생성 위치 (x, y)
+    target: int           # 노릴 플레이어 번호 (0 = 1P, 1 = 2P, ...)
+    jitter: tuple         # 목표 위치에 더할 오차 (dx, dy)
+    angle_offset: float   # 조준 방향에 더할 회전 각도 (도)
+    speed: float          # 화살 속도 (기준 틱당 px). 패턴을 시작할 때 뽑아 둠
+
+    def velocity(self, target_pos):
+        tx = target_pos[0] + self.jitter[0] - self.origin[0]
+        ty = target_pos[1] + self.jitter[1] - self.origin[1]
+        if not self.angle_offset:
+            return tx, ty
+        rad = math.radians(self.angle_offset)
+        c, s = math.cos(rad), math.sin(rad)
+        return tx * c - ty * s, tx * s + ty * c
+
+
+class TimerWheel:
+    """고정 길이 슬롯의 원형 배열. 지나간 슬롯만 꺼내므로 틱당 비용이 예약 개수와 무관"""
+
+    def __init__(self, slot_ms: int = 10, slots: int = 256, start_ms: int = 0):
+        self.slot_ms = slot_ms
+        self.slots = [[] for _ in range(slots)]
+        self.cursor = start_ms // slot_ms   # 아직 처리하지 않은 첫 슬롯 (절대 번호)
+        self.pending = 0
+
+    def schedule(self, at_ms: int, payload):
+        abs_slot = max(int(at_ms) // self.slot_ms, self.cursor)
+        self.slots[abs_slot % len(self.slots)].append((abs_slot, payload))
+        self.pending += 1
+
+    def advance(self, now_ms: int):
+        """now_ms까지 만기가 된 예약을 (만기 시각, payload)로 시간 순서대로 내줌 (제너레이터)
+
+        만기 시각은 슬롯 시작 시각. 슬롯을 하나씩 비우면서 내주므로 받는 쪽이 도중에 now_ms 안쪽으로
+        예약한 것도 같은 호출에서 제 순서에 나옴 -> 틱을 어떻게 나눠 불러도 같은 순서, 같은 시각.
+        """
+        target = int(now_ms) // self.slot_ms
+        n = len(self.slots)
+        while self.cursor <= target:
+            if not self.pending:
+                self.cursor = target + 1
+                break
+            abs_slot = self.cursor
+            bucket = self.slots[abs_slot % n]
+            i = 0
+            while i < len(bucket):
+                # 한 바퀴 뒤 예약은 그대로 둠
+                if bucket[i][0] == abs_slot:
+                    payload = bucket.pop(i)[1]
+                    self.pending -= 1
+                    yield abs_slot * self.slot_ms, payload
+                else:
+                    i += 1
+            self.cursor = abs_slot + 1
+
+    def snapshot(self):
+        # 예약 내용(payload)은 바뀌지 않는 값이라 빈 슬롯만 빼고 얕게 복사
+        return self.cursor, self.pending, tuple((i, tuple(b)) for i, b in enumerate(self.slots) if b)
+
+    def restore(self, snap):
+        self.cursor, self.pending, filled = snap
+        # 슬롯 목록은 새로 만들지 않고 차 있는 슬롯만 비움
+        for b in self.slots:
+            if b:
+                b.clear()
+        for i, bucket in filled:
+            self.slots[i].extend(bucket)
+
+    def reset(self, start_ms=0):
+        self.restore((start_ms // self.slot_ms, 0, ()))
+
+
+class EdgeSampler:
+    """플레이 영역 바깥 가장자리 중 생성 가능한 구간에서 바로 좌표를 뽑음 (재시도 없음)"""
+
+    def __init__(self, bounds, dividers=(), margin: int = 20, center_gap: int = 10):
+        left, top, right, bottom = bounds
+        # (x0, y0, x1, y1): 정수 좌표 구간. 위/아래 변은 구역 경계(dividers) 근처를 뺀 조각들로 나눔
+        starts = [left] + [x + center_gap + 1 for x in dividers]
+        ends = [x - center_gap - 1 for x in dividers] + [right]
+        edges = (
+            [(x0, top - margin, x1, top - margin) for x0, x1 in zip(starts, ends)],
+            [(x0, bottom + margin, x1, bottom + margin) for x0, x1 in zip(starts, ends)],
+            [(left - margin, top, left - margin, bottom)],
+            [(right + margin, top, right + margin, bottom)],
+        )
+        # 변 4개는 같은 확률, 변 안에서는 길이에 비례해서 고름
+        self.segments = []
+        self.cumulative = []
+        acc = 0.0
+        for pieces in edges:
+            pieces = [p for p in pieces if p[2] >= p[0] and p[3] >= p[1]]
+            total = sum(self._length(p) for p in pieces)
+            for p in pieces:
+                acc += 0.25 * self._length(p) / total
+                self.segments.append(p)
+                self.cumulative.append(acc)
+
+    @staticmethod
+    def _length(seg):
+        return (seg[2] - seg[0]) + (seg[3] - seg[1]) + 1
+
+    def sample(self, rng):
+        idx = bisect.bisect_left(self.cumulative, rng.random() * self.cumulative[-1])
+        seg = self.segments[min(idx, len(self.segments) - 1)]
+        x = rng.randint(seg[0], seg[2])
+        y = rng.randint(seg[1], seg[3])
+        return seg, (x, y)
+
+    @staticmethod
+    def slide(seg, pos, step):
+        """pos를 같은 구간 안에서 step만큼 밀어냄 (구간 끝에서 멈춤)"""
+        x, y = pos
+        if seg[0] == seg[2]:
+            return x, max(seg[1], min(seg[3], y + step))
+        return max(seg[0], min(seg[2], x + step)), y
+
+
+class SpawnScheduler:
+    """스폰 이벤트를 타이머 휠에 미리 예약해두고 만기된 화살 생성 정보를 꺼내줌"""
+
+    def __init__(self, bounds, dividers, interval_init: int, interval_min: int,
+                 accel_every: int, table=SPAWN_TABLE_NORMAL, rng=random,
+                 interval_decay: float = 0.9, center_gap: int = 10, start_ms: int = 0, targets: int = 2):
+        self.interval_init = interval_init
+        self.interval = interval_init
+        self.interval_min = interval_min
+        self.interval_decay = interval_decay
+        self.accel_every = accel_every
+        self.table = table
+        self.rng = rng
+        self.targets = targets   # 노릴 수 있는 플레이어 수
+        self.spawned = 0
+        self.edges = EdgeSampler(bounds, dividers, center_gap=center_gap)
+        self.wheel = TimerWheel(start_ms=start_ms)
+        self.wheel.schedule(start_ms + self.interval, None)   # None = 다음 패턴 시작
+
+    def snapshot(self):
+        """되감기(롤백)용. rng 상태까지 담으므로 복원 뒤 같은 순서로 같은 화살이 나옴"""
+        return self.interval, self.spawned, self.rng.getstate(), self.wheel.snapshot()
+
+    def restore(self, snap):
+        self.interval, self.spawned, rng_state, wheel = snap
+        self.rng.setstate(rng_state)
+        self.wheel.restore(wheel)
+
+    def reset(self, start_ms=0):
+        """새 라운드. 가장자리 구간과 휠 슬롯은 그대로 다시 씀"""
+        self.interval = self.interval_init
+        self.spawned = 0
+        self.wheel.reset(start_ms)
+        self.wheel.schedule(start_ms + self.interval, None)
+
+    def due(self, now_ms: int):
+        """now_ms까지 나올 화살 [(만기 시각, ArrowSpawn)]
+
+        난수는 패턴을 시작할 때만 뽑고 다음 예약도 만기 시각 기준이라, 틱 속도(몇 ms마다 부르는지)와
+        상관없이 같은 seed면 같은 화살이 같은 시각에 나옴.
+        """
+        out = []
+        for due_ms, payload in self.wheel.advance(now_ms):
+            if payload is None:
+                self._start_pattern(due_ms, out)
+            else:
+                self._emit(due_ms, payload, out)
+        return out
+
+    def _emit(self, due_ms, spawn, out):
+        out.append((due_ms, spawn))
+        self.spawned += 1
+        if self.spawned % self.accel_every == 0:
+            self.interval = max(self.interval_min, int(self.interval * self.interval_decay))
+
+    def _pick_pattern(self):
+        unlocked = [p for p in self.table if p.unlock_at <= self.spawned]
+        roll = self.rng.random() * sum(p.weight for p in unlocked)
+        for p in unlocked:
+            roll -= p.weight
+            if roll < 0:
+                return p
+        return unlocked[-1]
+
+    def _start_pattern(self, due_ms, out):
+        rng = self.rng
+        pattern = self._pick_pattern()
+        seg, origin = self.edges.sample(rng)
+        # 두 명일 때는 예전 동전 던지기(random() < 0.5)와 같은 값이 나옴
+        target = min(int(rng.random() * self.targets), self.targets - 1)
+        shared_jitter = (rng.uniform(-80, 80), rng.uniform(-80, 80))
+
+        for i in range(pattern.count):
+            centered = i - (pattern.count - 1) / 2
+            angle = centered * pattern.spread_deg / max(1, pattern.count - 1)
+            pos = EdgeSampler.slide(seg, origin, centered * pattern.edge_step)
+            jitter = shared_jitter if pattern.spread_deg else (rng.uniform(-80, 80), rng.uniform(-80, 80))
+            spawn = ArrowSpawn(pos, target, jitter, angle, rng.uniform(ARROW_MIN_SPEED, ARROW_MAX_SPEED))
+            delay = i * pattern.spacing_ms
+            if delay == 0:
+                self._emit(due_ms, spawn, out)
+            else:
+                self.wheel.schedule(due_ms + delay, spawn)
+
+        # 화살 수에 비례해 다음 패턴까지 쉬므로 평균 생성 속도는 난이도 곡선을 그대로 따름
+        self.wheel.schedule(due_ms + self.interval * pattern.count, None)
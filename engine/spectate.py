@@ -0,0 +1,416 @@
+"""관전 화면으로 판 상태를 내보냄 (키프레임 + 틱마다 바뀐 것만 담은 델타)
+
+게임 쪽 SpectatorPublisher는 틱마다 상태를 한 번만 인코딩하고, 같은 바이트를 관전자 소켓마다
+논블로킹으로 보냄. 관전자마다 보낼 버퍼에 한도가 있어서 느린 관전자는 밀린 델타를 버리고
+다음 키프레임부터 다시 받음 (게임 루프는 기다리지 않음).
+
+화살은 생기고 없어질 때만 보냄. 속도가 일정하므로 관전 쪽이 틱 수만큼 직접 움직임.
+그렇게 따라갈 수 없을 때(넷플레이 되감기, 메시지 하나에 여러 틱이 들어 도중에 슬로우가 바뀌었을 수 있을 때)는
+다음 메시지를 키프레임으로 보내서 위치를 다시 맞춤.
+
+사용법: python -m engine.spectate [호스트[:포트]]   # 관전 창 열기 (기본 127.0.0.1:7100)
+"""
+import math
+import socket
+import struct
+import sys
+import time
+
+from engine.config import (
+    SLOW_FACTOR, SPECTATE_HOST, SPECTATE_KEYFRAME_EVERY, SPECTATE_MAX_BUFFER, SPECTATE_PORT,
+)
+
+MSG_KEY = b"K"     # 전체 상태: 헤더 + 배치 + 화살 전부
+MSG_DELTA = b"D"   # 헤더 + 없어진 화살 번호 + 새 화살
+
+FRAME = struct.Struct("!I")   # 메시지 앞에 붙는 길이
+# 종류, 틱, 지난 메시지 이후 진행한 틱 수, 점수 2, 스킬 게이지 2, 플래그, 슬로우/작아지기 남은 ms
+HEADER = struct.Struct("!cIBHHBBBHH")
+LAYOUT = struct.Struct("!HH")
+PLAYER = struct.Struct("!hhB")     # x, y (1/POS_SCALE px 단위), 반지름
+ACTOR = struct.Struct("!BH")       # 클립 번호 (이름 정렬 순서), 클립 안 경과 ms
+COUNT = struct.Struct("!H")
+ARROW = struct.Struct("!Hffff")    # 번호, x, y, vx, vy
+ARROW_ID = struct.Struct("!H")
+
+F_READY_1P, F_READY_2P, F_SLOW, F_SMALL, F_DEAD_1P, F_DEAD_2P = (1 << i for i in range(6))
+POS_SCALE = 4
+
+
+def actor_state(actor):
+    clip = actor.clips[actor.clip_name]
+    # 반복 클립은 경과 시간이 계속 늘어나므로 한 바퀴 안으로 접어서 보냄
+    elapsed = actor.elapsed % clip.duration_ms if clip.loop else actor.elapsed
+    return sorted(actor.clips).index(actor.clip_name), min(int(elapsed), 0xFFFF)
+
+
+class StateEncoder:
+    """화살마다 번호를 붙여 두고 틱마다 델타를, 필요할 때 키프레임을 만듦"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.known = {}       # id(화살) -> (번호, 화살). 화살을 잡아 둬서 id가 다른 화살에 재사용되지 않게 함
+        self.next_id = 0
+        self.last_tick = None
+        self.header = None
+        self.needs_key = False   # 마지막 delta만으로는 관전 쪽 화살 위치가 맞지 않음
+
+    def _header(self, kind, steps):
+        return kind + self.header[1:5] + bytes((steps,)) + self.header[6:]
+
+    def delta(self, state, fight, tick, now_ms):
+        """지난 delta 이후 바뀐 것. 처음이거나 reset 뒤에는 모든 화살이 새 화살로 들어감"""
+        steps = 0 if self.last_tick is None else max(0, min(255, tick - self.last_tick))
+        self.last_tick = tick
+        # 관전 쪽은 이 메시지의 슬로우 플래그로 steps틱을 움직임. 한 틱이면 그 틱에 쓴 값과 같지만
+        # 여러 틱이면 도중에 슬로우가 켜지거나 꺼졌을 수 있음
+        self.needs_key = steps > 1
+        flags = ((F_READY_1P if state.skill_1p.ready else 0) | (F_READY_2P if state.skill_2p.ready else 0) |
+                 (F_SLOW if state.slow_active else 0) | (F_SMALL if state.small_active else 0) |
+                 (F_DEAD_1P if state.dead_1p else 0) | (F_DEAD_2P if state.dead_2p else 0))
+        parts = [HEADER.pack(MSG_DELTA, tick & 0xFFFFFFFF, steps, state.score_1p, state.score_2p,
+                             state.skill_1p.meter, state.skill_2p.meter, flags,
+                             max(0, min(0xFFFF, state.slow_end_time - now_ms)) if state.slow_active else 0,
+                             max(0, min(0xFFFF, state.small_end_time - now_ms)) if state.small_active else 0)]
+        for p in (state.player_1p, state.player_2p):
+            parts.append(PLAYER.pack(int(p.x * POS_SCALE), int(p.y * POS_SCALE), p.r))
+        actors = fight.animator.actors if fight is not None else ()
+        parts.append(bytes((len(actors),)))
+        parts.extend(ACTOR.pack(*actor_state(a)) for a in actors)
+        self.header = b"".join(parts)
+
+        known = self.known
+        current = {id(a): a for a in state.arrows}
+        removed = [k for k in known if k not in current]
+        added = [a for k, a in current.items() if k not in known]
+        out = [self.header, COUNT.pack(len(removed))]
+        for k in removed:
+            out.append(ARROW_ID.pack(known.pop(k)[0]))
+        out.append(COUNT.pack(len(added)))
+        for a in added:
+            net_id = self.next_id
+            self.next_id = (self.next_id + 1) & 0xFFFF
+            known[id(a)] = (net_id, a)
+            out.append(ARROW.pack(net_id, a.x, a.y, a.vx, a.vy))
+        return b"".join(out)
+
+    def keyframe(self, layout):
+        """마지막 delta 시점의 전체 상태"""
+        out = [self._header(MSG_KEY, 0), LAYOUT.pack(layout.f_w, layout.f_h), COUNT.pack(len(self.known))]
+        out.extend(ARROW.pack(net_id, a.x, a.y, a.vx, a.vy) for net_id, a in self.known.values())
+        return b"".join(out)
+
+
+class Subscriber:
+    __slots__ = ("sock", "addr", "queue", "queued", "offset", "need_key", "bytes_sent", "send_s", "skipped")
+
+    def __init__(self, sock, addr):
+        self.sock = sock
+        self.addr = addr
+        self.queue = []      # 보낼 메시지 (길이 포함 바이트)
+        self.queued = 0      # queue 전체 바이트에서 이미 보낸 offset을 뺀 값
+        self.offset = 0      # queue[0]에서 이미 보낸 바이트
+        self.need_key = True
+        self.bytes_sent = 0
+        self.send_s = 0.0
+        self.skipped = 0     # 버퍼가 차서 버린 메시지 수
+
+
+class SpectatorPublisher:
+    """관전자 접속을 받고 틱마다 상태를 보냄. publish()는 어떤 경우에도 소켓을 기다리지 않음"""
+
+    def __init__(self, host=SPECTATE_HOST, port=SPECTATE_PORT, max_buffer=SPECTATE_MAX_BUFFER,
+                 keyframe_every=SPECTATE_KEYFRAME_EVERY):
+        self.max_buffer = max_buffer
+        self.keyframe_every = keyframe_every
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen(16)
+        self.listener.setblocking(False)
+        self.port = self.listener.getsockname()[1]
+        self.encoder = StateEncoder()
+        self.subs = []
+        self.since_key = 0
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.ticks = 0
+        self.encode_s = 0.0
+        self.started = time.perf_counter()
+        for sub in self.subs:
+            sub.bytes_sent = 0
+            sub.send_s = 0.0
+            sub.skipped = 0
+
+    def new_round(self):
+        """라운드가 바뀌거나 배치가 바뀌면 모두 키프레임부터"""
+        self.encoder.reset()
+        for sub in self.subs:
+            sub.need_key = True
+
+    def resync(self):
+        """상태가 관전 쪽 예측과 다르게 바뀌었을 때 (넷플레이 되감기 등): 모두 다음 메시지를 키프레임으로"""
+        for sub in self.subs:
+            sub.need_key = True
+
+    def publish(self, state, layout, fight, tick, now_ms):
+        """틱마다 한 번. tick은 라운드 시작부터 센 시뮬레이션 틱 (멈춘 프레임은 같은 값)"""
+        self._accept()
+        if not self.subs:
+            self.encoder.reset()
+            return
+        start = time.perf_counter()
+        body = self.encoder.delta(state, fight, tick, now_ms)
+        delta = FRAME.pack(len(body)) + body
+        key = None
+        self.since_key += 1
+        if self.since_key >= self.keyframe_every or self.encoder.needs_key:
+            self.since_key = 0
+            self.resync()
+        self.encode_s += time.perf_counter() - start
+        self.ticks += 1
+
+        for sub in self.subs:
+            msg = delta
+            if not sub.need_key and sub.queued + len(msg) > self.max_buffer:
+                self._drop_pending(sub)
+            if sub.need_key:
+                if key is None:
+                    start = time.perf_counter()
+                    body = self.encoder.keyframe(layout)
+                    key = FRAME.pack(len(body)) + body
+                    self.encode_s += time.perf_counter() - start
+                if sub.queued + len(key) > self.max_buffer:
+                    self._drop_pending(sub)
+                msg = key
+                sub.need_key = False
+            sub.queue.append(msg)
+            sub.queued += len(msg)
+        self.flush()
+
+    def _drop_pending(self, sub):
+        # 보내다 만 메시지는 끊으면 스트림이 깨지므로 남기고 나머지를 버림
+        keep = sub.queue[:1] if sub.offset else []
+        sub.skipped += len(sub.queue) - len(keep)
+        sub.queue = keep
+        sub.queued = len(keep[0]) - sub.offset if keep else 0
+        sub.need_key = True
+
+    def flush(self):
+        dead = []
+        for sub in self.subs:
+            start = time.perf_counter()
+            try:
+                while sub.queue:
+                    head = sub.queue[0]
+                    n = sub.sock.send(memoryview(head)[sub.offset:])
+                    sub.bytes_sent += n
+                    sub.queued -= n
+                    sub.offset += n
+                    if sub.offset < len(head):
+                        break   # 소켓 버퍼가 찼음. 나머지는 다음 틱에
+                    sub.queue.pop(0)
+                    sub.offset = 0
+            except (BlockingIOError, InterruptedError):
+                pass
+            except OSError:
+                dead.append(sub)
+            sub.send_s += time.perf_counter() - start
+        for sub in dead:
+            sub.sock.close()
+            self.subs.remove(sub)
+
+    def _accept(self):
+        while True:
+            try:
+                sock, addr = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.subs.append(Subscriber(sock, addr))
+
+    def stats(self):
+        """지난 호출 이후: 관전자 수, 틱당 인코딩 us, 관전자 하나당 초당 KB / 틱당 전송 us / 버린 메시지"""
+        elapsed = max(1e-9, time.perf_counter() - self.started)
+        ticks = max(1, self.ticks)
+        n = len(self.subs)
+        out = {"viewers": n, "ticks": self.ticks, "encode_us": round(self.encode_s / ticks * 1e6, 1)}
+        if n:
+            out.update({
+                "kb_per_s": round(sum(s.bytes_sent for s in self.subs) / n / elapsed / 1024, 2),
+                "send_us": round(sum(s.send_s for s in self.subs) / n / ticks * 1e6, 1),
+                "skipped": sum(s.skipped for s in self.subs),
+            })
+        self._reset_stats()
+        return out
+
+    def close(self):
+        for sub in self.subs:
+            sub.sock.close()
+        self.subs = []
+        self.listener.close()
+
+
+class MirrorState:
+    """받은 메시지로 PlayState를 다시 만들어 둠. render 함수들에 그대로 넘겨 그릴 수 있음"""
+
+    def __init__(self):
+        self.layout = None
+        self.state = None
+        self.arrows = {}     # 번호 -> Arrow
+        self.actors = ()     # (클립 번호, 경과 ms)
+        self.tick = 0
+
+    def apply(self, msg):
+        """메시지 하나(길이 제외)를 반영. 키프레임을 받기 전 델타는 버리고 False"""
+        from engine.entities import Arrow, vec_normalize
+        from engine.shapes import arrow_shape
+        from engine.state import Layout, PlayState
+
+        kind = msg[:1]
+        if kind == MSG_DELTA and self.state is None:
+            return False
+        (_, self.tick, steps, score_1p, score_2p, meter_1p, meter_2p, flags,
+         slow_left, small_left) = HEADER.unpack_from(msg)
+        pos = HEADER.size
+        players = []
+        for _ in range(2):
+            players.append(PLAYER.unpack_from(msg, pos))
+            pos += PLAYER.size
+        n_actors = msg[pos]
+        pos += 1
+        self.actors = [ACTOR.unpack_from(msg, pos + i * ACTOR.size) for i in range(n_actors)]
+        pos += n_actors * ACTOR.size
+
+        if kind == MSG_KEY:
+            f_w, f_h = LAYOUT.unpack_from(msg, pos)
+            pos += LAYOUT.size
+            if self.layout is None or (self.layout.f_w, self.layout.f_h) != (f_w, f_h):
+                self.layout = Layout.for_window(f_w, f_h)
+            self.state = PlayState(self.layout)
+            self.arrows = {}
+        else:
+            # 있던 화살은 보낸 쪽과 같은 식으로 진행한 틱 수만큼 움직임
+            factor = SLOW_FACTOR if flags & F_SLOW else 1.0
+            for a in self.arrows.values():
+                for _ in range(steps):
+                    a.update(factor)
+            (n,) = COUNT.unpack_from(msg, pos)
+            pos += COUNT.size
+            for i in range(n):
+                self.arrows.pop(ARROW_ID.unpack_from(msg, pos + i * ARROW_ID.size)[0], None)
+            pos += n * ARROW_ID.size
+
+        (n,) = COUNT.unpack_from(msg, pos)
+        pos += COUNT.size
+        for i in range(n):
+            net_id, x, y, vx, vy = ARROW.unpack_from(msg, pos + i * ARROW.size)
+            dirx, diry = vec_normalize(vx, vy)
+            shape = arrow_shape(math.degrees(math.atan2(vy, vx)))
+            self.arrows[net_id] = Arrow.from_snapshot((x, y, x, y, -1, vx, vy, dirx, diry, 0, 0, shape))
+
+        state = self.state
+        state.scores = [score_1p, score_2p]
+        state.skill_1p.meter, state.skill_2p.meter = meter_1p, meter_2p
+        state.skill_1p.ready = bool(flags & F_READY_1P)
+        state.skill_2p.ready = bool(flags & F_READY_2P)
+        state.slow_active, state.slow_end_time = bool(flags & F_SLOW), slow_left
+        state.small_active, state.small_end_time = bool(flags & F_SMALL), small_left
+        state.dead = [bool(flags & F_DEAD_1P), bool(flags & F_DEAD_2P)]
+        for p, (x, y, r) in zip((state.player_1p, state.player_2p), players):
+            p.x, p.y, p.r = x / POS_SCALE, y / POS_SCALE, r
+        state.arrows = list(self.arrows.values())
+        return True
+
+    def apply_fight(self, fight):
+        for actor, (clip_idx, elapsed) in zip(fight.animator.actors, self.actors):
+            actor.clip_name = sorted(actor.clips)[clip_idx]
+            actor.elapsed = elapsed
+
+
+class SpectatorClient:
+    """관전 쪽 소켓. poll()은 지금까지 도착한 완성된 메시지들을 돌려줌 (기다리지 않음)"""
+
+    def __init__(self, addr):
+        self.sock = socket.create_connection(addr)
+        self.sock.setblocking(False)
+        self.buf = bytearray()
+        self.bytes_received = 0
+
+    def poll(self):
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            if not data:
+                raise ConnectionError("publisher closed")
+            self.bytes_received += len(data)
+            self.buf += data
+        out = []
+        pos = 0
+        while len(self.buf) - pos >= FRAME.size:
+            (n,) = FRAME.unpack_from(self.buf, pos)
+            if len(self.buf) - pos - FRAME.size < n:
+                break
+            out.append(bytes(self.buf[pos + FRAME.size:pos + FRAME.size + n]))
+            pos += FRAME.size + n
+        del self.buf[:pos]
+        return out
+
+    def close(self):
+        self.sock.close()
+
+
+def watch(addr):
+    """관전 창. 게임과 같은 그리기 함수를 쓰고 시뮬레이션은 하지 않음"""
+    import pygame
+
+    from engine import render
+    from engine.config import FPS, FRAME_COLOR
+
+    pygame.init()
+    client = SpectatorClient(addr)
+    mirror = MirrorState()
+    screen = None
+    fight = None
+    clock = pygame.time.Clock()
+    running = True
+    while running:
+        clock.tick(FPS)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        try:
+            messages = client.poll()
+        except ConnectionError:
+            break
+        for msg in messages:
+            mirror.apply(msg)
+        if mirror.state is None:
+            continue
+        layout = mirror.layout
+        if screen is None or screen.get_size() != (layout.f_w, layout.f_h):
+            screen = pygame.display.set_mode((layout.f_w, layout.f_h))
+            pygame.display.set_caption("DodgeArrow (spectator)")
+            if fight is None:
+                fight = render.FightScene()
+            fight.set_layout(layout.f_w, layout.fight_h)
+        mirror.apply_fight(fight)
+        fight_surf = screen.subsurface(pygame.Rect(0, 0, layout.f_w, layout.fight_h))
+        fight.draw(fight_surf)
+        pygame.draw.line(screen, FRAME_COLOR, (0, layout.fight_h), (layout.f_w, layout.fight_h), 5)
+        play_surf = screen.subsurface(pygame.Rect(0, layout.fight_h, layout.f_w, layout.play_h))
+        render.draw_play_scene(play_surf, layout, mirror.state, [], 0, "spectator")
+        pygame.display.flip()
+    client.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    host, _, port = (sys.argv[1] if len(sys.argv) > 1 else SPECTATE_HOST).partition(":")
+    watch((host, int(port) if port else SPECTATE_PORT))
@@ -0,0 +1,147 @@
+"""스프라이트 변환 결과 LRU 캐시와 메모리 보고서"""
+import collections
+import os
+import weakref
+
+import pygame
+
+from engine import atlas
+
+
+class SpriteCache:
+    """(에셋 경로, 배율, 좌우 반전, 목표 높이) 별로 변환한 이미지를 처음 쓸 때 만들고 LRU로 보관
+
+    원본도 (경로, 1.0, False, None) 키로 같은 캐시에 들어가므로 같은 파일은 한 번만 디코딩함.
+    아틀라스(atlas.py로 미리 만든 것)가 있으면 원본은 아틀라스의 서브서피스를 그대로 씀.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, atlas_index: str = "./assets/" + atlas.ATLAS_INDEX):
+        self.max_bytes = max_bytes
+        self.atlas_index = atlas_index
+        self.atlas_frames = None   # 처음 원본이 필요할 때 읽음
+        self.atlas_sheet = None    # 아틀라스 시트 weakref (놓아준 뒤에도 살아 있는지 보고서에서 확인)
+        self.entries = collections.OrderedDict()
+        self.requested = set()     # 바깥에서 직접 받아간 키 (release_sources가 지우지 않음)
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def surface_bytes(surf: pygame.Surface) -> int:
+        # 아틀라스 서브서피스는 부모 픽셀을 빌려 쓰므로 자기 영역 크기만 셈
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def get(self, path: str, scale: float = 1.0, flip: bool = False, height: int = None) -> pygame.Surface:
+        """height를 주면 scale 대신 세로가 height가 되도록 비율을 맞춰 줄임/늘림"""
+        key = (path, scale, flip, height)
+        self.requested.add(key)
+        return self._get(key)
+
+    def _get(self, key):
+        path, scale, flip, height = key
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+
+        if key == (path, 1.0, False, None):
+            surf = self._load_source(path)
+        else:
+            surf = self._get((path, 1.0, False, None))
+            if height is not None:
+                w = max(1, round(surf.get_width() * height / surf.get_height()))
+                surf = pygame.transform.scale(surf, (w, height))
+            elif scale != 1.0:
+                surf = pygame.transform.scale(surf, (int(surf.get_width() * scale),
+                                                     int(surf.get_height() * scale)))
+            if flip:
+                surf = pygame.transform.flip(surf, True, False)
+        self._store(key, surf)
+        return surf
+
+    def _load_source(self, path):
+        if self.atlas_frames is None:
+            self.atlas_frames = atlas.load(self.atlas_index) if self.atlas_index else {}
+            for frame in self.atlas_frames.values():
+                self.atlas_sheet = weakref.ref(frame.get_parent())
+                break
+        frame = self.atlas_frames.get(os.path.normpath(path))
+        if frame is not None:
+            return frame
+        return pygame.image.load(path).convert_alpha()
+
+    def _store(self, key, surf):
+        self.entries[key] = surf
+        self.resident_bytes += self.surface_bytes(surf)
+        # 방금 넣은 항목은 빼고 오래 안 쓴 것부터 내보냄
+        while self.resident_bytes > self.max_bytes and len(self.entries) > 1:
+            old_key, old = self.entries.popitem(last=False)
+            self.resident_bytes -= self.surface_bytes(old)
+
+    def release_sources(self):
+        """최종 변형을 다 만든 뒤 호출: 변형을 만들 때만 쓴 원본과 아틀라스 목록을 놓아줌
+
+        놓아준 원본이 다시 필요하면 디스크(또는 아틀라스)에서 다시 읽음.
+        아틀라스 서브서피스를 바깥에서 그대로 쓰고 있으면 시트는 남음 (프레임은 시트 한 장에서 그림).
+        따로 읽은 원본(아틀라스가 없거나 아틀라스에 없는 파일)은 여기서 실제로 놓아짐.
+        """
+        for key in list(self.entries):
+            if key[1:] == (1.0, False, None) and key not in self.requested:
+                self.resident_bytes -= self.surface_bytes(self.entries.pop(key))
+        self.atlas_frames = None
+
+    def report(self):
+        """[(이름, 서피스), ...] 최근에 쓴 순서의 역순. 아틀라스 시트는 살아 있으면 한 번만 들어감
+
+        시트는 캐시 항목이 아니라 실제로 아직 메모리에 남아 있는지(weakref)로 확인함.
+        """
+        rows = []
+        sheets = {}
+        for key, surf in self.entries.items():
+            path, scale, flip, height = key
+            name = f"{path} x{scale}" + (" flip" if flip else "") + (f" h{height}" if height else "")
+            rows.append((name, surf))
+            parent = surf.get_parent()
+            if parent is not None:
+                sheets[id(parent)] = parent
+        sheet = self.atlas_sheet() if self.atlas_sheet is not None else None
+        if sheet is not None:
+            sheets[id(sheet)] = sheet
+        for sheet in sheets.values():
+            rows.append(("(atlas sheet)", sheet))
+        return rows
+
+    def clear(self):
+        self.entries.clear()
+        self.resident_bytes = 0
+
+
+def describe_surface(surf: pygame.Surface) -> str:
+    """픽셀 형식 요약. 예: '32bit RGBA', '32bit RGB', '32bit RGBA sub'"""
+    alpha = "RGBA" if surf.get_flags() & pygame.SRCALPHA else "RGB"
+    sub = " sub" if surf.get_parent() is not None else ""
+    return f"{surf.get_bitsize()}bit {alpha}{sub}"
+
+
+def format_memory_report(rows):
+    """[(이름, 서피스 또는 (형식, 바이트))] -> 표 문자열 줄 목록. 서브서피스는 합계에서 뺌 (시트에서 셈)"""
+    lines = []
+    total = 0
+    for name, item in rows:
+        if isinstance(item, pygame.Surface):
+            w, h = item.get_size()
+            fmt, size = f"{w}x{h} {describe_surface(item)}", SpriteCache.surface_bytes(item)
+            if item.get_parent() is None:
+                total += size
+        else:
+            fmt, size = item
+            total += size
+        lines.append(f"{name:<44} {fmt:<26} {size / 1024:>9.1f} KB")
+    lines.append(f"{'TOTAL':<44} {'':<26} {total / 1024:>9.1f} KB")
+    return lines
+
+
+# 전투 장면과 BassFight가 같이 쓰는 캐시
+sprites = SpriteCache()
@@ -0,0 +1,217 @@
+"""판 상태: 창 크기별 배치(Layout)와 한 라운드의 상태(PlayState)"""
+import random
+from dataclasses import dataclass
+
+from engine.config import (
+    HELL_WIN_SCORE, HUD_H, MODE_HELL, MODE_NORMAL, RULE_DODGE, RULE_SCRAPE, SPATIAL_CELL, WIN_SCORE_THRESHOLD,
+)
+from engine.entities import Player, SkillState, Spawner
+from engine.spatial import SpatialHash
+
+# 두 명 모드 (1P 스치기, 2P 피하기). 넷플레이와 관전은 이 구성만 씀
+TWO_PLAYER_RULES = (RULE_SCRAPE, RULE_DODGE)
+
+
+@dataclass(frozen=True)
+class Bounds:
+    """pygame.Rect 대신 쓰는 사각형 (시뮬레이션만 돌릴 때 pygame이 필요 없도록)"""
+    left: int
+    top: int
+    width: int
+    height: int
+
+    @property
+    def right(self):
+        return self.left + self.width
+
+    @property
+    def bottom(self):
+        return self.top + self.height
+
+    @property
+    def centerx(self):
+        return self.left + self.width // 2
+
+    @property
+    def centery(self):
+        return self.top + self.height // 2
+
+
+@dataclass(frozen=True)
+class Layout:
+    """창 크기에서 나오는 배치. 위 절반은 전투 장면, 아래 절반은 피하기 구역 (플레이어마다 세로 구역 하나)"""
+    f_w: int
+    f_h: int
+    fight_h: int
+    play_h: int
+    w: int          # 피하기 구역 크기
+    h: int
+    center_x: int   # 가운데 (두 명일 때 1P / 2P 경계)
+    lanes: int = 2
+
+    @classmethod
+    def for_window(cls, f_w, f_h, lanes=2):
+        fight_h = f_h * 1 // 2
+        play_h = f_h - fight_h
+        return cls(f_w, f_h, fight_h, play_h, f_w, play_h, f_w // 2, lanes)
+
+    @property
+    def dividers(self):
+        """구역 경계 x 좌표들 (왼쪽부터)"""
+        return tuple(self.w * i // self.lanes for i in range(1, self.lanes))
+
+
+class PlayState:
+    """라운드 하나의 시뮬레이션 상태. 좌표는 피하기 구역 기준
+
+    seed를 주면 난수를 전역 random 대신 이 라운드 전용 Random에서 뽑으므로,
+    같은 seed + 같은 입력 + 같은 시각이면 어느 기계에서 돌려도 같은 결과가 나옴 (넷플레이용).
+    rules: 플레이어마다 규칙 (RULE_SCRAPE / RULE_DODGE). 수는 layout.lanes와 같아야 함.
+    mode: MODE_NORMAL / MODE_HELL (스폰 표와 이김 기준). reset()해도 그대로.
+    player_1p, score_2p 같은 이름은 0번, 1번 플레이어를 가리킴.
+    """
+
+    def __init__(self, layout: Layout, start_ms: int = 0, seed=None, rules=TWO_PLAYER_RULES, mode=MODE_NORMAL):
+        if len(rules) != layout.lanes:
+            raise ValueError(f"플레이어 {len(rules)}명인데 구역은 {layout.lanes}개")
+        self.layout = layout
+        self.mode = mode
+        self.win_score = HELL_WIN_SCORE if mode == MODE_HELL else WIN_SCORE_THRESHOLD
+        w, h = layout.w, layout.h
+        edges = (0,) + layout.dividers + (w,)
+        self.play_rect = Bounds(0, HUD_H, w, h - HUD_H)
+        self.lanes = [Bounds(x0, HUD_H, x1 - x0, h - HUD_H) for x0, x1 in zip(edges, edges[1:])]
+
+        self.players = [Player(lane.centerx, lane.centery, lane, f"{i + 1}P", rule)
+                        for i, (lane, rule) in enumerate(zip(self.lanes, rules))]
+        self.arrows = []
+        self.arrow_pool = []   # reset()에서 치운 화살. 다음 라운드에 새로 만들지 않고 꺼내 씀
+        self.grid = SpatialHash(SPATIAL_CELL)   # 틱마다 다시 채우는 충돌 후보 격자 (상태 사본에는 안 들어감)
+        self.rng = random if seed is None else random.Random(seed)
+        self.spawner = Spawner(self.play_rect, layout.dividers, start_ms, rng=self.rng, mode=mode)
+        self.scores = [0] * len(rules)
+        self.skills = [SkillState(rule) for rule in rules]
+
+        self.slow_active = False
+        self.slow_end_time = 0
+        self.small_active = False
+        self.small_end_time = 0
+        self.dead = [False] * len(rules)
+
+    def snapshot(self):
+        """되감기/체크포인트용 상태 사본
+
+        화살은 객체 참조 + 움직이는 값(x, y, x0, y0, 마지막 점수 시각, 근접 단계)만 담음.
+        방향, 속도, 그림은 화살이 나온 뒤 바뀌지 않으므로 객체에 있는 값을 그대로 씀.
+        """
+        arrows = tuple(self.arrows)
+        values = tuple([(a.x, a.y, a.x0, a.y0, a.last_scored_time, a.proximity_level) for a in arrows])
+        return (tuple(p.snapshot() for p in self.players), (arrows, values), self.spawner.snapshot(),
+                tuple(self.scores), tuple(s.snapshot() for s in self.skills),
+                self.slow_active, self.slow_end_time, self.small_active, self.small_end_time, tuple(self.dead))
+
+    def restore(self, snap):
+        """사본을 찍은 때로 되돌림. 화살 객체는 새로 만들지 않고 같은 객체에 값을 다시 씀"""
+        (players, (arrows, values), spawner, scores, skills,
+         self.slow_active, self.slow_end_time, self.small_active, self.small_end_time, dead) = snap
+        for p, ps in zip(self.players, players):
+            p.restore(ps)
+        for a, v in zip(arrows, values):
+            a.x, a.y, a.x0, a.y0, a.last_scored_time, a.proximity_level = v
+        self.arrows = list(arrows)
+        self.spawner.restore(spawner)
+        self.scores = list(scores)
+        for s, ss in zip(self.skills, skills):
+            s.restore(ss)
+        self.dead = list(dead)
+
+    def reset(self, start_ms: int = 0, seed=None):
+        """같은 배치로 새 라운드. PlayState(layout, start_ms, seed, rules, mode)와 같은 상태가 되지만
+        플레이어/스포너/타이머 휠은 그대로 다시 쓰고 화살은 풀로 보냄
+
+        이전 라운드의 사본(snapshot)이 잡고 있던 화살도 다시 쓰게 되므로, 그 사본들은 더 쓰면 안 됨.
+        """
+        self.arrow_pool.extend(self.arrows)
+        self.arrows = []
+        if seed is None:
+            rng = random
+        elif self.rng is random:
+            rng = random.Random(seed)
+        else:
+            rng = self.rng
+            rng.seed(seed)
+        self.rng = self.spawner.rng = self.spawner.schedule.rng = rng
+        for p in self.players:
+            p.reset()
+        self.spawner.reset(start_ms)
+        self.scores = [0] * len(self.players)
+        for s in self.skills:
+            s.reset()
+        self.slow_active = False
+        self.slow_end_time = 0
+        self.small_active = False
+        self.small_end_time = 0
+        self.dead = [False] * len(self.players)
+
+    @property
+    def rules(self):
+        return tuple(p.rule for p in self.players)
+
+    # 두 명 모드 이름 (0번, 1번 플레이어)
+    @property
+    def player_1p(self):
+        return self.players[0]
+
+    @property
+    def player_2p(self):
+        return self.players[1]
+
+    @property
+    def play_rect_1p(self):
+        return self.lanes[0]
+
+    @property
+    def play_rect_2p(self):
+        return self.lanes[1]
+
+    @property
+    def score_1p(self):
+        return self.scores[0]
+
+    @property
+    def score_2p(self):
+        return self.scores[1]
+
+    @property
+    def skill_1p(self):
+        return self.skills[0]
+
+    @property
+    def skill_2p(self):
+        return self.skills[1]
+
+    @property
+    def dead_1p(self):
+        return self.dead[0]
+
+    @property
+    def dead_2p(self):
+        return self.dead[1]
+
+    def team_scores(self):
+        """(스치기 규칙 점수 합, 피하기 규칙 점수 합). 두 명 모드면 (1P 점수, 2P 점수)와 같음"""
+        scrape = sum(s for s, p in zip(self.scores, self.players) if p.rule == RULE_SCRAPE)
+        return scrape, self.total - scrape
+
+    @property
+    def total(self):
+        return sum(self.scores)
+
+    @property
+    def game_over(self):
+        """한 명이라도 죽으면 라운드 끝 (같이 버티는 게임)"""
+        return any(self.dead)
+
+    @property
+    def game_won(self):
+        return self.total >= self.win_score
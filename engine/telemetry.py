@@ -0,0 +1,102 @@
+"""점수/프레임/이벤트 기록을 버퍼에 모아 한 번에 파일로 씀"""
+import collections
+import json
+import os
+import random
+import threading
+import time
+
+
+class Telemetry:
+    """게임 기록을 메모리 버퍼에 모았다가 백그라운드 스레드가 파일로 내보냄
+
+    한 줄에 JSON 하나 (jsonl). 파일이 max_bytes를 넘으면 path.1, path.2 ... 로 밀어냄.
+    enabled=False면 스레드도 파일도 만들지 않고 모든 호출이 바로 리턴함.
+    """
+
+    def __init__(self, path: str, enabled: bool = True, sample_rate: float = 1.0,
+                 flush_interval: float = 1.0, max_bytes: int = 4 * 1024 * 1024,
+                 backups: int = 3):
+        self.path = path
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.buffer = collections.deque()
+        self.frame_times = []
+        self.dropped = 0
+        self._rng = random.Random()
+        self._stop = threading.Event()
+        self._thread = None
+        if enabled:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+            self._thread.start()
+
+    def record(self, kind: str, always: bool = False, **fields):
+        """레코드 하나를 버퍼에 넣음. always=False면 sample_rate 비율만 남김"""
+        if not self.enabled:
+            return
+        if not always and self.sample_rate < 1.0 and self._rng.random() >= self.sample_rate:
+            self.dropped += 1
+            return
+        fields["k"] = kind
+        fields["t"] = int(time.time() * 1000)
+        self.buffer.append(fields)
+
+    def frame(self, frame_ms: float):
+        if self.enabled:
+            self.frame_times.append(frame_ms)
+
+    def frame_stats(self):
+        """지금까지 모은 프레임 시간 통계를 돌려주고 초기화"""
+        times = self.frame_times
+        self.frame_times = []
+        if not times:
+            return {}
+        times.sort()
+        n = len(times)
+        return {
+            "n": n,
+            "avg": round(sum(times) / n, 2),
+            "p95": round(times[min(n - 1, int(n * 0.95))], 2),
+            "max": round(times[-1], 2),
+        }
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self._flush()
+        self._flush()
+
+    def _flush(self):
+        lines = []
+        while self.buffer:
+            lines.append(json.dumps(self.buffer.popleft(), separators=(",", ":")))
+        if not lines:
+            return
+        data = "\n".join(lines) + "\n"
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) + len(data) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+        except OSError:
+            self.dropped += len(lines)
+
+    def _rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
@@ -0,0 +1,182 @@
+"""pygame._sdl2.video(Window / Renderer / Texture)로 그리는 백엔드 (config.RENDER_BACKEND = RENDER_TEXTURE)
+
+배경, 전투 장면 프레임, 화살, 플레이어 원, 이펙트 X처럼 바뀌지 않는 그림은 처음 쓸 때 텍스처로 한 번만 올리고
+프레임마다 렌더러 복사만 함. 화살은 깃털 유무별 0도 텍스처 하나를 그릴 때 구간 각도만큼 돌림.
+글자가 바뀌는 HUD만 Surface에 그려서 프레임마다 텍스처를 갱신함.
+
+set_mode 화면에는 렌더러를 붙일 수 없어서, convert()/convert_alpha()가 쓸 화면 형식용으로 보이지 않는 1x1 창을 열고
+그림은 새 Window에 그림. 창 크기는 고정 (VIDEORESIZE는 set_mode 창에서만 옴).
+게임 오버/대기 화면처럼 가끔 바뀌는 화면은 Surface에 그린 뒤 show_surface()로 통째로 올림.
+"""
+import pygame
+from pygame._sdl2 import video
+
+from engine import render
+from engine.config import BG_COLOR, FRAME_COLOR, HUD_H, RENDER_DRIVER, RULE_DODGE, TEXTURE_ROTATE_ARROWS
+from engine.shapes import arrow_hitbox, arrow_shape, circle_outline
+
+BLEND = 1   # SDL_BLENDMODE_BLEND
+
+
+class TextureBackend:
+    def __init__(self, layout, driver=RENDER_DRIVER, rotate_arrows=TEXTURE_ROTATE_ARROWS, title="DodgeArrow",
+                 vsync=False):
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = video.Window(title, (layout.f_w, layout.f_h))
+        names = [d.name for d in video.get_drivers()]
+        # 이름이 없으면 (None 포함) SDL이 고름
+        self.renderer = video.Renderer(self.window, index=names.index(driver) if driver in names else -1,
+                                       vsync=vsync)
+        self.driver = driver if driver in names else "auto"
+        self.rotate_arrows = rotate_arrows
+        # id(서피스) -> (서피스, 텍스처). 서피스를 같이 들고 있어야 id가 다른 서피스에 다시 쓰이지 않음
+        self.sprites = {}
+        self.background = self.background_tex = None
+        self.arrow_textures = {}    # ArrowShape 또는 깃털 여부(돌리는 방식) -> (텍스처, dx, dy, w, h)
+        self.circles = {}           # (색, 반지름, 테두리) -> 텍스처
+        self.slashes = {}           # 이펙트 크기 -> 텍스처 (알파와 각도는 그릴 때)
+        self.hud_surf = self.hud_tex = None
+
+    def sprite(self, surf):
+        entry = self.sprites.get(id(surf))
+        if entry is None:
+            entry = self.sprites[id(surf)] = (surf, video.Texture.from_surface(self.renderer, surf))
+        return entry[1]
+
+    def arrow_texture(self, shape):
+        """(텍스처, dx, dy, w, h): 화살 중심(정수)에 dx, dy를 더하면 텍스처 왼쪽 위"""
+        key = shape.feathers if self.rotate_arrows else shape
+        entry = self.arrow_textures.get(key)
+        if entry is None:
+            base = arrow_shape(0, shape.feathers) if self.rotate_arrows else shape
+            image, dx, dy = base.blit
+            entry = self.arrow_textures[key] = (video.Texture.from_surface(self.renderer, image), dx, dy,
+                                                image.get_width(), image.get_height())
+        return entry
+
+    def circle(self, color, radius, ring):
+        key = (color, radius, ring)
+        tex = self.circles.get(key)
+        if tex is None:
+            surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (radius, radius), radius)
+            if ring:
+                pygame.draw.circle(surf, (255, 255, 255), (radius, radius), radius, 2)
+            tex = self.circles[key] = video.Texture.from_surface(self.renderer, surf)
+        return tex
+
+    def slash(self, length):
+        """render.draw_effect와 같은 X (돌리기 전, 불투명). 흐려지는 건 텍스처 알파로"""
+        tex = self.slashes.get(length)
+        if tex is None:
+            surf = pygame.Surface((length * 2, length * 2), pygame.SRCALPHA)
+            half = length // 2
+            pygame.draw.line(surf, (255, 250, 240), (length - half, length - half), (length + half, length + half), 3)
+            pygame.draw.line(surf, (255, 250, 240), (length - half, length + half), (length + half, length - half), 3)
+            tex = self.slashes[length] = video.Texture.from_surface(self.renderer, surf)
+            tex.blend_mode = BLEND
+        return tex
+
+    def fill(self, color, rect):
+        # draw_color는 RGBA 네 개만 받음
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.fill_rect(rect)
+
+    def draw_fight(self, fight):
+        if self.background is not fight.background:
+            self.background = fight.background
+            self.background_tex = video.Texture.from_surface(self.renderer, fight.background)
+        self.background_tex.draw(dstrect=(0, 0))
+        for actor in fight.animator.actors:
+            self.sprite(actor.frame).draw(dstrect=actor.pos)
+
+    def draw_play(self, layout, state, effects, now_ms, tier_name, show_hitbox=False,
+                  skill_keys=render.DEFAULT_SKILL_KEYS):
+        """render.draw_play_scene과 같은 순서. 뷰포트를 피하기 구역(창에서 layout.fight_h 아래)으로 잡아서
+        좌표는 구역 기준이고, 구역 밖으로 나간 화살은 서브서피스처럼 잘림"""
+        W, H = layout.w, layout.h
+        renderer = self.renderer
+        renderer.set_viewport((0, layout.fight_h, W, H))
+        self.fill(BG_COLOR, (0, 0, W, H))
+        self.fill((18, 20, 24), (0, HUD_H, W, H - HUD_H))
+        for x in layout.dividers:
+            self.fill(FRAME_COLOR, (x - 1, HUD_H, 3, H - HUD_H))
+        renderer.draw_color = pygame.Color(FRAME_COLOR)
+        renderer.draw_rect((0, HUD_H, W, H - HUD_H))
+        renderer.draw_rect((1, HUD_H + 1, W - 2, H - HUD_H - 2))
+
+        self.draw_arrows(state.arrows, show_hitbox)
+        for ef in effects:
+            if ef.life > 0:
+                tex = self.slash(ef.size)
+                tex.alpha = int(255 * (ef.life / ef.max_life))
+                # pygame.transform.rotate는 반시계, 렌더러는 시계 방향
+                tex.draw(dstrect=(int(ef.x) - ef.size, int(ef.y) - ef.size, ef.size * 2, ef.size * 2),
+                         angle=-ef.angle)
+
+        for player, dead in zip(state.players, state.dead):
+            if not dead:
+                ring = player.rule == RULE_DODGE and player.r == player.small_r
+                self.circle(render.player_color(player.who), player.r, ring).draw(
+                    dstrect=(int(player.x) - player.r, int(player.y) - player.r))
+                if show_hitbox:
+                    image, dx, dy = circle_outline(player.r)
+                    self.sprite(image).draw(dstrect=(int(player.x) + dx, int(player.y) + dy))
+
+        self.draw_hud(layout, state, now_ms, tier_name, skill_keys)
+        renderer.set_viewport(None)
+
+    def draw_arrows(self, arrows, show_hitbox):
+        textures = self.arrow_textures
+        texture = self.arrow_texture
+        if show_hitbox:
+            # 외곽선을 겹친 그림은 shapes가 모양마다 한 번 만들어 두므로 텍스처도 한 번만 올림 (돌리지 않음)
+            for a in arrows:
+                image, dx, dy = arrow_hitbox(a.shape)
+                self.sprite(image).draw(dstrect=(int(a.x) + dx, int(a.y) + dy))
+        elif self.rotate_arrows:
+            for a in arrows:
+                shape = a.shape
+                tex, dx, dy, w, h = textures.get(shape.feathers) or texture(shape)
+                # 0도 그림의 화살 중심 (-dx, -dy)을 축으로 돌림
+                tex.draw(dstrect=(int(a.x) + dx, int(a.y) + dy, w, h), angle=shape.angle, origin=(-dx, -dy))
+        else:
+            for a in arrows:
+                tex, dx, dy, w, h = textures.get(a.shape) or texture(a.shape)
+                tex.draw(dstrect=(int(a.x) + dx, int(a.y) + dy))
+
+    def draw_hud(self, layout, state, now_ms, tier_name, skill_keys):
+        """HUD는 글자가 바뀌므로 Surface에 그리고 텍스처 내용만 갈아 끼움"""
+        size = (layout.w, HUD_H + 2)
+        if self.hud_surf is None or self.hud_surf.get_size() != size:
+            self.hud_surf = pygame.Surface(size, pygame.SRCALPHA)
+            self.hud_tex = video.Texture(self.renderer, size, streaming=True)
+            self.hud_tex.blend_mode = BLEND
+        self.hud_surf.fill((0, 0, 0, 0))
+        render.draw_hud(self.hud_surf, layout, state, now_ms, tier_name, skill_keys)
+        self.hud_tex.update(self.hud_surf)
+        self.hud_tex.draw(dstrect=(0, 0))
+
+    def draw_frame(self, layout, fight, state, effects, now_ms, tier_name, show_hitbox=False,
+                   skill_keys=render.DEFAULT_SKILL_KEYS):
+        """게임 루프 한 프레임 (전투 장면 + 경계선 + 피하기 구역). 렌더러는 present 뒤 화면이 남지 않으므로 전부 다시 그림"""
+        self.draw_fight(fight)
+        self.fill(FRAME_COLOR, (0, layout.fight_h - 2, layout.f_w, 5))
+        self.draw_play(layout, state, effects, now_ms, tier_name, show_hitbox, skill_keys)
+
+    def present(self):
+        self.renderer.present()
+
+    def show_surface(self, surf):
+        """Surface에 그린 화면을 통째로 올려서 보여줌 (게임 오버, 대기 화면)"""
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        video.Texture.from_surface(self.renderer, surf).draw(dstrect=(0, 0))
+        self.renderer.present()
+
+    def to_surface(self):
+        """지금 화면 픽셀 (녹화용). 렌더러에서 읽어오므로 느림"""
+        return self.renderer.to_surface()
+
+    def close(self):
+        self.window.destroy()
@@ -1,5 +1,11 @@
+import os
+import sys
+
 import pygame
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from engine.sprite_cache import sprites
+
 pygame.init()
 
 screenWidth = 1200
@@ -12,12 +18,9 @@ pygame.display.set_caption("DodgeArrow Fighting")
 clock = pygame.time.Clock()
 fps = 60
 
-# 이미지 가져오는 함수
+# 이미지 가져오는 함수 (DodgeArrow.py와 같은 변환 캐시 사용)
 def getImage(path: str, scale=0.8):
-    originalImage = pygame.image.load(path).convert_alpha()
-    newWidth = int(originalImage.get_width() * scale)
-    newHeight = int(originalImage.get_height() * scale)
-    return pygame.transform.scale(originalImage, (newWidth, newHeight))
+    return sprites.get(path, scale)
 
 # 배경
 backgroundImage = getImage("./assets/background.png", scale=1.0)
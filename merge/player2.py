@@ -1,10 +1,17 @@
 # p2_game_refactored.py (p2.py 기반)
-import pygame
-import random
-import math
+import os
+import sys
 import json
 from dataclasses import dataclass
 
+import pygame
+
+# Arrow / Spawner / SlashEffect / Player는 본 게임과 같은 engine 패키지 것을 씀
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from engine.config import RULE_DODGE
+from engine.entities import Arrow, Player, SlashEffect, Spawner
+from engine.render import draw_arrow, draw_effect
+
 # 🎨 상수 정의 (p1.py와 중복되는 상수는 제거하거나, p1과 통합 시 하나의 파일에서 관리해야 함)
 # 화면 크기 관련 상수는 통합을 위해 제거했습니다.
 FPS = 60
@@ -17,48 +24,13 @@ FRAME_COLOR = (55, 60, 75)
 TEXT_COLOR = (235, 238, 245)
 SUB_TEXT = (200, 205, 215)
 PLAYER_COLOR = (230, 230, 240)
-SHAFT_MAIN = (170, 205, 255)
-SHAFT_CORE = (220, 240, 255)
-SHAFT_OUTLINE = (70, 105, 165)
-HEAD_MAIN = (255, 145, 130)
-HEAD_OUTLINE = (210, 90, 80)
-COLOR_FEATHER_OUT = (80, 110, 175)
-COLOR_FEATHER = (170, 205, 255)
-
-# 🏹 게임 파라미터 (p2의 고유 파라미터)
-ARROW_LENGTH = 150
-ARROW_SHAFT_W = 7
-ARROW_HEAD_LEN = 26
-ARROW_HEAD_W = 18
-ARROW_FEATHER_LEN = 18
-ARROW_FEATHER_W = 14
-PLAYER_RADIUS = 16
-PLAYER_RADIUS_SMALL = 9 # P2 고유
-PLAYER_SPEED = 5.0
-ARROW_MIN_SPEED = 3.0
-ARROW_MAX_SPEED = 6.0
-ARROW_SPAWN_INTERVAL_INIT = 800
-ARROW_SPAWN_INTERVAL_MIN = 260
-ARROW_SPAWN_ACCEL_EVERY = 12
+
+# 🏹 게임 파라미터 (p2의 고유 파라미터, 화살/플레이어 수치는 engine.config에서 가져옴)
 SKILL_METER_MAX = 20 # P2 고유
 SKILL_DURATION_MS = 10000 # P2 고유
-PROX_DIST_1 = 120 # P2 고유
-PROX_DIST_2 = 85 # P2 고유
-PROX_DIST_3 = 55 # P2 고유
 SHOW_HITBOX = False
 
 
-# 🛠️ 헬퍼 함수
-def clamp(v, lo, hi):
-    return max(lo, min(hi, v))
-
-def vec_normalize(x, y):
-    mag = math.hypot(x, y)
-    if mag == 0:
-        return 0, 0
-    return x / mag, y / mag
-
-
 @dataclass
 class SkillState:
     meter: int = 0
@@ -90,230 +62,19 @@ class SkillState:
             self.meter = 0
 
 
-class Player:
-    def __init__(self, x, y, bounds_rect: pygame.Rect):
-        self.x = x
-        self.y = y
-        self.bounds = bounds_rect
-        self.base_r = PLAYER_RADIUS
-        self.small_r = PLAYER_RADIUS_SMALL
-        self.r = self.base_r
-
-    # ... (handle_input, set_small, circle, draw 메서드는 그대로 유지)
-    def handle_input(self):
-        keys = pygame.key.get_pressed()
-        dx = dy = 0
-        if keys[pygame.K_UP]: dy -= 1
-        if keys[pygame.K_DOWN]: dy += 1
-        if keys[pygame.K_LEFT]: dx -= 1
-        if keys[pygame.K_RIGHT]: dx += 1
-        if dx or dy:
-            dx, dy = vec_normalize(dx, dy)
-        self.x += dx * PLAYER_SPEED
-        self.y += dy * PLAYER_SPEED
-        self.x = clamp(self.x, self.bounds.left + self.r, self.bounds.right - self.r)
-        self.y = clamp(self.y, self.bounds.top + self.r, self.bounds.bottom - self.r)
-
-    def set_small(self, small: bool):
-        self.r = self.small_r if small else self.base_r
-        self.x = clamp(self.x, self.bounds.left + self.r, self.bounds.right - self.r)
-        self.y = clamp(self.y, self.bounds.top + self.r, self.bounds.bottom - self.r)
-
-    def circle(self):
-        return pygame.math.Vector2(self.x, self.y), self.r
-
-    def draw(self, surf):
-        pygame.draw.circle(surf, PLAYER_COLOR, (int(self.x), int(self.y)), self.r)
-
-
-class Arrow:
-    def __init__(self, origin, velocity):
-        self.x, self.y = origin
-        vx, vy = vec_normalize(*velocity)
-        base_speed = random.uniform(ARROW_MIN_SPEED, ARROW_MAX_SPEED)
-        self.vx = vx * base_speed
-        self.vy = vy * base_speed
-        self.dirx = vx
-        self.diry = vy
-        self.head_offset = ARROW_LENGTH * 0.55 + ARROW_HEAD_LEN * 0.6
-        self.proximity_level = 0
-        base_angle_deg = math.degrees(math.atan2(self.vy, self.vx))
-        self.image, self.rect, self.shaft_mask, self.head_mask = self._build_surface(base_angle_deg)
-
-    # ... (_build_surface, head_pos, update, draw, offscreen 메서드는 그대로 유지)
-    def _build_surface(self, angle_deg):
-        total_len = ARROW_LENGTH + ARROW_HEAD_LEN + 20
-        surf_w = total_len
-        surf_h = max(ARROW_HEAD_W, ARROW_FEATHER_W) + 30
-        shaft_layer = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
-        head_layer = pygame.Surface((surf_w, surf_h), pygame.SRCALPHA)
-        cx, cy = 18, surf_h // 2
-        tail_x = cx - 6
-        f1 = [(tail_x, cy), (tail_x - ARROW_FEATHER_LEN, cy - ARROW_FEATHER_W), (tail_x - ARROW_FEATHER_LEN * 0.4, cy - ARROW_FEATHER_W * 0.3)]
-        f2 = [(tail_x, cy), (tail_x - ARROW_FEATHER_LEN, cy + ARROW_FEATHER_W), (tail_x - ARROW_FEATHER_LEN * 0.4, cy + ARROW_FEATHER_W * 0.3)]
-        for pts in (f1, f2):
-            pygame.draw.polygon(shaft_layer, COLOR_FEATHER_OUT, pts)
-            shrink = [(x + (cx - x) * 0.15, y + (cy - y) * 0.15) for x, y in pts]
-            pygame.draw.polygon(shaft_layer, COLOR_FEATHER, shrink)
-        outer_rect = pygame.Rect(cx, cy - ARROW_SHAFT_W // 2 - 1, ARROW_LENGTH, ARROW_SHAFT_W + 2)
-        pygame.draw.rect(shaft_layer, SHAFT_OUTLINE, outer_rect, border_radius=4)
-        main_rect = pygame.Rect(cx, cy - ARROW_SHAFT_W // 2, ARROW_LENGTH, ARROW_SHAFT_W)
-        pygame.draw.rect(shaft_layer, SHAFT_MAIN, main_rect, border_radius=4)
-        inner_rect = pygame.Rect(cx, cy - ARROW_SHAFT_W // 4, ARROW_LENGTH, ARROW_SHAFT_W // 2)
-        pygame.draw.rect(shaft_layer, SHAFT_CORE, inner_rect, border_radius=3)
-        tip_x = cx + ARROW_LENGTH
-        half_w = ARROW_HEAD_W // 2
-        outline_pts = [(tip_x + 3, cy), (tip_x - ARROW_HEAD_LEN, cy - half_w - 2), (tip_x - ARROW_HEAD_LEN, cy + half_w + 2)]
-        inner_pts = [(tip_x + 1, cy), (tip_x - ARROW_HEAD_LEN + 4, cy - half_w + 1), (tip_x - ARROW_HEAD_LEN + 4, cy + half_w - 1)]
-        pygame.draw.polygon(head_layer, HEAD_OUTLINE, outline_pts)
-        pygame.draw.polygon(head_layer, HEAD_MAIN, inner_pts)
-        shaft_img = pygame.transform.rotate(shaft_layer, -angle_deg)
-        head_img = pygame.transform.rotate(head_layer, -angle_deg)
-        final_w = max(shaft_img.get_width(), head_img.get_width())
-        final_h = max(shaft_img.get_height(), head_img.get_height())
-        final_img = pygame.Surface((final_w, final_h), pygame.SRCALPHA)
-        shaft_rect = shaft_img.get_rect(center=(final_w // 2, final_h // 2))
-        head_rect = head_img.get_rect(center=(final_w // 2, final_h // 2))
-        final_img.blit(shaft_img, shaft_rect)
-        final_img.blit(head_img, head_rect)
-        shaft_mask = pygame.mask.from_surface(shaft_img)
-        head_mask = pygame.mask.from_surface(head_img)
-        rect = final_img.get_rect(center=(int(self.x), int(self.y)))
-        return final_img, rect, shaft_mask, head_mask
-
-    def head_pos(self):
-        return (
-            self.x + self.dirx * self.head_offset,
-            self.y + self.diry * self.head_offset
-        )
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.rect.center = (int(self.x), int(self.y))
-
-    def draw(self, surf):
-        surf.blit(self.image, self.rect)
-        if SHOW_HITBOX:
-            pygame.draw.rect(surf, (80, 180, 90), self.rect, 1)
-
-    def offscreen(self, play_rect: pygame.Rect):
-        pad = 120
-        return (self.x < play_rect.left - pad or self.x > play_rect.right + pad or
-                self.y < play_rect.top - pad or self.y > play_rect.bottom + pad)
-
-    def check_hit_and_proximity(self, player_pos, player_radius, now_ms):
-        px, py = int(player_pos[0]), int(player_pos[1])
-        rpad = player_radius + 4
-        p_surf = pygame.Surface((rpad * 2, rpad * 2), pygame.SRCALPHA)
-        pygame.draw.circle(p_surf, (255, 255, 255), (rpad, rpad), player_radius)
-        p_mask = pygame.mask.from_surface(p_surf)
-        p_rect = p_surf.get_rect(center=(px, py))
-
-        # 1. 화살촉 (Head) 충돌 검사
-        offset_head = (p_rect.left - self.rect.left, p_rect.top - self.rect.top)
-        if self.head_mask.overlap(p_mask, offset_head):
-            return True, 0  # Game Over
-
-        # 2. 화살대 (Shaft) 충돌 검사 (추가된 부분)
-        offset_shaft = (p_rect.left - self.rect.left, p_rect.top - self.rect.top)
-        if self.shaft_mask.overlap(p_mask, offset_shaft):
-            return True, 0  # Game Over
-
-        # 3. 근접 거리 측정 (점수 획득 로직은 그대로 유지)
-        hx, hy = self.head_pos()
-        dist = math.hypot(hx - px, hy - py)
-
-        new_level = 0
-        if dist <= PROX_DIST_3:
-            new_level = 3
-        elif dist <= PROX_DIST_2:
-            new_level = 2
-        elif dist <= PROX_DIST_1:
-            new_level = 1
-
-        gained = 0
-        if new_level > self.proximity_level:
-            gained = new_level - self.proximity_level
-            self.proximity_level = new_level
-
-        return False, gained
-
-
-class SlashEffect:
-    # ... (SlashEffect 클래스는 p1.py와 동일)
-    def __init__(self, pos):
-        self.x, self.y = pos
-        self.life = 10
-        self.max_life = 10
-        self.size = 22
-        self.angle = random.uniform(-20, 20)
-
-    @property
-    def alive(self):
-        return self.life > 0
-
-    def update(self):
-        self.life -= 1
-        self.size += 2
-
-    def draw(self, surf):
-        if self.life <= 0:
-            return
-        alpha = int(255 * (self.life / self.max_life))
-        color = (255, 250, 240, alpha)
-        length = self.size
-        thickness = 3
-
-        temp = pygame.Surface((length * 2, length * 2), pygame.SRCALPHA)
-        cx, cy = length, length
-
-        pygame.draw.line(temp, color, (cx - length // 2, cy - length // 2),
-                         (cx + length // 2, cy + length // 2), thickness)
-        pygame.draw.line(temp, color, (cx - length // 2, cy + length // 2),
-                         (cx + length // 2, cy - length // 2), thickness)
-
-        temp = pygame.transform.rotate(temp, self.angle)
-        rect = temp.get_rect(center=(int(self.x), int(self.y)))
-        surf.blit(temp, rect)
-
-
-class Spawner:
-    # ... (Spawner 클래스는 p1.py와 동일)
-    def __init__(self, play_rect: pygame.Rect):
-        self.interval = ARROW_SPAWN_INTERVAL_INIT
-        self.spawned = 0
-        self.last_spawn = 0
-        self.play_rect = play_rect
-
-    def maybe_spawn(self, now_ms, target_pos):
-        if now_ms - self.last_spawn < self.interval:
-            return None
-        self.last_spawn = now_ms
-        self.spawned += 1
-        if self.spawned % ARROW_SPAWN_ACCEL_EVERY == 0:
-            self.interval = max(ARROW_SPAWN_INTERVAL_MIN, int(self.interval * 0.9))
-
-        pr = self.play_rect
-        margin = 20
-        edge = random.randint(0, 3)
-
-        if edge == 0:
-            x = random.randint(pr.left, pr.right)
-            y = pr.top - margin
-        elif edge == 1:
-            x = random.randint(pr.left, pr.right)
-            y = pr.bottom + margin
-        elif edge == 2:
-            x = pr.left - margin
-            y = random.randint(pr.top, pr.bottom)
-        else:
-            x = pr.right + margin
-            y = random.randint(pr.top, pr.bottom)
-
-        tx = target_pos[0] + random.uniform(-80, 80)
-        ty = target_pos[1] + random.uniform(-80, 80)
-        return Arrow((x, y), (tx - x, ty - y))
+def read_move(keys):
+    dx = dy = 0
+    if keys[pygame.K_UP]: dy -= 1
+    if keys[pygame.K_DOWN]: dy += 1
+    if keys[pygame.K_LEFT]: dx -= 1
+    if keys[pygame.K_RIGHT]: dx += 1
+    return dx, dy
+
+
+def draw_player(surf, player):
+    pygame.draw.circle(surf, PLAYER_COLOR, (int(player.x), int(player.y)), player.r)
+    if player.r == player.small_r:
+        pygame.draw.circle(surf, (255, 255, 255), (int(player.x), int(player.y)), player.r, 2)
 
 
 # 🎨 HUD 그리기 함수 수정: W, H_HUD 인수를 받도록 변경하여 유연성 확보
@@ -361,10 +122,10 @@ def main():
 
     running_global = True
     while running_global:
-        player = Player(play_rect.centerx, play_rect.centery, play_rect)
+        player = Player(play_rect.centerx, play_rect.centery, play_rect, "2P")
         arrows = []
         effects = []
-        spawner = Spawner(play_rect)
+        spawner = Spawner(play_rect, start_ms=pygame.time.get_ticks())
         score = 0
         skill = SkillState()
 
@@ -399,11 +160,10 @@ def main():
                 small_active = False
                 player.set_small(False)
 
-            spawn = spawner.maybe_spawn(now, (player.x, player.y))
-            if spawn:
-                arrows.append(spawn)
+            # 혼자 하는 모드라 목표 목록에 이 플레이어 하나만 넣음
+            arrows.extend(spawner.spawn_due(now, [(player.x, player.y)]))
 
-            player.handle_input()
+            player.move(*read_move(pygame.key.get_pressed()))
             for a in arrows:
                 a.update()
 
@@ -415,7 +175,7 @@ def main():
             gained = 0
 
             for a in arrows:
-                hit, plus = a.check_hit_and_proximity(player_pos, player_r, now)
+                hit, plus, _ = a.check_collision(player_pos, player_r, now, RULE_DODGE, (player.x0, player.y0))
                 if hit:
                     dead = True
                     break
@@ -425,7 +185,7 @@ def main():
                 score += gained
                 # skill.add 호출 시 who 전달
                 skill.add(gained, who="2P") 
-                effects.append(SlashEffect((player_pos.x, player_pos.y)))
+                effects.append(SlashEffect(player_pos))
 
             arrows = [a for a in arrows if not a.offscreen(play_rect)]
 
@@ -434,10 +194,10 @@ def main():
             pygame.draw.rect(screen, FRAME_COLOR, play_rect, 2)
 
             for a in arrows:
-                a.draw(screen)
+                draw_arrow(screen, a, SHOW_HITBOX)
             for ef in effects:
-                ef.draw(screen)
-            player.draw(screen)
+                draw_effect(screen, ef)
+            draw_player(screen, player)
 
             remain_ms = max(0, small_end_time - now) if small_active else 0
             # draw_hud 호출 시 W, HUD_H 전달
@@ -0,0 +1,26 @@
+"""순위표가 설정한 폴더 안에만 쓰고, 끄면 파일을 안 만드는지"""
+import os
+
+from engine.leaderboard import DB_NAME, Leaderboard, make_row
+
+
+def test_writes_under_directory(tmp_path):
+    directory = tmp_path / "board"
+    board = Leaderboard(str(directory), top_n=2)
+    for s1, s2 in ((3, 4), (10, 1), (0, 2)):
+        board.submit(make_row(s1, s2, False, 1000, "1P"))
+    board.close()
+    assert os.listdir(tmp_path) == ["board"]
+    assert board.path == str(directory / DB_NAME) and os.path.exists(board.path)
+    reopened = Leaderboard(str(directory), top_n=2)
+    reopened.close()
+    assert [r[0] for r in reopened.top_scores()] == [11, 7]
+
+
+def test_disabled_creates_nothing(tmp_path):
+    directory = tmp_path / "board"
+    board = Leaderboard(str(directory), enabled=False)
+    board.submit(make_row(5, 5, True, 1000, ""))
+    assert board.top_scores() == []
+    board.close()
+    assert board.path is None and not directory.exists()
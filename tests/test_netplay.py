@@ -0,0 +1,10 @@
+"""한 기계에서 두 롤백 세션을 돌리면 (지연, 패킷 손실이 있어도) 끝난 상태가 같은지"""
+from engine import netplay
+
+
+def test_loopback_ends_in_sync():
+    assert netplay.run_loopback(ticks=600, latency=3, drop=0.05, seed=1)
+
+
+def test_loopback_in_sync_with_heavy_loss():
+    assert netplay.run_loopback(ticks=600, latency=6, drop=0.3, seed=2)
@@ -0,0 +1,70 @@
+"""리플레이에서 찾아간 상태가 처음부터 그대로 돌린 상태와 같은지"""
+import random
+
+from engine import rules
+from engine.config import F_H, F_W, FPS
+from engine.replay import Replay, ReplayWriter, pack_state, unpack_state
+from engine.state import Layout, PlayState
+
+LAYOUT = Layout.for_window(F_W, F_H)
+
+
+def record(directory, ticks, seed=0):
+    """라운드가 끝나면 다음 seed로 이어서 기록. 틱마다 (계산 직전) pack_state 바이트를 돌려줌"""
+    writer = ReplayWriter(directory, keyframe_every=64)
+    rng = random.Random(seed)
+    held = [(0, 0, False), (0, 0, False)]
+    round_no, round_tick = 0, 0
+    state = PlayState(LAYOUT, 0, seed=seed)
+    expected = []
+    for tick in range(ticks):
+        if state.game_over or state.game_won:
+            round_no += 1
+            round_tick = 0
+            state = PlayState(LAYOUT, 0, seed=seed + round_no)
+        round_tick += 1
+        now = round_tick * 1000 // FPS
+        for who in range(2):
+            if rng.random() < 0.1:
+                held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.02)
+        expected.append(pack_state(state))
+        writer.record(tick, round_no, LAYOUT, state, None, now, 1000 // FPS, tuple(held))
+        rules.step(state, tuple(held), now)
+    writer.close()
+    return writer.path, expected
+
+
+def test_seek_matches_straight_run(tmp_path):
+    path, expected = record(str(tmp_path), 3000)
+    replay = Replay(path)
+    try:
+        assert replay.first_tick == 0
+        # 키프레임 바로 위, 블록 가운데, 마지막 틱, 그리고 무작위 틱 몇 개
+        ticks = {0, 63, 64, 65, 1000, len(expected) - 1}
+        ticks.update(random.Random(3).sample(range(len(expected)), 20))
+        for tick in sorted(ticks):
+            _, _, _, state = replay.seek(tick)
+            assert pack_state(state) == expected[tick], tick
+    finally:
+        replay.close()
+
+
+def test_keyframe_round_trip_while_skill_active():
+    state = PlayState(LAYOUT, 0, seed=4)
+    for p in state.players:
+        p.x0, p.y0 = p.x, p.y
+    for skill in state.skills:
+        skill.ready = True
+    # 틱 길이를 정해 돌릴 때처럼 시각이 정수가 아님 (1000 / FPS 단위). 끝나는 시각은 정수 ms로 저장됨
+    rules.step(state, ((0, 0, False), (0, 0, False)), 1000 / FPS)
+    rules.step(state, ((0, 0, True), (0, 0, True)), 2000 / FPS)
+    assert state.slow_active and state.small_active
+    assert isinstance(state.slow_end_time, int) and isinstance(state.small_end_time, int)
+    copy = unpack_state(pack_state(state), LAYOUT)
+    # 스킬이 끝나는 틱까지 키프레임에서 복원한 쪽도 똑같이 가야 함
+    tick = 2
+    while state.slow_active or state.small_active:
+        tick += 1
+        for s in (state, copy):
+            rules.step(s, ((0, 0, False), (0, 0, False)), tick * 1000 / FPS)
+        assert pack_state(copy) == pack_state(state), tick
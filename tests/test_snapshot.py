@@ -0,0 +1,79 @@
+"""snapshot -> step -> restore 하면 사본을 찍을 때 상태로 돌아가고, 같은 입력이면 같은 길을 다시 가는지"""
+import random
+
+from engine import rules
+from engine.config import F_H, F_W, FPS
+from engine.replay import pack_state
+from engine.state import Layout, PlayState
+
+LAYOUT = Layout.for_window(F_W, F_H)
+
+
+def inputs_for(seed, ticks):
+    rng = random.Random(seed)
+    held = [(0, 0, False), (0, 0, False)]
+    out = []
+    for _ in range(ticks):
+        for who in range(2):
+            if rng.random() < 0.1:
+                held[who] = (rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.05)
+        out.append(tuple(held))
+    return out
+
+
+def run(state, inputs, first_tick):
+    """first_tick부터 inputs만큼 진행하고 틱마다 pack_state 바이트를 돌려줌"""
+    trace = []
+    for i, inp in enumerate(inputs):
+        rules.step(state, inp, (first_tick + i) * 1000 // FPS)
+        trace.append(pack_state(state))
+        if state.game_over or state.game_won:
+            break
+    return trace
+
+
+def test_restore_round_trip():
+    for seed in range(5):
+        state = PlayState(LAYOUT, 0, seed=seed)
+        inputs = inputs_for(seed, 600)
+        run(state, inputs[:300], 1)
+        snap = state.snapshot()
+        before = pack_state(state)
+
+        first = run(state, inputs[300:], 301)
+        state.restore(snap)
+        assert pack_state(state) == before, seed
+        # 같은 사본으로 두 번 되돌려도 됨 (롤백은 한 사본에서 여러 번 다시 계산함)
+        assert run(state, inputs[300:], 301) == first, seed
+        state.restore(snap)
+        assert run(state, inputs[300:], 301) == first, seed
+
+
+def test_reset_matches_new_state():
+    state = PlayState(LAYOUT, 0, seed=1)
+    run(state, inputs_for(1, 400), 1)
+    state.reset(0, seed=7)
+    assert pack_state(state) == pack_state(PlayState(LAYOUT, 0, seed=7))
+    inputs = inputs_for(7, 300)
+    assert run(state, inputs, 1) == run(PlayState(LAYOUT, 0, seed=7), inputs, 1)
+
+
+def test_checkpoint_saved_after_death_keeps_previous():
+    from engine.game import restore_checkpoint, save_checkpoint
+
+    state = PlayState(LAYOUT, 0, seed=2)
+    checkpoint = save_checkpoint(state, None, 0)
+    inputs = inputs_for(2, 3600)
+    trace = run(state, inputs, 1)
+    assert state.game_over
+    dead_at = len(trace)
+    # 죽은 다음 프레임에 누른 F5는 무시됨
+    assert save_checkpoint(state, checkpoint, dead_at * 1000 // FPS) is checkpoint
+
+    offset = restore_checkpoint(state, checkpoint, dead_at * 1000 // FPS)
+    assert offset == dead_at * 1000 // FPS
+    assert not state.game_over
+    # 되돌린 뒤 같은 입력이면 같은 곳에서 다시 죽고, 다시 되돌릴 수 있음
+    assert run(state, inputs, 1) == trace
+    restore_checkpoint(state, checkpoint, 0)
+    assert not state.game_over
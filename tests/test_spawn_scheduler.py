@@ -0,0 +1,59 @@
+"""타이머 휠 스포너가 예전 스포너(간격이 지나면 한 발, accel_every발마다 간격 감소)와 같은 순서로 쏘는지"""
+import random
+
+from engine.spawn_scheduler import SpawnPattern, SpawnScheduler, TimerWheel
+
+BOUNDS = (0, 50, 800, 600)
+DIVIDERS = (400,)
+SINGLE_ONLY = (SpawnPattern("single", 1, 0, 1, 0, 0, 0),)
+
+
+def old_spawn_times(until_ms, interval, interval_min, accel_every, decay):
+    """예전 Spawner.maybe_spawn 규칙을 1ms 틱으로 돌린 발사 시각"""
+    times = []
+    last = 0
+    for now in range(until_ms + 1):
+        if now - last < interval:
+            continue
+        last = now
+        times.append(now)
+        if len(times) % accel_every == 0:
+            interval = max(interval_min, int(interval * decay))
+    return times
+
+
+def spawn_times(scheduler, until_ms, step_ms):
+    out = []
+    for now in range(step_ms, until_ms + step_ms, step_ms):
+        out.extend(scheduler.due(min(now, until_ms)))
+    return out
+
+
+def test_single_pattern_matches_old_spawner():
+    # 간격이 모두 슬롯(10ms)의 배수가 되게 골라서 슬롯 반올림 없이 시각까지 같아야 함
+    for seed in range(3):
+        scheduler = SpawnScheduler(BOUNDS, DIVIDERS, 800, 100, 5, table=SINGLE_ONLY,
+                                   rng=random.Random(seed), interval_decay=0.5)
+        fired = spawn_times(scheduler, 20000, 16)
+        assert [t for t, _ in fired] == old_spawn_times(20000, 800, 100, 5, 0.5)
+
+
+def test_same_order_for_any_tick_size():
+    runs = []
+    for step_ms in (1, 16, 33, 250, 20000):
+        scheduler = SpawnScheduler(BOUNDS, DIVIDERS, 800, 260, 12, rng=random.Random(4))
+        runs.append(spawn_times(scheduler, 20000, step_ms))
+    assert len(runs[0]) > 24   # burst/fan/wave까지 풀리도록
+    assert all(r == runs[0] for r in runs)
+    times = [t for t, _ in runs[0]]
+    assert times == sorted(times)
+
+
+def test_wheel_fires_in_time_order_across_laps():
+    wheel = TimerWheel(slot_ms=10, slots=8)
+    # 휠 한 바퀴(80ms)를 넘는 예약과 같은 슬롯 번호의 다음 바퀴 예약을 섞음
+    for at, name in ((250, "c"), (15, "a"), (95, "b"), (175, "b2"), (15, "a2")):
+        wheel.schedule(at, name)
+    assert list(wheel.advance(100)) == [(10, "a"), (10, "a2"), (90, "b")]
+    assert list(wheel.advance(300)) == [(170, "b2"), (250, "c")]
+    assert wheel.pending == 0
@@ -0,0 +1,74 @@
+"""관전 화면의 화살 위치가 게임 쪽과 같은지 (슬로우가 켜지고 꺼질 때, 되감기, 여러 틱을 한 번에 보낼 때)"""
+import random
+import time
+
+from engine import rules
+from engine.config import F_H, F_W, FPS
+from engine.spectate import MirrorState, SpectatorClient, SpectatorPublisher
+from engine.state import Layout, PlayState
+
+LAYOUT = Layout.for_window(F_W, F_H)
+NO_INPUT = (0, 0, False)
+
+
+def receive(client, mirror):
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        messages = client.poll()
+        if messages:
+            for msg in messages:
+                mirror.apply(msg)
+            return
+    raise AssertionError("no message")
+
+
+def same_arrows(mirror_arrows, arrows):
+    """위치가 (float32로 보낸 오차 안에서) 같은 화살들인지"""
+    ours = sorted((a.x, a.y) for a in arrows)
+    theirs = sorted((a.x, a.y) for a in mirror_arrows)
+    return len(ours) == len(theirs) and all(abs(x0 - x1) < 0.01 and abs(y0 - y1) < 0.01
+                                            for (x0, y0), (x1, y1) in zip(ours, theirs))
+
+
+def test_mirror_follows_slow_rollback_and_skipped_ticks():
+    publisher = SpectatorPublisher(host="127.0.0.1", port=0, keyframe_every=10 ** 6)
+    client = SpectatorClient(("127.0.0.1", publisher.port))
+    mirror = MirrorState()
+    rng = random.Random(5)
+    slow_changes = rollbacks = 0
+    try:
+        state, tick, history = None, 0, {}
+        for frame in range(3000):
+            if state is None or state.game_over or state.game_won:
+                state, tick, history = PlayState(LAYOUT, 0, seed=frame), 0, {}
+                publisher.new_round()
+            if frame % 37 == 36 and tick > 8:
+                # 넷플레이 되감기처럼 몇 틱 전으로 돌아가서, 이번에는 슬로우를 켠 입력으로 다시 계산
+                # (이미 보낸 화살도 위치가 바뀜)
+                tick -= 6
+                state.restore(history[tick])
+                state.skills[0].ready = True
+                for k in range(6):
+                    history[tick] = state.snapshot()
+                    tick += 1
+                    rules.step(state, ((1, 0, k == 0), NO_INPUT), tick * 1000 // FPS)
+                publisher.resync()
+                rollbacks += 1
+            slow = state.slow_active
+            # 가끔 한 메시지에 여러 틱. 그 도중에 슬로우를 켬
+            steps = 3 if frame % 11 == 10 else 1
+            for k in range(steps):
+                press = steps > 1 and k == 1
+                if press:
+                    state.skills[0].ready = True
+                history[tick] = state.snapshot()
+                tick += 1
+                rules.step(state, ((rng.randint(-1, 1), rng.randint(-1, 1), press), NO_INPUT), tick * 1000 // FPS)
+            slow_changes += state.slow_active != slow
+            publisher.publish(state, LAYOUT, None, tick, tick * 1000 // FPS)
+            receive(client, mirror)
+            assert same_arrows(mirror.state.arrows, state.arrows), frame
+    finally:
+        client.close()
+        publisher.close()
+    assert slow_changes > 5 and rollbacks > 10
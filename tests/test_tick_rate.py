@@ -0,0 +1,43 @@
+"""틱 속도가 달라도 (60Hz / 30Hz / 20Hz / 10Hz) 같은 seed, 같은 입력이면 죽는 사람과 점수가 같은지"""
+import random
+
+from engine import rules
+from engine.config import F_H, F_W, SIM_BASE_FPS
+from engine.state import Layout, PlayState
+
+LAYOUT = Layout.for_window(F_W, F_H)
+INPUT_EVERY = 6   # 입력은 기준 틱 6개(100ms)마다 바뀜. 30 / 20 / 10Hz 틱 경계와 맞음
+
+
+def play(seed, hz, seconds=60):
+    """(라운드가 끝난 기준 틱, 죽은 플레이어, 점수)"""
+    rng = random.Random(seed + 100)
+    state = PlayState(LAYOUT, 0, seed=seed)
+    per = SIM_BASE_FPS // hz
+    scale = rules.tick_scale_for(1000 / hz)
+    held = [(0, 0, False)] * 2
+    for base in range(per, seconds * SIM_BASE_FPS + 1, per):
+        # 이번 틱이 시작하는 기준 틱에서 입력이 바뀜
+        if (base - per) % INPUT_EVERY == 0:
+            held = [(rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.05) for _ in range(2)]
+        rules.step(state, tuple(held), base * 1000 / SIM_BASE_FPS, tick_scale=scale)
+        if state.game_over or state.game_won:
+            break
+    return base, list(state.dead), list(state.scores)
+
+
+def test_same_outcome_at_lower_rates():
+    for hz in (30, 20, 10):
+        per = SIM_BASE_FPS // hz
+        for seed in range(100):
+            end_60, dead_60, scores_60 = play(seed, 60)
+            end_hz, dead_hz, scores_hz = play(seed, hz)
+            assert dead_hz == dead_60, (hz, seed)
+            assert scores_hz == scores_60, (hz, seed)
+            # 긴 틱은 기준 틱 per개씩 가므로 끝나는 틱은 per - 1까지 늦을 수 있음
+            assert 0 <= end_hz - end_60 < per, (hz, seed)
+
+
+def test_tick_scale_for():
+    assert rules.tick_scale_for(1000 / SIM_BASE_FPS) == 1
+    assert rules.tick_scale_for(2000 / SIM_BASE_FPS) == 2